@@ -6,31 +6,42 @@ A comprehensive resume analysis tool with job recommendations and skill assessme
 
 # Core libraries
 import streamlit as st
-import pandas as pd
 import base64
 import random
 import time
 import datetime
 import os
-import nltk
-import joblib
+import re
+
+# Heavy stacks (spaCy, pandas, Gemini SDK, DB drivers) are imported on first use
+from lazy_imports import LazyAttribute, LazyModule
+pd = LazyModule('pandas')
 
 
 # Import custom modules
 from config import Config
-from database import DatabaseManager
-db_manager = DatabaseManager()
+from nltk_resources import ensure_nltk_data
+from database import db_manager  # shared instance; connects on first query
 from api_services import JobAPIService, fetch_internshala_internships
-from resume_parser import ResumeParser
 from styles import StyleManager
 from utils import AnalyticsUtils
-from chat_service import chat_gemini, build_resume_context, check_gemini_health, get_suggested_questions
+from model_registry import registry
+from resume_classifier import predict_top_k
+from job_matching import filter_jobs_by_category
+from job_ranker import rank_jobs
+import semantic_classifier
+import semantic_matching
+chat_gemini = LazyAttribute('chat_service', 'chat_gemini')
+build_resume_context = LazyAttribute('chat_service', 'build_resume_context')
+check_gemini_health = LazyAttribute('chat_service', 'check_gemini_health')
+get_suggested_questions = LazyAttribute('chat_service', 'get_suggested_questions')
 from markdown_it import MarkdownIt
 
 # Initialize Markdown parser
 md_parser = MarkdownIt()
 from streamlit.components.v1 import html as st_html  # legacy; floating chat removed
-from job_scrapers import scrape_all, scrape_internshala, scrape_internshala_by_keywords
+from job_scrapers import iter_internshala_snippets, scrape_internshala, scrape_internshala_by_keywords, scraper_sources
+from job_sources import run_sources
 from Courses import (
     ds_course, web_course, android_course, ios_course, uiux_course,
     ai_course, cyber_course, cloud_course, data_eng_course, blockchain_course
@@ -39,41 +50,50 @@ from Courses import (
 import warnings
 warnings.filterwarnings("ignore", message="coroutine 'expire_cache' was never awaited")
 
+# Health checks only; models are warmed by the first /ready probe or, with WARMUP_ON_START, after the first render
+from warmup import start_background_warmup, start_health_server
+if Config.HEALTH_PORT:
+    start_health_server(Config.HEALTH_PORT)
+
 # -----------------------------
 # ML Model Loading
 # -----------------------------
 
-@st.cache_resource
+def _notify_once(message, level="warning"):
+    """Show a model warning once per session instead of on every rerun"""
+    shown = st.session_state.setdefault("_model_notices", set())
+    if message in shown:
+        return
+    shown.add(message)
+    (st.error if level == "error" else st.warning)(message)
+
+
 def load_resume_classifier():
-    """Load the trained resume classification model (with version compatibility check)"""
+    """Load the trained resume classification model (with version compatibility check).
+    Loaded once per process by model_registry; large arrays are memory-mapped from a shared on-disk copy.
+    """
     import sklearn
 
     try:
-        data = joblib.load("resume_classifier_v2.pkl")
-
-        # Handle both new and old formats safely
-        if isinstance(data, dict) and "model" in data:
-            model = data["model"]
-            trained_version = data.get("sklearn_version", "unknown")
-
-            # Optional warning if sklearn versions differ
-            if trained_version != sklearn.__version__:
-                st.warning(
-                    f"⚠️ Model trained on scikit-learn {trained_version}, "
-                    f"but running on {sklearn.__version__}. Retraining recommended if unexpected issues occur."
-                )
-        else:
-            # fallback for older pickled models (without metadata)
-            model = data
-
+        # Newest compatible artifact of the configured variant from train_classifier.py, else the bundled pickle
+        model, info = registry.get_with_meta('resume_classifier')
+
+        # Optional warning if sklearn versions differ (older bare pickles carry no metadata)
+        trained_version = info.get("sklearn_version")
+        if trained_version and trained_version != sklearn.__version__:
+            _notify_once(
+                f"⚠️ Model trained on scikit-learn {trained_version}, "
+                f"but running on {sklearn.__version__}. Retraining recommended if unexpected issues occur."
+            )
         return model
 
     except FileNotFoundError:
-        st.error("❌ Model file not found. Please ensure 'resume_classifier_v2.pkl' exists in the project directory.")
+        _notify_once("❌ Model file not found. Please ensure 'resume_classifier_v2.pkl' exists in the project directory.",
+                     level="error")
         return None
 
     except Exception as e:
-        st.warning(f"⚠️ Could not load ML model: {e}")
+        _notify_once(f"⚠️ Could not load ML model: {e}")
         return None
 
 
@@ -86,25 +106,23 @@ def predict_resume_category(resume_text, model=None):
         return None, []
     
     try:
-        # Get prediction
-        predicted_category = model.predict([resume_text])[0]
-        
-        # Get probabilities for top 3
-        probabilities = model.predict_proba([resume_text])[0]
-        classes = model.classes_
-        
-        # Get top 3 predictions
-        top_3_idx = probabilities.argsort()[-3:][::-1]
-        top_3_predictions = [
-            {"category": classes[idx], "probability": probabilities[idx]}
-            for idx in top_3_idx
-        ]
-        
+        # One pipeline pass: argmax and top 3 both come from the probability vector
+        predicted_category, top_3_predictions = predict_top_k(model, [resume_text], k=3)[0]
         return predicted_category, top_3_predictions
     except Exception as e:
         st.error(f"Error predicting category: {e}")
         return None, []
 
+def predict_categories(texts, model=None, top_k=3):
+    """Batched variant of predict_resume_category for bulk use.
+    Returns a list of (predicted_category, top_k_predictions), one per text.
+    """
+    if model is None:
+        model = load_resume_classifier()
+    if model is None or not texts:
+        return [(None, []) for _ in (texts or [])]
+    return predict_top_k(model, texts, k=top_k)
+
 def get_courses_by_category(predicted_category):
     """Get relevant courses based on predicted category"""
     category_course_map = {
@@ -168,191 +186,6 @@ def get_courses_by_category(predicted_category):
     return category_course_map.get(predicted_category, fallback_courses)
 
 
-import re
-
-def filter_jobs_by_category(jobs, predicted_category):
-    """
-    Filter and rank jobs based on how relevant they are to the predicted career category.
-    Uses weighted keyword matching (core vs related), fuzzy matching, and adaptive fallback.
-    """
-
-    if not predicted_category or not jobs:
-        return jobs
-
-    # ========== SMART FUZZY MATCHER ==========
-    def keyword_in_text(keyword, text):
-        """Smart matching for plural, hyphen, spacing variations"""
-        pattern = r'\b' + re.escape(keyword).replace(r'\-', '[-\s]?') + r's?\b'
-        return re.search(pattern, text, re.IGNORECASE)
-
-    # ========== CATEGORY KEYWORDS ==========
-    category_keywords = {
-        # --- Core Developer Roles ---
-        'Java Developer': {
-            'core': ['java', 'spring', 'jvm', 'kotlin'],
-            'related': ['backend', 'software', 'developer', 'engineer']
-        },
-        'Python Developer': {
-            'core': ['python', 'django', 'flask'],
-            'related': ['backend', 'software', 'developer', 'ai', 'ml']
-        },
-        'Web Designing': {
-            'core': ['web', 'frontend', 'ui', 'ux', 'html', 'css'],
-            'related': ['react', 'angular', 'vue', 'javascript', 'designer']
-        },
-        'Full Stack Developer': {
-            'core': ['full stack', 'mern', 'mean', 'frontend', 'backend'],
-            'related': ['react', 'node', 'express', 'django', 'api']
-        },
-        'Android Developer': {
-            'core': ['android', 'kotlin', 'java', 'mobile'],
-            'related': ['flutter', 'compose']
-        },
-        'iOS Developer': {
-            'core': ['ios', 'swift', 'swiftui', 'xcode'],
-            'related': ['mobile', 'app', 'developer']
-        },
-
-        # --- Data & AI ---
-        'Data Science': {
-            'core': ['data', 'scientist', 'analytics', 'analysis'],
-            'related': ['machine learning', 'ml', 'ai', 'insight', 'python', 'sql']
-        },
-        'Machine Learning Engineer': {
-            'core': ['machine learning', 'ml', 'ai', 'neural'],
-            'related': ['pytorch', 'tensorflow', 'deep learning']
-        },
-        'AI Engineer': {
-            'core': ['ai', 'artificial intelligence', 'ml', 'deep learning'],
-            'related': ['llm', 'nlp', 'vision', 'transformer']
-        },
-        'Data Engineer': {
-            'core': ['data engineer', 'pipeline', 'etl', 'big data'],
-            'related': ['airflow', 'spark', 'hadoop', 'aws glue', 'kafka']
-        },
-        'Business Analyst': {
-            'core': ['business analyst', 'data', 'requirements', 'insights'],
-            'related': ['excel', 'tableau', 'power bi']
-        },
-
-        # --- Cloud & DevOps ---
-        'DevOps Engineer': {
-            'core': ['devops', 'ci/cd', 'docker', 'kubernetes'],
-            'related': ['aws', 'azure', 'gcp', 'infrastructure', 'terraform']
-        },
-        'Cloud Engineer': {
-            'core': ['cloud', 'aws', 'azure', 'gcp', 'infrastructure'],
-            'related': ['devops', 'serverless', 'kubernetes', 'docker']
-        },
-        'Site Reliability Engineer': {
-            'core': ['sre', 'reliability', 'monitoring'],
-            'related': ['devops', 'cloud', 'automation']
-        },
-
-        # --- Cybersecurity ---
-        'Network Security Engineer': {
-            'core': ['network', 'security', 'cyber'],
-            'related': ['infosec', 'pentesting', 'firewall', 'ethical hacking']
-        },
-        'Cybersecurity Analyst': {
-            'core': ['cybersecurity', 'security analyst', 'threat', 'incident'],
-            'related': ['vulnerability', 'forensics', 'malware', 'siem']
-        },
-        'Ethical Hacker': {
-            'core': ['ethical hacker', 'pentest', 'penetration testing'],
-            'related': ['bug bounty', 'offensive security', 'owasp']
-        },
-
-        # --- Blockchain & Web3 ---
-        'Blockchain Developer': {
-            'core': ['blockchain', 'web3', 'solidity', 'crypto'],
-            'related': ['ethereum', 'smart contract', 'defi']
-        },
-        'Web3 Developer': {
-            'core': ['web3', 'blockchain', 'solidity'],
-            'related': ['dapp', 'nft', 'crypto']
-        },
-
-        # --- UI/UX & Creative ---
-        'UI/UX Designer': {
-            'core': ['ui', 'ux', 'figma', 'design'],
-            'related': ['prototype', 'wireframe', 'adobe', 'user research']
-        },
-
-        # --- Other Tech Roles ---
-        'Database': {
-            'core': ['database', 'dba', 'sql'],
-            'related': ['oracle', 'mongodb', 'mysql', 'postgresql']
-        },
-        'Testing': {
-            'core': ['testing', 'qa', 'quality', 'automation'],
-            'related': ['selenium', 'software', 'engineer']
-        },
-        'SAP Developer': {
-            'core': ['sap', 'erp'],
-            'related': ['developer', 'abap']
-        },
-        'Operations Manager': {
-            'core': ['operations', 'manager'],
-            'related': ['project', 'business', 'process']
-        },
-    }
-
-    # ========== GET CATEGORY KEYWORDS ==========
-    keyword_set = category_keywords.get(predicted_category, {})
-    core_keywords = keyword_set.get('core', [])
-    related_keywords = keyword_set.get('related', [])
-
-    if not core_keywords and not related_keywords:
-        return jobs  # no filtering if unknown category
-
-    # ========== FILTER & SCORE JOBS ==========
-    scored_jobs = []
-
-    for job in jobs:
-        title = (job.get('title', '') or '').lower().replace('-', ' ')
-        description = (job.get('description', '') or '').lower().replace('-', ' ')
-        company = (job.get('company', '') or '').lower()
-        tags = ' '.join(job.get('tags', [])).lower()
-        job_text = f"{title} {description} {company} {tags}"
-
-        title_score, body_score = 0, 0
-
-        # --- Score titles ---
-        for keyword in core_keywords:
-            if keyword_in_text(keyword, title):
-                title_score += 5
-        for keyword in related_keywords:
-            if keyword_in_text(keyword, title):
-                title_score += 2
-
-        # --- Score description, company, tags ---
-        for keyword in core_keywords:
-            if keyword_in_text(keyword, job_text):
-                body_score += 3
-        for keyword in related_keywords:
-            if keyword_in_text(keyword, job_text):
-                body_score += 1
-
-        total_score = title_score + body_score
-
-        has_core = any(keyword_in_text(kw, job_text) for kw in core_keywords)
-        has_strong_title = title_score >= 3
-
-        if has_core or has_strong_title or total_score >= 4:
-            scored_jobs.append((job, total_score))
-
-    # ========== SORT & FALLBACK ==========
-    scored_jobs.sort(key=lambda x: x[1], reverse=True)
-    filtered_jobs = [job for job, score in scored_jobs]
-
-    # If filtering removes too many jobs, fallback to original list
-    if len(filtered_jobs) < max(3, len(jobs) * 0.2):
-        return jobs
-
-    return filtered_jobs if filtered_jobs else jobs
-
-
 # -----------------------------
 # Application Setup
 # -----------------------------
@@ -393,13 +226,8 @@ def initialize_app():
     if "theme_mode" not in st.session_state:
         st.session_state.theme_mode = "light"
     
-    # Ensure NLTK data only once per session
-    if not st.session_state.get("nltk_ready"):
-        nltk.download('stopwords', quiet=True)
-        nltk.download('punkt', quiet=True)
-        nltk.download('wordnet', quiet=True)
-        nltk.download('averaged_perceptron_tagger', quiet=True)
-        st.session_state["nltk_ready"] = True
+    # NLTK corpora are vendored at build time; verified once per process, not per session
+    ensure_nltk_data()
     
     # Apply styles
     StyleManager.apply_global_styles()
@@ -408,10 +236,9 @@ def initialize_app():
     # Apply sidebar chat styles
     st.markdown(StyleManager.get_sidebar_chat_styles(), unsafe_allow_html=True)
 
-@st.cache_resource(show_spinner=False)
 def get_resume_parser():
-    """Get cached resume parser instance"""
-    return ResumeParser()
+    """Get the shared resume parser instance (one per process, see model_registry)"""
+    return registry.get('resume_parser')
 
 @st.cache_data
 def _load_nevera_font():
@@ -633,10 +460,31 @@ def display_skills(categorized_skills):
     html_output += '</div>'
     st.markdown(html_output, unsafe_allow_html=True)
 
+# Fields an internship must match the keywords/skills in to survive the relevance filter
+INTERN_MATCH_FIELDS = {"title": 3.0, "description": 1.0}
+
+
+def _show_source_status(statuses):
+    """Keep the run's SourceStatus per source in session_state and note the sources that failed.
+    Fetchers run on worker threads without a Streamlit context, so problems are rendered here.
+    """
+    st.session_state['job_source_status'] = {name: status.to_dict() for name, status in statuses.items()}
+    slow = [f"{s.source} ({s.status.replace('_', ' ')})" for s in statuses.values() if not s.ok]
+    if slow:
+        st.caption("Showing partial results; unavailable right now: " + ", ".join(slow))
+
+
 def _fetch_all_jobs(skills, user_location):
-    """Fetch and merge Jooble + scraper jobs into a common schema and deduplicate by URL."""
-    jooble_jobs = JobAPIService.fetch_jobs_from_jooble(skills, user_location) or []
-    scraped_jobs = scrape_all(skills, user_location) or []
+    """Fetch and merge Jooble + scraper jobs into a common schema and deduplicate by URL.
+    All sources run concurrently with per-source deadlines; their statuses are kept in
+    st.session_state['job_source_status'].
+    """
+    sources = {"jooble": lambda: JobAPIService.fetch_jobs_from_jooble(skills, user_location)}
+    sources.update(scraper_sources(skills, user_location))
+    results, statuses = run_sources(sources)
+    st.session_state['job_source_status'] = {name: status.to_dict() for name, status in statuses.items()}
+    jooble_jobs = results.pop("jooble") or []
+    scraped_jobs = [j for items in results.values() for j in items]
 
     def map_jooble(j):
         return {
@@ -708,7 +556,6 @@ def _filter_jobs(jobs, query, source):
 
 def display_job_recommendations_dual(skills_list, keywords_text: str, location_text: str, predicted_category=None):
     """Display two sections: Jooble jobs and Internshala internships, fetched concurrently."""
-    from concurrent.futures import ThreadPoolExecutor
     st.markdown(StyleManager.get_job_listing_styles(), unsafe_allow_html=True)
     st.markdown(StyleManager.get_animation_styles(), unsafe_allow_html=True)
 
@@ -766,13 +613,15 @@ def display_job_recommendations_dual(skills_list, keywords_text: str, location_t
     if predicted_category:
         st.info(f"🎯 Searching for **{predicted_category}** internships using keywords: '{query_str}'")
     
-    # Fetch both sources concurrently (Jooble + Internshala scraper)
+    # Fetch both sources concurrently (Jooble + Internshala scraper), each with its own deadline
     with st.spinner("Fetching opportunities..."):
-        with ThreadPoolExecutor(max_workers=2) as ex:
-            f1 = ex.submit(JobAPIService.fetch_jobs_from_jooble, query_skills[:5], jooble_loc or "")
-            f2 = ex.submit(scrape_internshala_by_keywords, query_str or "", (location_text or "India"))
-            jooble_jobs = f1.result() or []
-            internshala_jobs = f2.result() or []
+        results, statuses = run_sources({
+            "jooble": lambda: JobAPIService.fetch_jobs_from_jooble(query_skills[:5], jooble_loc or ""),
+            "internshala": lambda: scrape_internshala_by_keywords(query_str or "", (location_text or "India")),
+        })
+        jooble_jobs = results["jooble"]
+        internshala_jobs = results["internshala"]
+    _show_source_status(statuses)
     
     # Apply ML-based category filtering if available
     if predicted_category:
@@ -782,6 +631,21 @@ def display_job_recommendations_dual(skills_list, keywords_text: str, location_t
         internshala_jobs = filter_jobs_by_category(internshala_jobs, predicted_category)
         st.success(f"✅ Filtered jobs: Jooble {orig_jooble} → {len(jooble_jobs)} | Internshala {orig_intern} → {len(internshala_jobs)}")
 
+    # Order each list by BM25 relevance to the resume skills and predicted category,
+    # blended with resume/job embedding similarity when semantic matching is enabled
+    resume_text = (st.session_state.get('resume_data') or {}).get('raw_text', '')
+    ranked = False
+    if resume_text and semantic_matching.is_enabled():
+        try:
+            jooble_jobs = semantic_matching.rank_jobs_semantic(jooble_jobs, resume_text, query_skills, predicted_category)
+            internshala_jobs = semantic_matching.rank_jobs_semantic(internshala_jobs, resume_text, query_skills, predicted_category)
+            ranked = True
+        except Exception:
+            pass  # Optional; fall back to keyword ranking
+    if not ranked:
+        jooble_jobs = rank_jobs(jooble_jobs, query_skills, predicted_category)
+        internshala_jobs = rank_jobs(internshala_jobs, query_skills, predicted_category)
+
     # If nothing from keywords page, try generic scraper with skills
     if not internshala_jobs:
         try:
@@ -847,160 +711,12 @@ def display_job_recommendations_dual(skills_list, keywords_text: str, location_t
 
     # If user changed inputs, refresh Internshala results accordingly
     def _filter_intern_relevance(items, kw_text: str, resume_skills: list):
-        # Build a keyword set from user-entered keywords + resume skills
-        def norm_terms(text: str) -> list:
-            import re
-            toks = [t.strip().lower() for t in re.split(r"[^a-z0-9\+\.#]+", text or "") if t.strip()]
-            return toks
-        kws = set(norm_terms(kw_text))
-        for s in (resume_skills or [])[:15]:
-            if isinstance(s, str):
-                kws.update(norm_terms(s))
-        if not items or not kws:
-            return items
-        keep = []
-        for j in items:
-            title = (j.get('title') or '').lower()
-            desc = (j.get('description') or '').lower()
-            comp = (j.get('company') or '').lower()
-            loc = (j.get('location') or '').lower()
-            blob = " ".join([title, comp, loc, desc])
-            if any(k in title for k in kws) or any(k in desc for k in kws):
-                keep.append(j)
-        # If filtering removed everything, fall back to original list
-        return keep or items
-
-    def _enrich_internshala_descriptions(items, max_fetch: int = 6):
-        try:
-            import re
-            import json
-            import requests
-            from bs4 import BeautifulSoup
-        except Exception:
-            return items
-        out = []
-        fetched = 0
-        HEADERS_LOCAL = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml"
-        }
-        def clean(txt: str) -> str:
-            t = re.sub(r"\s+", " ", (txt or "").strip())
-            return t
-        def looks_generic(t: str) -> bool:
-            low = t.lower()
-            return (
-                "explore more internships" in low or
-                "top locations" in low or
-                "top categories" in low or
-                low.startswith("find ") or
-                (len(low) < 40)
-            )
-        def bullets_to_line(uls) -> str:
-            bullets = []
-            for ul in uls:
-                for li in ul.select('li'):
-                    s = clean(li.get_text(" ", strip=True))
-                    if s and len(s) > 8:
-                        bullets.append(s)
-                    if len(bullets) >= 2:
-                        break
-                if len(bullets) >= 2:
-                    break
-            return " • ".join(bullets)
-        def extract_role_snippet(soup: 'BeautifulSoup') -> str:
-            # Prefer bullets near headings like "About the internship", "Role Overview", "Responsibilities"
-            heading_patterns = ["about the internship", "role overview", "responsibilities", "what you will do"]
-            for h in soup.select('h1, h2, h3, h4, strong, b'):
-                text = h.get_text(" ", strip=True).lower()
-                if any(p in text for p in heading_patterns):
-                    # look in next siblings for ul/ol
-                    sib = h.find_next_sibling()
-                    uls = []
-                    while sib and len(uls) == 0 and sib.name not in ('h1','h2','h3','h4'):
-                        if sib.name in ('ul','ol'):
-                            uls.append(sib)
-                            break
-                        uls.extend(sib.select('ul,ol'))
-                        sib = sib.find_next_sibling()
-                    if uls:
-                        line = bullets_to_line(uls)
-                        if line and not looks_generic(line):
-                            return line
-            # Fallback: any bullets under known containers
-            uls = soup.select('section#about ul, div#internship_about ul, div.internship_about ul, div.job-description ul, div#job-description ul, div#job-detail ul')
-            line = bullets_to_line(uls)
-            return line
-        for j in items or []:
-            if (not j.get('description')) and isinstance(j.get('url'), str) and j['url'].startswith("https://internshala.com/") and fetched < max_fetch:
-                try:
-                    r = requests.get(j['url'], headers=HEADERS_LOCAL, timeout=10)
-                    if r.status_code == 200:
-                        soup = BeautifulSoup(r.text, 'lxml')
-                        text = None
-                        # Try structured extraction first
-                        line = extract_role_snippet(soup)
-                        if line and not looks_generic(line):
-                            text = line
-                        # meta descriptions
-                        if not text:
-                            md = soup.select_one('meta[name="description"]')
-                            if md and md.get('content'):
-                                cand = clean(md['content'])
-                                if cand and not looks_generic(cand):
-                                    text = cand
-                        if not text:
-                            md = soup.select_one('meta[property="og:description"]')
-                            if md and md.get('content'):
-                                cand = clean(md['content'])
-                                if cand and not looks_generic(cand):
-                                    text = cand
-                        # JSON-LD
-                        if not text:
-                            for s in soup.select('script[type="application/ld+json"]'):
-                                try:
-                                    data = json.loads(s.get_text(strip=True))
-                                    def _pick(d):
-                                        desc = d.get('description')
-                                        if desc:
-                                            cand = BeautifulSoup(desc, 'lxml').get_text(" ", strip=True)
-                                            cand = clean(cand)
-                                            if cand and not looks_generic(cand):
-                                                return cand
-                                    if isinstance(data, dict) and data.get('@type') in ("JobPosting","Internship"):
-                                        cand = _pick(data)
-                                        if cand:
-                                            text = cand; break
-                                    if isinstance(data, list):
-                                        for d in data:
-                                            if isinstance(d, dict) and d.get('@type') in ("JobPosting","Internship"):
-                                                cand = _pick(d)
-                                                if cand:
-                                                    text = cand; break
-                                        if text:
-                                            break
-                                except Exception:
-                                    continue
-                        # Narrow DOM fallback
-                        if not text:
-                            sel_list = [
-                                'section#about', 'div#about_company', 'div#internship_about', 'div.internship_about',
-                                'div#job-detail', 'div#job-description', 'div.job-description', 'div#jd', 'section#jd'
-                            ]
-                            for sel in sel_list:
-                                el = soup.select_one(sel)
-                                if el:
-                                    cand = clean(el.get_text(" ", strip=True))
-                                    if cand and not looks_generic(cand):
-                                        text = cand
-                                        break
-                        if text:
-                            j['description'] = (text[:200] + '...') if len(text) > 200 else text
-                            fetched += 1
-                except Exception:
-                    pass
-            out.append(j)
-        return out
+        # Keep internships whose title or description matches the entered keywords or resume skills
+        # (if nothing matches, fall back to the original list); the category only affects the order
+        skills_q = (resume_skills or [])[:15]
+        kept = rank_jobs(items, skills_q, None, extra_text=kw_text or "",
+                         field_weights=INTERN_MATCH_FIELDS, drop_unmatched=True)
+        return rank_jobs(kept, skills_q, predicted_category, extra_text=kw_text or "")
 
     if intern_btn and (intern_kw is not None or intern_loc is not None):
         try:
@@ -1009,12 +725,18 @@ def display_job_recommendations_dual(skills_list, keywords_text: str, location_t
         except Exception:
             internshala_jobs = internshala_jobs
 
-    # Apply relevance filter and enrich summaries
+    # Apply relevance filter
     internshala_jobs = _filter_intern_relevance(internshala_jobs, intern_kw or query_str, skills_list)
-    internshala_jobs = _enrich_internshala_descriptions(internshala_jobs)
     if internshala_jobs:
+        # Cards render right away; missing summaries are filled in as their detail pages arrive
+        description_slots = {}
         for i, job in enumerate(internshala_jobs[:10]):
             display_job_card(job, "internshala")
+            slot = st.empty()
+            if job.get('description'):
+                _show_job_description(slot, job['description'])
+            elif isinstance(job.get('url'), str):
+                description_slots.setdefault(job['url'], []).append((slot, job))
             # If we have a relative link path, prefer the explicit Apply Here link format
             href = job.get('url', '#')
             if href:
@@ -1025,9 +747,20 @@ def display_job_recommendations_dual(skills_list, keywords_text: str, location_t
                     st.markdown(f"[Apply Here]({href})", unsafe_allow_html=True)
             if i < min(10, len(internshala_jobs)) - 1:
                 st.markdown('<div class="separator"></div>', unsafe_allow_html=True)
+        for url, snippet in iter_internshala_snippets(description_slots):
+            for slot, job in description_slots[url]:
+                job['description'] = snippet
+                _show_job_description(slot, snippet)
     else:
         st.info("No internships found for your skills in this region.")
 
+def _show_job_description(slot, text):
+    """Render a short job summary into a card's placeholder"""
+    import html
+    if text:
+        text = (text[:200] + '...') if len(text) > 200 else text
+        slot.markdown(f'<div class="job-description">{html.escape(text)}</div>', unsafe_allow_html=True)
+
 def display_job_recommendations(skills, location):
     """Legacy API-only recommendations (kept for compatibility)."""
     st.markdown(StyleManager.get_job_listing_styles(), unsafe_allow_html=True)
@@ -1059,7 +792,13 @@ def display_job_recommendations(skills, location):
         </div>
     """, unsafe_allow_html=True)
     
-    jooble_jobs = JobAPIService.fetch_jobs_from_jooble(skills, location)
+    query = ", ".join([s for s in (skills or []) if s])
+    results, statuses = run_sources({
+        "jooble": lambda: JobAPIService.fetch_jobs_from_jooble(skills, location),
+        "internshala_api": lambda: fetch_internshala_internships(query, location or "India"),
+    })
+    _show_source_status(statuses)
+    jooble_jobs = results["jooble"]
     
     if jooble_jobs:
         for i, job in enumerate(jooble_jobs[:10]):
@@ -1083,7 +822,7 @@ def display_job_recommendations(skills, location):
         </div>
     """, unsafe_allow_html=True)
 
-    insh_raw = fetch_internshala_internships(", ".join([s for s in (skills or []) if s]), location or "India") or []
+    insh_raw = results["internshala_api"]
     if insh_raw:
         norm = []
         for it in insh_raw[:10]:
@@ -2236,6 +1975,16 @@ def main():
                             except Exception as e:
                                 pass  # Silent fail - prediction is optional
                                 # st.error(f"❌ ML prediction failed: {e}")
+                            # Optional semantic predictor (also warms the cached resume embedding)
+                            if Config.ENABLE_SEMANTIC_CLASSIFIER and semantic_classifier.is_available():
+                                try:
+                                    sem_cat, sem_top_3 = semantic_classifier.predict_semantic_top_k(resume_text)
+                                    resume_data['semantic_top_3_categories'] = sem_top_3
+                                    if sem_cat and not resume_data.get('predicted_category'):
+                                        resume_data['predicted_category'] = sem_cat
+                                        resume_data['top_3_categories'] = sem_top_3
+                                except Exception:
+                                    pass  # Optional as well
                         
                         st.session_state['resume_id'] = current_resume_id
                         st.session_state['resume_path'] = save_path
@@ -2284,8 +2033,15 @@ def main():
                 """, unsafe_allow_html=True)
                 
                 # Default role is auto-detect
-                _resume_for_score = dict(resume_data)
-                breakdown = AnalyticsUtils.calculate_resume_score_breakdown(_resume_for_score)
+                # Score once per resume; on reruns only re-derive the time-dependent recency part
+                _score_key = st.session_state.get('resume_id')
+                cached_score = st.session_state.get('score_breakdown')
+                if cached_score and cached_score.get('resume_id') == _score_key:
+                    breakdown = AnalyticsUtils.refresh_time_features(cached_score['breakdown'])
+                else:
+                    _resume_for_score = dict(resume_data)
+                    breakdown = AnalyticsUtils.calculate_resume_score_breakdown(_resume_for_score)
+                st.session_state['score_breakdown'] = {'resume_id': _score_key, 'breakdown': breakdown}
                 score = breakdown.get("total", 0)
                 components = breakdown.get("components", {})
                 sections_presence = components.get('sections_presence') or {}
@@ -3810,5 +3566,9 @@ def main():
                 </footer> 
                 """,unsafe_allow_html=True)
 
+    # Opt-in: warm the remaining models once the first page is out (no-op after the first call)
+    if Config.WARMUP_ON_START:
+        start_background_warmup()
+
 if __name__ == "__main__":
     main()
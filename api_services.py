@@ -1,48 +1,67 @@
 # API services module for job recommendations
-import requests
 import json
-import streamlit as st
+import time
 import os
 from typing import List, Dict, Optional
 from urllib.parse import urlencode, quote
 from config import Config
+import http_fetch
+from query_cache import indexed, search_cache, search_key
+from job_sources import note, note_exception
+
+JOOBLE_PAGES = (1, 2)
+
 
 class JobAPIService:
     """Handles job API integrations"""
     
     @staticmethod
     def fetch_jobs_from_jooble(skills: List[str], location: str = "") -> Optional[List[Dict]]:
-        """Fetch jobs from Jooble API"""
+        """Fetch jobs from Jooble API.
+        Each result page is cached per (keywords, location, page) in query_cache.search_cache;
+        stale pages are served immediately and refreshed in the background.
+        """
         url = f"https://jooble.org/api/{Config.JOOBLE_API_KEY}"
         
         # Combine all skills into a single search query
         keywords = ", ".join([s for s in (skills or []) if s])
         
         headers = {"Content-Type": "application/json"}
+
+        def _request(pg: int) -> Dict:
+            payload = {"keywords": keywords, "location": location or "", "page": pg}
+            return {"method": "POST", "url": url, "headers": headers, "data": json.dumps(payload)}
+
+        def _fetch_page(pg: int) -> List[Dict]:
+            response = http_fetch.engine.fetch(**_request(pg))
+            return response.json().get("jobs", []) if response.status_code == 200 else []
         
         try:
-            all_jobs: List[Dict] = []
-            # Fetch first two pages to ensure enough results (Jooble paginates)
-            for pg in (1, 2):
-                payload = {
-                    "keywords": keywords,
-                    "location": location or "",
-                    "page": pg
-                }
-                response = requests.post(url, headers=headers, data=json.dumps(payload), timeout=10)
-                if response.status_code != 200:
-                    continue
-                page_jobs = response.json().get("jobs", [])
-                if page_jobs:
-                    all_jobs.extend(page_jobs)
+            # First two pages to ensure enough results (Jooble paginates)
+            keys = {pg: search_key("jooble", keywords, location, pg) for pg in JOOBLE_PAGES}
+            page_jobs = {pg: search_cache.get(keys[pg], "jooble", lambda pg=pg: _fetch_page(pg)) for pg in JOOBLE_PAGES}
+            missing = [pg for pg in JOOBLE_PAGES if page_jobs[pg] is None]
+            if missing:
+                # Uncached pages are fetched concurrently
+                responses = http_fetch.fetch_many([_request(pg) for pg in missing])
+                if len(missing) == len(JOOBLE_PAGES) and all(isinstance(r, Exception) for r in responses):
+                    raise responses[0]
+                for pg, response in zip(missing, responses):
+                    if isinstance(response, Exception):
+                        note_exception(response)
+                        continue
+                    if response.status_code != 200:
+                        note('http_error', f"HTTP {response.status_code} from Jooble")
+                        continue
+                    page_jobs[pg] = response.json().get("jobs", [])
+                    search_cache.put(keys[pg], "jooble", page_jobs[pg])
+            all_jobs = [job for pg in JOOBLE_PAGES for job in (page_jobs[pg] or [])]
             jobs = all_jobs[:10]
             return jobs if jobs else None
         
-        except requests.exceptions.RequestException as e:
-            st.error(f"Jooble API request failed: {e}")
-            return None
         except Exception as e:
-            st.error(f"Unexpected error with Jooble API: {e}")
+            # Runs on a run_sources worker thread: report through the source status, not st.*
+            note_exception(e)
             return None
 
     @staticmethod
@@ -65,7 +84,73 @@ class YouTubeService:
         except Exception as e:
             return f"Error fetching video: {e}"
 
+INTERNSHALA_SEARCH_URL = "https://internshala.com/api/internships/search"
+INTERNSHALA_API_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Language": "en-US,en;q=0.9",
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Referer": "https://internshala.com/"
+}
+INTERNSHALA_FALLBACK_KEYWORDS = [
+    "software development", "web development", "frontend", "backend",
+    "python", "java", "data analyst", "data science", "machine learning",
+    "android", "ios", "ui ux", "product management", "qa testing"
+]
+INTERNSHALA_TARGET = 10
+
+
+def _internshala_request(q: str, loc: str) -> Dict:
+    q_enc = quote((q or "").strip())
+    loc_enc = quote((loc or "India").strip())
+    return {
+        "url": f"{INTERNSHALA_SEARCH_URL}?keywords={q_enc}&location={loc_enc}",
+        "headers": INTERNSHALA_API_HEADERS,
+    }
+
+
+def _internshala_items(r) -> Optional[List[Dict]]:
+    """Listings from one search response, or None for an error/empty response"""
+    if isinstance(r, Exception) or r is None or r.status_code != 200:
+        return None
+    try:
+        data = r.json()
+    except Exception:
+        return None
+    if isinstance(data, dict):
+        data = data.get('internships') or data.get('data') or data.get('results') or data
+    if not isinstance(data, list):
+        return None
+    return data if data else None
+
+
+def _internshala_link(item: Dict) -> str:
+    return item.get('link') or item.get('url') or json.dumps(item, sort_keys=True)
+
+
+def _internshala_search_pairs(query: str, location: str) -> List[tuple]:
+    """(keywords, location) pairs in priority order, without pairs that send the same request"""
+    parts = [p.strip() for p in (query or "").split(',') if p.strip()]
+    first_kw = parts[0] if parts else None
+    pairs = [(query, location)]
+    if first_kw:
+        pairs.append((first_kw, location))
+    pairs.append(("", location))
+    fallback_locations = [location or "India", "India", ""]
+    pairs.extend((fk, fl) for fk in INTERNSHALA_FALLBACK_KEYWORDS for fl in fallback_locations)
+
+    unique, seen = [], set()
+    for q, loc in pairs:
+        # Empty location is sent as "India"; keyword case and spacing don't change the results
+        key = (" ".join((q or "").lower().split()), (loc or "India").strip().lower())
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append((q, loc))
+    return unique
+
+
 # Public helper (no env required)
+@indexed('internshala_api')
 def fetch_internshala_internships(query: str, location: str = "India") -> Optional[List[Dict]]:
     """Fetch internships from Internshala's public search API and return a list.
     Endpoint: https://internshala.com/api/internships/search?keywords={query}&location={location}
@@ -74,78 +159,54 @@ def fetch_internshala_internships(query: str, location: str = "India") -> Option
       2) First keyword only
       3) Empty query for given location
       4) Fallback keyword sweep across popular fresher domains until we have 10
+    Step 1 is sent on its own; if it returns fewer than 10 listings, steps 2-4 run as one
+    concurrent sweep (INTERNSHALA_SWEEP_CONCURRENCY in flight, in priority order) that is cancelled
+    as soon as 10 unique listings are in, or at INTERNSHALA_SWEEP_DEADLINE seconds overall.
+    Results keep priority order: earlier searches' listings come first.
     """
-    def _hit(q: str, loc: str) -> Optional[List[Dict]]:
-        q_enc = quote((q or "").strip())
-        loc_enc = quote((loc or "India").strip())
-        url = f"https://internshala.com/api/internships/search?keywords={q_enc}&location={loc_enc}"
-        headers = {
-            "Accept": "application/json",
-            "Accept-Language": "en-US,en;q=0.9",
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
-            "Referer": "https://internshala.com/"
-        }
-        r = requests.get(url, timeout=10, headers=headers)
-        if r.status_code != 200:
-            return None
-        try:
-            data = r.json()
-        except Exception:
-            return None
-        items = data.get('internships') or data.get('data') or data.get('results') or data
-        if not isinstance(items, list):
-            return None
-        return items if items else None
-
+    started = time.monotonic()
+    deadline = Config.INTERNSHALA_SWEEP_DEADLINE
     try:
         collected: List[Dict] = []
         seen = set()
         def _add(items: Optional[List[Dict]]):
-            nonlocal collected, seen
             for it in (items or []):
-                link = it.get('link') or it.get('url') or json.dumps(it, sort_keys=True)
+                link = _internshala_link(it)
                 if link in seen:
                     continue
                 seen.add(link)
                 collected.append(it)
 
+        pairs = _internshala_search_pairs(query, location)
+
         # Attempt 1: full query
-        res = _hit(query, location)
-        _add(res)
-        if len(collected) >= 10:
-            return collected[:10]
-
-        # Attempt 2: first keyword only
-        first_kw = None
-        if query:
-            parts = [p.strip() for p in query.split(',') if p.strip()]
-            first_kw = parts[0] if parts else None
-        if first_kw:
-            _add(_hit(first_kw, location))
-            if len(collected) >= 10:
-                return collected[:10]
-
-        # Attempt 3: empty query for generic internships in location
-        _add(_hit("", location))
-        if len(collected) >= 10:
-            return collected[:10]
-
-        # Attempt 4: popular fresher domains sweep
-        fallback_keywords = [
-            "software development", "web development", "frontend", "backend",
-            "python", "java", "data analyst", "data science", "machine learning",
-            "android", "ios", "ui ux", "product management", "qa testing"
-        ]
-        fallback_locations = [location or "India", "India", ""]
-        for fk in fallback_keywords:
-            for fl in fallback_locations:
-                _add(_hit(fk, fl))
-                if len(collected) >= 10:
-                    return collected[:10]
-        return collected[:10] if collected else None
-    except requests.exceptions.RequestException as e:
-        st.warning(f"Internshala API request failed: {e}")
-        return None
+        first = _internshala_request(*pairs[0])
+        _add(_internshala_items(http_fetch.get(first["url"], headers=first["headers"],
+                                               timeout=min(Config.HTTP_TIMEOUT, deadline))))
+        if len(collected) >= INTERNSHALA_TARGET:
+            return collected[:INTERNSHALA_TARGET]
+
+        # Attempts 2-4 concurrently, stopping once enough unique listings have arrived
+        found = set(seen)
+        parsed: Dict[int, Optional[List[Dict]]] = {}
+
+        def _on_result(i: int, resp) -> bool:
+            items = _internshala_items(resp)
+            parsed[i] = items
+            found.update(_internshala_link(it) for it in (items or []))
+            return len(found) >= INTERNSHALA_TARGET
+
+        remaining = deadline - (time.monotonic() - started)
+        if remaining > 0:
+            http_fetch.engine.fetch_until(
+                [_internshala_request(q, loc) for q, loc in pairs[1:]],
+                _on_result,
+                concurrency=Config.INTERNSHALA_SWEEP_CONCURRENCY,
+                timeout=remaining,
+            )
+        for i in sorted(parsed):
+            _add(parsed[i])
+        return collected[:INTERNSHALA_TARGET] if collected else None
     except Exception as e:
-        st.warning(f"Internshala API error: {e}")
+        note_exception(e)
         return None
@@ -0,0 +1,134 @@
+"""
+Benchmark per-page card extraction for the Internshala and RemoteOK scrapers.
+
+Parses the saved listing pages in benchmarks/fixtures three ways:
+  - soup:     full BeautifulSoup(html, "lxml") tree + select_one per field
+              (the previous scraper implementation)
+  - strainer: the same, with a SoupStrainer so only the cards are built
+  - xpath:    scraper_engine.extract with the job_scrapers site adapters
+              (lxml tree + compiled XPath, html_cards.py)
+and checks that all three extract exactly the same fields.
+
+The fixtures are synthetic pages that follow the markup the scrapers target
+(page chrome, inline scripts, both card layouts), sized like the live pages.
+
+Usage (from the repo root):
+    python benchmarks/bench_card_parsing.py [--repeats 30]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup, SoupStrainer  # noqa: E402
+
+from job_scrapers import INTERNSHALA, REMOTEOK  # noqa: E402
+from scraper_engine import extract  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def soup_internshala_cards(page_html, parse_only=None):
+    """The previous Internshala card loop, kept verbatim apart from returning raw fields"""
+    out = []
+    soup = BeautifulSoup(page_html, "lxml", parse_only=parse_only)
+    cards = soup.select("div.container-fluid.individual_internship")
+    for card in cards:
+        title = (card.select_one("a.job-title") or card.select_one("h3 a")).get_text(strip=True) if card else "Internship"
+        company = (card.select_one("a.link_display_like_text") or card.select_one("div.company_name")).get_text(strip=True) if card else ""
+        loc_el = card.select_one("a.location_link") or card.select_one("span#location_names")
+        location_text = loc_el.get_text(strip=True) if loc_el else ""
+        stipend = (card.select_one("span.stipend") or card.select_one("div.stipend")).get_text(strip=True) if card else None
+        duration = None
+        for d in card.select("div.other_detail_item, span.other_detail_item"):
+            t = d.get_text(" ", strip=True)
+            if any(x in t.lower() for x in ["month", "week", "day"]):
+                duration = t
+                break
+        desc = None
+        for sel in [
+            "div.job-snippet", "div#job-snippet", "div.job-description", "div.desc", "div.internship_about",
+            "div.text-ellipsis", "div.collapse", "div.job-snippet-container"
+        ]:
+            el = card.select_one(sel)
+            if el:
+                txt = el.get_text(" ", strip=True)
+                if txt:
+                    desc = txt
+                    break
+        link_el = card.select_one("a.view_detail_button") or card.select_one("a.job-title")
+        out.append({"title": title, "company": company, "location": location_text, "stipend": stipend,
+                    "duration": duration, "description": desc, "href": link_el.get("href") if link_el else None})
+    return out
+
+
+def soup_remoteok_rows(page_html, parse_only=None):
+    """The previous RemoteOK row loop, kept verbatim apart from returning raw fields"""
+    out = []
+    soup = BeautifulSoup(page_html, "lxml", parse_only=parse_only)
+    rows = soup.select("tr.job")
+    for row in rows:
+        title = (row.select_one("td.position h2") or row.select_one("a.preventLink")).get_text(strip=True) if row else ""
+        company = (row.select_one("td.company h3") or row.select_one("span.companyLink")).get_text(strip=True) if row else ""
+        tags = [t.get_text(strip=True) for t in row.select("td.tags a")]
+        location_text = (row.select_one("div.location") or row.select_one("div.location.tooltip")).get_text(strip=True) if row else "Remote"
+        link_el = row.select_one("a.preventLink") or row.select_one("a")
+        out.append({"title": title, "company": company, "tags": tags, "location": location_text,
+                    "href": link_el.get("href") if link_el else None})
+    return out
+
+
+def has_class(name):
+    # SoupStrainer sees the raw class attribute at parse time, not the split class list
+    return lambda value: bool(value) and name in value.split()
+
+
+def adapter_fields(adapter):
+    # The engine also resolves `url` from `href`; compare the fields the old loops returned
+    def parse(page_html):
+        return [{k: v for k, v in card.items() if k != 'url'} for card in extract(adapter, page_html)]
+    return parse
+
+
+PAGES = [
+    ('internshala_listing.html', {
+        'soup': soup_internshala_cards,
+        'strainer': lambda h: soup_internshala_cards(h, SoupStrainer("div", class_=has_class("individual_internship"))),
+        'xpath': adapter_fields(INTERNSHALA),
+    }),
+    ('remoteok_listing.html', {
+        'soup': soup_remoteok_rows,
+        'strainer': lambda h: soup_remoteok_rows(h, SoupStrainer("tr", class_=has_class("job"))),
+        'xpath': adapter_fields(REMOTEOK),
+    }),
+]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument('--repeats', type=int, default=30)
+    args = ap.parse_args()
+
+    print(f"{'page':<24} {'KB':>6} {'cards':>6} {'soup_ms':>9} {'strainer_ms':>12} {'xpath_ms':>9} {'speedup':>8} {'same':>5}")
+    for name, parsers in PAGES:
+        with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+            page_html = f.read()
+        results, times = {}, {}
+        for label, parse in parsers.items():
+            runs = []
+            for _ in range(args.repeats):
+                t0 = time.perf_counter()
+                results[label] = parse(page_html)
+                runs.append(time.perf_counter() - t0)
+            times[label] = statistics.median(runs)
+        same = results['soup'] == results['strainer'] == results['xpath']
+        print(f"{name:<24} {len(page_html) / 1024:>6.0f} {len(results['xpath']):>6} {times['soup'] * 1000:>9.2f} "
+              f"{times['strainer'] * 1000:>12.2f} {times['xpath'] * 1000:>9.2f} "
+              f"{times['soup'] / times['xpath']:>7.1f}x {'yes' if same else 'NO':>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark filter_jobs_by_category on synthetic job listings.
+
+Compares, for every category in CATEGORY_KEYWORDS and the same jobs:
+  - legacy:   per-keyword `re.search` with a freshly built pattern, up to five
+              scans per keyword (the previous App.py implementation)
+  - compiled: job_matching.filter_jobs_by_category (one pass per job)
+and checks that both return exactly the same ranking.
+
+Usage (from the repo root):
+    python benchmarks/bench_category_filter.py [--jobs 3000] [--seed 7]
+"""
+import argparse
+import copy
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_matching import CATEGORY_KEYWORDS, filter_jobs_by_category  # noqa: E402
+
+FILLER = ("we are looking for a motivated intern to join our team work on real projects "
+          "with mentors stipend flexible hours remote office startup company learn grow "
+          "communication skills good to have candidates must be available for months").split()
+TITLES = ['Intern', 'Trainee', 'Internship', 'Associate', 'Junior Engineer', 'Analyst']
+COMPANIES = ['Acme Labs', 'Globex', 'Initech', 'Umbrella Tech', 'Hooli', 'Stark Industries']
+
+
+def legacy_filter_jobs_by_category(jobs, predicted_category):
+    """The previous implementation, kept verbatim apart from the table lookup"""
+    if not predicted_category or not jobs:
+        return jobs
+
+    def keyword_in_text(keyword, text):
+        pattern = r'\b' + re.escape(keyword).replace(r'\-', '[-\s]?') + r's?\b'
+        return re.search(pattern, text, re.IGNORECASE)
+
+    category_keywords = copy.deepcopy(CATEGORY_KEYWORDS)  # was rebuilt on every call
+    keyword_set = category_keywords.get(predicted_category, {})
+    core_keywords = keyword_set.get('core', [])
+    related_keywords = keyword_set.get('related', [])
+    if not core_keywords and not related_keywords:
+        return jobs
+
+    scored_jobs = []
+    for job in jobs:
+        title = (job.get('title', '') or '').lower().replace('-', ' ')
+        description = (job.get('description', '') or '').lower().replace('-', ' ')
+        company = (job.get('company', '') or '').lower()
+        tags = ' '.join(job.get('tags', [])).lower()
+        job_text = f"{title} {description} {company} {tags}"
+        title_score, body_score = 0, 0
+        for keyword in core_keywords:
+            if keyword_in_text(keyword, title):
+                title_score += 5
+        for keyword in related_keywords:
+            if keyword_in_text(keyword, title):
+                title_score += 2
+        for keyword in core_keywords:
+            if keyword_in_text(keyword, job_text):
+                body_score += 3
+        for keyword in related_keywords:
+            if keyword_in_text(keyword, job_text):
+                body_score += 1
+        total_score = title_score + body_score
+        has_core = any(keyword_in_text(kw, job_text) for kw in core_keywords)
+        has_strong_title = title_score >= 3
+        if has_core or has_strong_title or total_score >= 4:
+            scored_jobs.append((job, total_score))
+
+    scored_jobs.sort(key=lambda x: x[1], reverse=True)
+    filtered_jobs = [job for job, score in scored_jobs]
+    if len(filtered_jobs) < max(3, len(jobs) * 0.2):
+        return jobs
+    return filtered_jobs if filtered_jobs else jobs
+
+
+def synthetic_jobs(n, seed):
+    rng = random.Random(seed)
+    vocab = sorted({kw for kws in CATEGORY_KEYWORDS.values() for group in kws.values() for kw in group})
+    jobs = []
+    for i in range(n):
+        kws = rng.sample(vocab, rng.randint(0, 4))
+        variants = [k.replace(' ', '-') if rng.random() < 0.2 else (k + 's' if rng.random() < 0.2 else k) for k in kws]
+        title = ' '.join(variants[:rng.randint(0, 2)] + [rng.choice(TITLES)])
+        words = [rng.choice(FILLER) for _ in range(rng.randint(30, 120))]
+        for k in variants:
+            words.insert(rng.randrange(len(words) + 1), k.upper() if rng.random() < 0.1 else k)
+        jobs.append({
+            'id': i,
+            'title': title.title() if rng.random() < 0.5 else title,
+            'description': ' '.join(words),
+            'company': rng.choice(COMPANIES),
+            'tags': rng.sample(vocab, rng.randint(0, 2)),
+        })
+    return jobs
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument('--jobs', type=int, default=3000)
+    ap.add_argument('--seed', type=int, default=7)
+    args = ap.parse_args()
+
+    jobs = synthetic_jobs(args.jobs, args.seed)
+    filter_jobs_by_category(jobs[:1], next(iter(CATEGORY_KEYWORDS)))  # import-time work out of the timing
+    legacy_total = compiled_total = 0.0
+    mismatches = []
+    for category in CATEGORY_KEYWORDS:
+        legacy, t_legacy = _timed(legacy_filter_jobs_by_category, jobs, category)
+        compiled, t_compiled = _timed(filter_jobs_by_category, jobs, category)
+        legacy_total += t_legacy
+        compiled_total += t_compiled
+        if [j['id'] for j in legacy] != [j['id'] for j in compiled]:
+            mismatches.append(category)
+
+    n_calls = len(CATEGORY_KEYWORDS)
+    print(f"{args.jobs} synthetic jobs x {n_calls} categories")
+    print(f"legacy:   {legacy_total:8.3f} s  ({legacy_total / n_calls / args.jobs * 1e6:7.1f} us/job)")
+    print(f"compiled: {compiled_total:8.3f} s  ({compiled_total / n_calls / args.jobs * 1e6:7.1f} us/job)")
+    print(f"speedup:  {legacy_total / compiled_total:.1f}x")
+    print(f"ranking mismatches: {len(mismatches)}" + (f" ({', '.join(mismatches)})" if mismatches else ""))
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
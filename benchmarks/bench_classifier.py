@@ -0,0 +1,76 @@
+"""
+Benchmark resume category prediction on UpdatedResumeDataSet.csv.
+
+Compares, over the same resumes:
+  - legacy:  model.predict([t]) followed by model.predict_proba([t]) per resume
+  - single:  predict_top_k(model, [t]) per resume (one pipeline pass)
+  - batched: predict_top_k(model, texts) in chunks
+
+Usage (from the repo root):
+    python benchmarks/bench_classifier.py [--limit 500] [--batch-size 64]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from model_store import BASE_DIR, LEGACY_MODEL_PATH, load_classifier  # noqa: E402
+from resume_classifier import predict_top_k  # noqa: E402
+
+CSV_PATH = os.path.join(BASE_DIR, 'UpdatedResumeDataSet.csv')
+
+
+def _legacy(model, text):
+    category = model.predict([text])[0]
+    proba = model.predict_proba([text])[0]
+    top = proba.argsort()[-3:][::-1]
+    return category, [{"category": model.classes_[i], "probability": proba[i]} for i in top]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument('--limit', type=int, default=0, help='number of resumes to use (0 = all)')
+    ap.add_argument('--batch-size', type=int, default=64)
+    ap.add_argument('--model', default=LEGACY_MODEL_PATH)
+    args = ap.parse_args()
+
+    df = pd.read_csv(CSV_PATH, usecols=['Category', 'Resume']).dropna()
+    if args.limit:
+        df = df.head(args.limit)
+    texts = df['Resume'].astype(str).tolist()
+    labels = df['Category'].tolist()
+
+    model, info = load_classifier(args.model)
+    print(f"Model: {info['path']} (mmap={info['mmap']}, load {info['load_seconds'] * 1000:.1f} ms)")
+    print(f"Resumes: {len(texts)}")
+
+    legacy, t_legacy = _timed(lambda: [_legacy(model, t) for t in texts])
+    single, t_single = _timed(lambda: [predict_top_k(model, [t])[0] for t in texts])
+    batched, t_batched = _timed(lambda: [
+        p for i in range(0, len(texts), args.batch_size)
+        for p in predict_top_k(model, texts[i:i + args.batch_size])
+    ])
+
+    mismatches = sum(1 for a, b in zip(legacy, batched) if a[0] != b[0])
+    accuracy = sum(1 for p, y in zip(batched, labels) if p[0] == y) / max(1, len(labels))
+
+    n = max(1, len(texts))
+    print(f"{'variant':<10}{'total s':>10}{'ms/resume':>12}{'speedup':>10}")
+    for name, t in (('legacy', t_legacy), ('single', t_single), ('batched', t_batched)):
+        print(f"{name:<10}{t:>10.3f}{t / n * 1000:>12.3f}{t_legacy / t if t else 0:>9.2f}x")
+    print(f"Top-1 mismatches vs legacy: {mismatches}")
+    print(f"Accuracy on dataset: {accuracy:.4f}")
+
+
+if __name__ == "__main__":
+    main()
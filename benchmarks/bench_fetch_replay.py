@@ -0,0 +1,146 @@
+"""
+Benchmark the scraper fetch path offline against replayed HTTP responses.
+
+Runs the Internshala keyword and RemoteOK adapters through scraper_engine and
+http_fetch with the cassette.py transport in replay mode, so the numbers come
+from our own concurrency, caching and timeout handling rather than from
+whatever the live sites are doing:
+  - serial:     pages fetched one at a time (the scrapers before the engine)
+  - cold:       the same pages fetched concurrently by scraper_engine.scrape
+  - warm:       the same search again, served from the query cache
+  - revalidate: expired cache, pages revalidated with conditional GETs (304)
+  - faults:     cold run under run_sources with injected connection failures
+                and timeouts, reporting each source's status
+Latency and faults are drawn from --seed, so repeated runs are identical.
+
+Cassettes are seeded from the saved pages in benchmarks/fixtures into a
+temporary directory by default; pass --cassettes with a store recorded via
+HTTP_CASSETTE_MODE=record (and the matching --keywords/--location) to replay
+real responses instead.
+
+Usage (from the repo root):
+    python benchmarks/bench_fetch_replay.py [--pages 5] [--latency 0.2-0.4]
+        [--failure-rate 0.2] [--timeout-rate 0.1] [--timeout 1.5] [--seed 0]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def parse_args():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument('--pages', type=int, default=5, help='Internshala result pages per search')
+    ap.add_argument('--latency', default='0.2-0.4', help='replayed response time in seconds, "0.2" or "low-high"')
+    ap.add_argument('--failure-rate', type=float, default=0.2)
+    ap.add_argument('--timeout-rate', type=float, default=0.1)
+    ap.add_argument('--timeout', type=float, default=1.5, help='HTTP_TIMEOUT for the run')
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--keywords', default='python')
+    ap.add_argument('--location', default='India')
+    ap.add_argument('--cassettes', help='replay this cassette store instead of the fixtures')
+    return ap.parse_args()
+
+
+def seed_cassettes(cassette, pages, params):
+    from job_scrapers import INTERNSHALA_KEYWORDS, REMOTEOK
+    with open(os.path.join(FIXTURES, 'internshala_listing.html'), 'rb') as f:
+        internshala = f.read()
+    with open(os.path.join(FIXTURES, 'remoteok_listing.html'), 'rb') as f:
+        remoteok = f.read()
+    for page in range(1, pages + 1):
+        cassette.save('GET', INTERNSHALA_KEYWORDS.url(params, page), 200,
+                      {'content-type': 'text/html; charset=utf-8', 'etag': f'"internshala-{page}"'}, internshala)
+    cassette.save('GET', REMOTEOK.url(params, 1), 200,
+                  {'content-type': 'text/html; charset=utf-8', 'etag': '"remoteok-1"'}, remoteok)
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    args = parse_args()
+    work = tempfile.mkdtemp(prefix='internhunt-replay-')
+    # Settings are read at import time; keep the run self-contained and unthrottled
+    os.environ.update({
+        'HTTP_CASSETTE_MODE': 'replay',
+        'HTTP_CASSETTE_DIR': args.cassettes or os.path.join(work, 'cassettes'),
+        'HTTP_CASSETTE_LATENCY': args.latency,
+        'HTTP_CASSETTE_SEED': str(args.seed),
+        'HTTP_TIMEOUT': str(args.timeout),
+        'HTTP_RATE_PER_SEC': '1000',
+        'HTTP_RATE_BURST': '1000',
+        'JOB_INDEX_PATH': os.path.join(work, 'job_index.sqlite3'),
+        'QUERY_CACHE_DISK': '0',
+        'SCRAPER_DEADLINE': str(max(8.0, args.timeout * 4)),
+    })
+
+    import cassette
+    import http_fetch
+    import scraper_engine
+    from job_scrapers import INTERNSHALA_KEYWORDS, REMOTEOK
+    from job_sources import run_sources
+    from query_cache import search_cache, search_key
+
+    params = {'keywords': args.keywords, 'location': args.location}
+    if not args.cassettes:
+        seed_cassettes(cassette, args.pages, params)
+
+    def reset(failure_rate=0.0, timeout_rate=0.0):
+        search_cache.clear()
+        http_fetch.engine._validated.clear()
+        cassette.configure(failure_rate=failure_rate, timeout_rate=timeout_rate)
+
+    def serial():
+        cards = []
+        for page in range(1, args.pages + 1):
+            url = INTERNSHALA_KEYWORDS.url(params, page)
+            key = search_key(INTERNSHALA_KEYWORDS.name, args.keywords, args.location, page)
+            cards.extend(scraper_engine.fetch_page(INTERNSHALA_KEYWORDS, url, key))
+        return cards
+
+    def scrape():
+        return scraper_engine.scrape(INTERNSHALA_KEYWORDS, params, max_pages=args.pages)
+
+    print(f"latency {args.latency}s, {args.pages} pages, HTTP_TIMEOUT {args.timeout}s, seed {args.seed}")
+    print(f"{'run':<12} {'jobs':>6} {'seconds':>9}")
+    reset()
+    jobs, seconds = timed(serial)
+    print(f"{'serial':<12} {len(jobs):>6} {seconds:>9.3f}")
+    reset()
+    jobs, seconds = timed(scrape)
+    print(f"{'cold':<12} {len(jobs):>6} {seconds:>9.3f}")
+    jobs, seconds = timed(scrape)
+    print(f"{'warm':<12} {len(jobs):>6} {seconds:>9.3f}")
+    ttl, search_cache.ttl = search_cache.ttl, 0
+    jobs, seconds = timed(scrape)
+    search_cache.ttl = ttl
+    print(f"{'revalidate':<12} {len(jobs):>6} {seconds:>9.3f}")
+
+    reset(failure_rate=args.failure_rate, timeout_rate=args.timeout_rate)
+    (results, statuses), seconds = timed(lambda: run_sources({
+        'internshala': lambda: scraper_engine.scrape(INTERNSHALA_KEYWORDS, params, max_pages=args.pages),
+        'remoteok': lambda: scraper_engine.scrape(REMOTEOK, params),
+    }))
+    print(f"\nfaults: {args.failure_rate:.0%} connection failures, {args.timeout_rate:.0%} timeouts "
+          f"-> {seconds:.3f}s")
+    print(f"{'source':<12} {'status':<10} {'jobs':>6} {'seconds':>9}  detail")
+    for name, st in statuses.items():
+        print(f"{name:<12} {st.status:<10} {len(results.get(name, [])):>6} {st.latency:>9.3f}  {st.detail[:60]}")
+
+    print(f"\n{'host':<20} {'requests':>9} {'errors':>7} {'timeouts':>9} {'304s':>5}")
+    for host, row in http_fetch.engine.stats().items():
+        print(f"{host:<20} {row['requests']:>9} {row['errors']:>7} {row['timeouts']:>9} {row['not_modified']:>5}")
+    http_fetch.engine.close()
+
+
+if __name__ == "__main__":
+    main()
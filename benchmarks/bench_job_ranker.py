@@ -0,0 +1,57 @@
+"""
+Benchmark the BM25 job ranker on synthetic job batches.
+
+For batch sizes typical of one search (tens to a thousand listings) reports
+index build time, query time and total time per job, plus the ordering
+agreement with the category keyword filter on the same batch (top-10 overlap).
+
+Usage (from the repo root):
+    python benchmarks/bench_job_ranker.py [--sizes 50,200,500,1000] [--repeats 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_category_filter import synthetic_jobs  # noqa: E402
+from job_matching import filter_jobs_by_category  # noqa: E402
+from job_ranker import BM25JobIndex, build_query  # noqa: E402
+
+SKILLS = ['Python', 'Django', 'SQL', 'Machine Learning', 'Docker', 'React']
+CATEGORY = 'Python Developer'
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument('--sizes', default='50,200,500,1000')
+    ap.add_argument('--repeats', type=int, default=20)
+    ap.add_argument('--seed', type=int, default=7)
+    args = ap.parse_args()
+
+    query = build_query(SKILLS, CATEGORY)
+    print(f"query terms: {len(query)}")
+    print(f"{'jobs':>6} {'build_ms':>10} {'query_ms':>10} {'us/job':>8} {'top10 overlap':>14}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        jobs = synthetic_jobs(size, args.seed)
+        builds, queries = [], []
+        for _ in range(args.repeats):
+            t0 = time.perf_counter()
+            index = BM25JobIndex(jobs)
+            t1 = time.perf_counter()
+            ranked = index.rank(query)
+            t2 = time.perf_counter()
+            builds.append(t1 - t0)
+            queries.append(t2 - t1)
+        build_s, query_s = statistics.median(builds), statistics.median(queries)
+        bm25_top = {job['id'] for job, _ in ranked[:10]}
+        keyword_top = {job['id'] for job in filter_jobs_by_category(jobs, CATEGORY)[:10]}
+        print(f"{size:>6} {build_s * 1000:>10.2f} {query_s * 1000:>10.3f} "
+              f"{(build_s + query_s) / size * 1e6:>8.1f} {len(bm25_top & keyword_top):>11}/10")
+
+
+if __name__ == "__main__":
+    main()
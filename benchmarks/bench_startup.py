@@ -0,0 +1,96 @@
+"""
+Measure InternHunt cold-start cost.
+
+Runs in fresh interpreters so nothing is already imported:
+  - `python -X importtime -c "import App"`: total import time and the
+    slowest top-level imports (cumulative)
+  - which heavy stacks (spaCy, NLTK, pandas, Gemini SDK, DB drivers, torch)
+    were imported just by loading App.py
+  - time to first render: one full script run through Streamlit's AppTest
+    (a headless run of App.py, including initialize_app)
+
+Usage (from the repo root):
+    python benchmarks/bench_startup.py [--top 15] [--runs 3] [--no-render]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('spacy', 'nltk', 'pandas', 'google.generativeai', 'pymysql', 'psycopg2',
+                 'torch', 'sentence_transformers', 'sklearn', 'fuzzywuzzy', 'pypdf')
+
+HEAVY_SNIPPET = """
+import sys
+sys.path.insert(0, {base!r})
+import App
+print(','.join(m for m in {mods!r} if m in sys.modules))
+"""
+
+RENDER_SNIPPET = """
+import sys, time
+sys.path.insert(0, {base!r})
+from streamlit.testing.v1 import AppTest
+t = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=300).run()
+print(time.perf_counter() - t, len(at.exception))
+"""
+
+
+def import_profile():
+    """Parse `-X importtime` output into [(module, self_us, cumulative_us, depth)]"""
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import App'],
+                         cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cum_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cum_us), depth))
+    return rows
+
+
+def heavy_modules_loaded():
+    out = subprocess.run([sys.executable, '-c', HEAVY_SNIPPET.format(base=BASE_DIR, mods=HEAVY_MODULES)],
+                         cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    line = out.stdout.strip().splitlines()[-1] if out.stdout.strip() else ''
+    return [m for m in line.split(',') if m]
+
+
+def first_render_seconds():
+    out = subprocess.run([sys.executable, '-c', RENDER_SNIPPET.format(base=BASE_DIR, app=os.path.join(BASE_DIR, 'App.py'))],
+                         cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    seconds, exceptions = out.stdout.strip().splitlines()[-1].split()
+    return float(seconds), int(exceptions)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument('--top', type=int, default=15)
+    ap.add_argument('--runs', type=int, default=3)
+    ap.add_argument('--no-render', action='store_true', help='skip the AppTest first-render run')
+    args = ap.parse_args()
+
+    profiles = [import_profile() for _ in range(args.runs)]
+    best = min(profiles, key=lambda rows: next(c for n, _, c, d in rows if n == 'App'))
+    total_ms = next(c for n, _, c, d in best if n == 'App') / 1000
+    print(f"import App: {total_ms:.0f} ms (best of {args.runs})")
+    print(f"\nSlowest imports under App (cumulative ms, direct children of App):")
+    children = sorted((r for r in best if r[3] == 1), key=lambda r: -r[2])[:args.top]
+    for name, self_us, cum_us, _ in children:
+        print(f"  {cum_us / 1000:>9.1f}  {name}")
+
+    loaded = heavy_modules_loaded()
+    print(f"\nHeavy modules imported by App.py at startup: {', '.join(loaded) or 'none'}")
+
+    if not args.no_render:
+        seconds, exceptions = first_render_seconds()
+        print(f"\nTime to first render (AppTest, fresh process): {seconds * 1000:.0f} ms"
+              + (f"  [{exceptions} script exception(s)]" if exceptions else ""))
+
+
+if __name__ == "__main__":
+    main()
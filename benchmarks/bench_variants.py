@@ -0,0 +1,92 @@
+"""
+Compare classifier variants (tfidf_logreg vs hashing_sgd) on UpdatedResumeDataSet.csv.
+
+Both variants are trained on the same deterministic streaming split used by
+train_classifier.fit_streaming, then compared on:
+  - hold-out accuracy
+  - warm inference latency (p50 single resume, per-resume batched)
+  - artifact size on disk
+  - cold start: artifact load + first prediction in a fresh interpreter
+
+Usage (from the repo root):
+    python benchmarks/bench_variants.py [--epochs 15]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.metrics import accuracy_score  # noqa: E402
+
+import train_classifier as tc  # noqa: E402
+from model_store import BASE_DIR, save_artifact  # noqa: E402
+from resume_classifier import prepare_for_inference  # noqa: E402
+
+COLD_START_SNIPPET = """
+import sys, time
+sys.path.insert(0, {base!r})
+from model_store import load_classifier
+from resume_classifier import predict_top_k
+import sklearn.pipeline  # import cost is shared by every variant; keep it out of the timing
+t = time.perf_counter()
+model, info = load_classifier({path!r}, mmap={mmap!r})
+predict_top_k(model, ["python developer with django and sql experience"])
+print(time.perf_counter() - t)
+"""
+
+
+def cold_start_seconds(path: str, mmap: bool, runs: int = 3) -> float:
+    best = None
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, '-c', COLD_START_SNIPPET.format(base=BASE_DIR, path=path, mmap=mmap)],
+            capture_output=True, text=True, check=True,
+        )
+        val = float(out.stdout.strip().splitlines()[-1])
+        best = val if best is None else min(best, val)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument('--epochs', type=int, default=15)
+    ap.add_argument('--test-size', type=float, default=0.2)
+    args = ap.parse_args()
+
+    # Same hold-out rows for both variants
+    rows = list(tc.iter_dataset(tc.CSV_PATH))
+    train_rows = [r for i, r in enumerate(rows) if not tc._is_holdout(i, args.test_size)]
+
+    results = {}
+    tfidf = tc.build_tfidf_pipeline(n_jobs=-1)
+    prepare_for_inference(tfidf.fit([t for t, _ in train_rows], [y for _, y in train_rows]))
+    hashing = tc.fit_streaming(tc.CSV_PATH, args.test_size, epochs=args.epochs, n_jobs=-1)
+    known = set(hashing.classes_)
+    test_rows = [r for i, r in enumerate(rows) if tc._is_holdout(i, args.test_size) and r[1] in known]
+    X_test, y_test = [t for t, _ in test_rows], [y for _, y in test_rows]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, model in (('tfidf_logreg', tfidf), ('hashing_sgd', hashing)):
+            path = save_artifact(model, os.path.join(tmp, f"{name}.joblib"))
+            latency = tc.measure_latency(model, X_test)
+            results[name] = {
+                'accuracy': accuracy_score(y_test, model.predict(X_test)),
+                'p50_ms': latency['inference_ms_p50'],
+                'batched_ms': latency['inference_ms_batched'],
+                'size_mb': os.path.getsize(path) / 1e6,
+                'cold_mmap_ms': cold_start_seconds(path, mmap=True) * 1000,
+                'cold_load_ms': cold_start_seconds(path, mmap=False) * 1000,
+            }
+
+    cols = ('accuracy', 'p50_ms', 'batched_ms', 'size_mb', 'cold_mmap_ms', 'cold_load_ms')
+    print(f"Hold-out resumes: {len(X_test)}")
+    print(f"{'variant':<14}" + "".join(f"{c:>14}" for c in cols))
+    for name, r in results.items():
+        print(f"{name:<14}" + "".join(f"{r[c]:>14.3f}" for c in cols))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+# Record/replay HTTP transport for InternHunt
+"""
+Lets the job sources run against recorded responses instead of the live
+sites, so job_scrapers.py and api_services.py can be benchmarked and
+regression-tested offline.
+
+Set HTTP_CASSETTE_MODE and every request made through http_fetch goes
+through this transport:
+
+- `record`: requests hit the real site and each response (status, headers,
+  body) is saved to the cassette store, one JSON file per request under
+  HTTP_CASSETTE_DIR (default .http_cassettes/<host>/). A request is identified
+  by method, URL and a hash of its body; recording it again overwrites it.
+  Conditional headers are not forwarded, so a revalidated URL is still
+  recorded with its full body rather than as an empty 304.
+- `replay`: nothing leaves the machine. Each request is answered from its
+  cassette; an unrecorded request fails as a connection error. The replay
+  can be made realistic:
+    HTTP_CASSETTE_LATENCY       seconds per response, "0.2" or a range "0.05-0.4"
+    HTTP_CASSETTE_FAILURE_RATE  share of requests failing with a connection error
+    HTTP_CASSETTE_TIMEOUT_RATE  share of requests that hang until their read timeout
+    HTTP_CASSETTE_SEED          seed for the above
+  Latency and failures are derived from a hash of the seed, the request and
+  how many times it has been replayed, so a run is reproducible regardless of
+  how concurrent requests interleave. Latency longer than a request's read
+  timeout ends in a timeout, as it would live. A recorded ETag/Last-Modified is
+  honoured, so conditional requests get 304s.
+
+`configure(...)` changes the settings at runtime (benchmarks use it) and
+`save(...)` writes a cassette directly, e.g. from a saved HTML page.
+
+CLI:
+    python cassette.py list          # recorded requests per host
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+MODES = ('', 'off', 'record', 'replay')
+
+# Headers describing the wire encoding; bodies are stored decoded
+_DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive')
+# Not forwarded when recording: the cassette must hold the full 200, never a body-less 304
+_CONDITIONAL_HEADERS = ('if-none-match', 'if-modified-since')
+
+
+def parse_latency(spec: str) -> Tuple[float, float]:
+    """"0.2" -> (0.2, 0.2); "0.05-0.4" -> (0.05, 0.4); empty or bad -> (0, 0)"""
+    low, _, high = (spec or '').partition('-')
+    try:
+        low_s = float(low) if low.strip() else 0.0
+        return low_s, float(high) if high.strip() else low_s
+    except ValueError:
+        return 0.0, 0.0
+
+
+class CassetteSettings:
+    """Current mode, store and replay conditions"""
+
+    __slots__ = ('mode', 'directory', 'latency', 'failure_rate', 'timeout_rate', 'seed')
+
+    def __init__(self):
+        self.mode = Config.HTTP_CASSETTE_MODE
+        self.directory = Config.HTTP_CASSETTE_DIR
+        self.latency = parse_latency(Config.HTTP_CASSETTE_LATENCY)
+        self.failure_rate = Config.HTTP_CASSETTE_FAILURE_RATE
+        self.timeout_rate = Config.HTTP_CASSETTE_TIMEOUT_RATE
+        self.seed = Config.HTTP_CASSETTE_SEED
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode in ('record', 'replay')
+
+
+settings = CassetteSettings()
+
+_loaded: Dict[str, Optional[Dict[str, Any]]] = {}
+_replays: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def configure(mode: Optional[str] = None, directory: Optional[str] = None, latency: Any = None,
+              failure_rate: Optional[float] = None, timeout_rate: Optional[float] = None,
+              seed: Optional[int] = None) -> CassetteSettings:
+    """Change cassette settings; `latency` is seconds or (low, high). Pooled clients are rebuilt."""
+    if mode is not None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {MODES}")
+        settings.mode = mode
+    if directory is not None:
+        settings.directory = directory
+    if latency is not None:
+        settings.latency = tuple(latency) if isinstance(latency, (tuple, list)) else (float(latency), float(latency))
+    if failure_rate is not None:
+        settings.failure_rate = failure_rate
+    if timeout_rate is not None:
+        settings.timeout_rate = timeout_rate
+    if seed is not None:
+        settings.seed = seed
+    with _lock:
+        _loaded.clear()
+        _replays.clear()
+    # Clients pick their transport when created
+    import http_fetch
+    http_fetch.engine.close()
+    return settings
+
+
+def request_key(method: str, url: str, body: bytes = b'') -> str:
+    """Stable id of a request: method, full URL and a hash of its body"""
+    digest = hashlib.sha256(f"{method.upper()} {url}\n".encode('utf-8') + (body or b'')).hexdigest()
+    return digest[:24]
+
+
+def _path(host: str, key: str) -> str:
+    return os.path.join(settings.directory, host.replace(':', '_'), key + '.json')
+
+
+def save(method: str, url: str, status: int, headers: Dict[str, str], content: bytes, body: bytes = b'') -> str:
+    """Write one cassette; returns its path"""
+    host = httpx.URL(url).netloc.decode('ascii')
+    key = request_key(method, url, body)
+    path = _path(host, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    record = {
+        'method': method.upper(), 'url': url, 'status': status,
+        'headers': {k.lower(): v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS},
+        'body_b64': base64.b64encode(content).decode('ascii'), 'recorded_at': time.time(),
+    }
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(record, f)
+    os.replace(tmp, path)
+    with _lock:
+        _loaded[key] = record
+    return path
+
+
+def load(method: str, url: str, body: bytes = b'') -> Optional[Dict[str, Any]]:
+    """The cassette for a request, or None when it was never recorded"""
+    key = request_key(method, url, body)
+    with _lock:
+        if key in _loaded:
+            return _loaded[key]
+    path = _path(httpx.URL(url).netloc.decode('ascii'), key)
+    record = None
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            record = json.load(f)
+    with _lock:
+        _loaded[key] = record
+    return record
+
+
+def _draw(key: str, n: int, salt: str) -> float:
+    # Uniform in [0, 1), fixed by seed, request and replay count
+    h = hashlib.sha256(f"{settings.seed}:{key}:{n}:{salt}".encode('ascii')).digest()
+    return int.from_bytes(h[:8], 'big') / 2 ** 64
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """httpx transport that records real responses or replays recorded ones"""
+
+    def __init__(self, limits: Optional[httpx.Limits] = None):
+        self._live = httpx.AsyncHTTPTransport(limits=limits) if settings.mode == 'record' else None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        if self._live is not None:
+            live = httpx.Request(request.method, request.url, content=body, extensions=request.extensions,
+                                 headers=[(k, v) for k, v in request.headers.items()
+                                          if k.lower() not in _CONDITIONAL_HEADERS])
+            response = await self._live.handle_async_request(live)
+            content = await response.aread()
+            await response.aclose()
+            if response.status_code != 304:
+                save(request.method, str(request.url), response.status_code, dict(response.headers), content, body)
+            headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS]
+            return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+        return await self._replay(request, body)
+
+    async def _replay(self, request: httpx.Request, body: bytes) -> httpx.Response:
+        key = request_key(request.method, str(request.url), body)
+        with _lock:
+            n = _replays[key] = _replays.get(key, 0) + 1
+        timeouts = request.extensions.get('timeout') or {}
+        read_timeout = timeouts.get('read')
+
+        if _draw(key, n, 'timeout') < settings.timeout_rate:
+            await asyncio.sleep(read_timeout if read_timeout is not None else 3600)
+            raise httpx.ReadTimeout("injected timeout (cassette replay)", request=request)
+        low, high = settings.latency
+        delay = low + (high - low) * _draw(key, n, 'latency')
+        if read_timeout is not None and delay > read_timeout:
+            await asyncio.sleep(read_timeout)
+            raise httpx.ReadTimeout(f"replay latency {delay:.2f}s exceeds the read timeout", request=request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if _draw(key, n, 'failure') < settings.failure_rate:
+            raise httpx.ConnectError("injected connection failure (cassette replay)", request=request)
+
+        record = load(request.method, str(request.url), body)
+        if record is None:
+            raise httpx.ConnectError(f"no cassette for {request.method} {request.url} (replay mode)", request=request)
+        headers = record['headers']
+        etag, modified = headers.get('etag'), headers.get('last-modified')
+        if record['status'] == 200 and (
+                (etag and request.headers.get('if-none-match') == etag) or
+                (modified and not etag and request.headers.get('if-modified-since') == modified)):
+            return httpx.Response(304, headers={k: v for k, v in headers.items() if k in ('etag', 'last-modified')},
+                                  request=request)
+        return httpx.Response(record['status'], headers=list(headers.items()),
+                              content=base64.b64decode(record['body_b64']), request=request)
+
+    async def aclose(self) -> None:
+        if self._live is not None:
+            await self._live.aclose()
+
+
+def transport(limits: Optional[httpx.Limits] = None) -> Optional[CassetteTransport]:
+    """Transport for a new pooled client, or None when cassettes are off"""
+    return CassetteTransport(limits) if settings.enabled else None
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) >= 2 else ''
+    if cmd == 'list':
+        root = settings.directory
+        print(root)
+        for host in sorted(os.listdir(root)) if os.path.isdir(root) else []:
+            names = [n for n in os.listdir(os.path.join(root, host)) if n.endswith('.json')]
+            print(f"{host:<30} {len(names):>5} requests")
+            for name in sorted(names):
+                with open(os.path.join(root, host, name), encoding='utf-8') as f:
+                    rec = json.load(f)
+                print(f"    {rec['status']} {rec['method']:<5} {rec['url']}")
+    else:
+        print("Usage: python cassette.py list")
@@ -55,6 +55,76 @@ class Config:
     SIMILARITY_MATCH_WEIGHT = 0.5
     FIELD_SCORE_THRESHOLD = 0.5
 
+    # BM25 field weights for job ranking, e.g. "title=3,tags=2,description=1,company=0.5" (see job_ranker.py)
+    JOB_RANK_FIELD_WEIGHTS = os.getenv('JOB_RANK_FIELD_WEIGHTS', '')
+
+    # Outbound HTTP for job sources (see http_fetch.py): per-request timeouts and max in-flight requests per host
+    HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', 10))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 5))
+    HTTP_PER_HOST_CONCURRENCY = int(os.getenv('HTTP_PER_HOST_CONCURRENCY', 4))
+    # Per-host token bucket: requests/second and burst, with overrides like "github.com=0.5/2,internshala.com=2/5"
+    HTTP_RATE_PER_SEC = float(os.getenv('HTTP_RATE_PER_SEC', 2))
+    HTTP_RATE_BURST = float(os.getenv('HTTP_RATE_BURST', 5))
+    HTTP_HOST_RATE_LIMITS = os.getenv('HTTP_HOST_RATE_LIMITS', '')
+    # URLs whose ETag/Last-Modified and body are kept for conditional GETs (0 disables them)
+    HTTP_CONDITIONAL_CACHE_SIZE = int(os.getenv('HTTP_CONDITIONAL_CACHE_SIZE', 64))
+    # Cap on the stored bodies, in MiB (least recently used URLs are dropped first)
+    HTTP_CONDITIONAL_CACHE_MB = float(os.getenv('HTTP_CONDITIONAL_CACHE_MB', 8))
+    # Record/replay of HTTP responses for offline benchmarks (see cassette.py): '' (off), 'record' or 'replay'
+    HTTP_CASSETTE_MODE = os.getenv('HTTP_CASSETTE_MODE', '').strip().lower()
+    HTTP_CASSETTE_DIR = os.getenv('HTTP_CASSETTE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.http_cassettes'))
+    # Replay conditions: latency in seconds ("0.2" or "0.05-0.4"), shares of failed / timed-out requests, seed
+    HTTP_CASSETTE_LATENCY = os.getenv('HTTP_CASSETTE_LATENCY', '0')
+    HTTP_CASSETTE_FAILURE_RATE = float(os.getenv('HTTP_CASSETTE_FAILURE_RATE', 0))
+    HTTP_CASSETTE_TIMEOUT_RATE = float(os.getenv('HTTP_CASSETTE_TIMEOUT_RATE', 0))
+    HTTP_CASSETTE_SEED = int(os.getenv('HTTP_CASSETTE_SEED', 0))
+
+    # Internshala API fallback sweep: requests in flight and hard deadline (seconds) for the whole search
+    INTERNSHALA_SWEEP_CONCURRENCY = int(os.getenv('INTERNSHALA_SWEEP_CONCURRENCY', 4))
+    INTERNSHALA_SWEEP_DEADLINE = float(os.getenv('INTERNSHALA_SWEEP_DEADLINE', 20))
+
+    # Internshala detail pages fetched for card summaries: requests in flight, and how long an
+    # extracted summary is cached per URL (seconds, default 7 days)
+    INTERNSHALA_DETAIL_CONCURRENCY = int(os.getenv('INTERNSHALA_DETAIL_CONCURRENCY', 4))
+    INTERNSHALA_DETAIL_TTL = int(os.getenv('INTERNSHALA_DETAIL_TTL', 604800))
+
+    # Per-source deadline (seconds) when job sources run concurrently, with overrides like "github=5,remoteok=6" (see job_sources.py)
+    SCRAPER_DEADLINE = float(os.getenv('SCRAPER_DEADLINE', 8))
+    SCRAPER_DEADLINES = os.getenv('SCRAPER_DEADLINES', '')
+
+    # Local SQLite index of fetched job listings; searches older than JOB_INDEX_TTL seconds refresh in the background (see query_cache.py)
+    JOB_INDEX_PATH = os.getenv('JOB_INDEX_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.model_cache', 'job_index.sqlite3'))
+    JOB_INDEX_TTL = int(os.getenv('JOB_INDEX_TTL', 1800))
+    # In-process search result cache in front of the job index (see query_cache.py): entries, max age served
+    # stale while refreshing, and whether the job index is used as its disk tier
+    QUERY_CACHE_SIZE = int(os.getenv('QUERY_CACHE_SIZE', 256))
+    QUERY_CACHE_MAX_STALE = int(os.getenv('QUERY_CACHE_MAX_STALE', 86400))
+    QUERY_CACHE_DISK = os.getenv('QUERY_CACHE_DISK', '1').lower() in ('1', 'true', 'yes')
+
+    # Resume classifier variant: 'tfidf_logreg' (default) or 'hashing_sgd' (see train_classifier.py)
+    CLASSIFIER_VARIANT = os.getenv('CLASSIFIER_VARIANT', 'tfidf_logreg')
+
+    # Optional semantic (sentence-embedding) category predictor, see semantic_classifier.py
+    ENABLE_SEMANTIC_CLASSIFIER = os.getenv('ENABLE_SEMANTIC_CLASSIFIER', '').lower() in ('1', 'true', 'yes')
+    EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+    # Optional embedding-based job matching (see semantic_matching.py); weight of cosine vs keyword score
+    ENABLE_SEMANTIC_JOB_MATCHING = os.getenv('ENABLE_SEMANTIC_JOB_MATCHING', '').lower() in ('1', 'true', 'yes')
+    SEMANTIC_MATCH_WEIGHT = float(os.getenv('SEMANTIC_MATCH_WEIGHT', 0.5))
+
+    # NLTK corpora provisioned at build time (python nltk_resources.py); see nltk_resources.py.
+    # Runtime download of missing corpora is opt-in; missing data otherwise fails readiness
+    NLTK_DATA_DIR = os.getenv('NLTK_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nltk_data'))
+    NLTK_ALLOW_DOWNLOAD = os.getenv('NLTK_ALLOW_DOWNLOAD', '').lower() in ('1', 'true', 'yes')
+
+    # Warm models in a background thread after the first render (opt-in); HEALTH_PORT serves /ready and /live,
+    # and the first /ready probe starts the warm-up (see warmup.py)
+    WARMUP_ON_START = os.getenv('WARMUP_ON_START', '').lower() in ('1', 'true', 'yes')
+    HEALTH_PORT = int(os.getenv('HEALTH_PORT', 0) or 0)
+
+    # Observability (opt-in)
+    PROFILE_SCORING = os.getenv('PROFILE_SCORING', '').lower() in ('1', 'true', 'yes')
+    METRICS_PORT = int(os.getenv('METRICS_PORT', 0) or 0)
+
     @classmethod
     def get_db_connection_string(cls) -> str:
         """Get database connection string"""
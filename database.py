@@ -3,11 +3,14 @@ import os
 import logging
 import streamlit as st
 from typing import Optional, Dict, Any
-import pymysql
-import psycopg2
+from lazy_imports import LazyModule, LazyObject
 from urllib.parse import urlparse
 from config import Config
 
+# Drivers are imported when a connection is first opened
+pymysql = LazyModule('pymysql')
+psycopg2 = LazyModule('psycopg2')
+
 logger = logging.getLogger(__name__)
 
 class DatabaseManager:
@@ -155,5 +158,5 @@ class DatabaseManager:
         """Cleanup on object destruction"""
         self.close()
 
-# Global database instance
-db_manager = DatabaseManager()
+# Global database instance (connects on first use, not at import)
+db_manager = LazyObject(DatabaseManager)
@@ -0,0 +1,149 @@
+# Fast HTML card extraction for InternHunt scrapers
+"""
+Reads listing cards out of scraped pages with lxml XPath instead of a full
+BeautifulSoup tree.
+
+A scraper only needs a handful of fields from each card, yet building a
+BeautifulSoup tree for the whole page and running a dozen `select_one` calls
+per card (eight of them just for the description fallback) was most of a
+page's parse time. Here the page is parsed once by libxml2 (lxml.html), every
+CSS selector is translated to XPath once and kept compiled, and text is read
+straight off the lxml tree. benchmarks/bench_card_parsing.py compares this with
+the BeautifulSoup path (full tree and SoupStrainer) on saved pages.
+
+Selectors are the CSS subset the scrapers use: tag, .class, #id, [attr] and
+[attr="value"], combined with descendant (space), child (>) and adjacent
+sibling (+) combinators, and comma-separated groups. Results follow
+BeautifulSoup's semantics: `select` is in document order, `select_one` takes
+the first match, and `text` matches `get_text(sep, strip=True)`, skipping
+script, style and template contents.
+"""
+import re
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+from lxml import etree, html as lxml_html
+
+_TOKEN = re.compile(r"""
+    (?P<combinator>\s*[>+]\s*|\s+)
+  | (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \.(?P<cls>[\w-]+)
+  | \#(?P<id>[\w-]+)
+  | \[(?P<attr>[\w-]+)(?:=(?P<quote>["']?)(?P<value>[^\]"']*)(?P=quote))?\]
+""", re.VERBOSE)
+
+# Strings BeautifulSoup leaves out of get_text()
+_TEXT = etree.XPath(".//text()[not(parent::script or parent::style or ancestor::template)]")
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def _compound_xpath(tag: str, conditions: List[str]) -> str:
+    return tag + ''.join(f"[{c}]" for c in conditions)
+
+
+def _selector_xpath(selector: str) -> str:
+    steps: List[str] = []
+    axis = 'descendant::'
+    tag, conditions = '*', []
+    pos = 0
+    selector = selector.strip()
+    while pos < len(selector):
+        m = _TOKEN.match(selector, pos)
+        if m is None:
+            raise ValueError(f"Unsupported selector {selector!r} at {selector[pos:]!r}")
+        pos = m.end()
+        if m.group('combinator') is not None:
+            steps.append(axis + _compound_xpath(tag, conditions))
+            comb = m.group('combinator').strip()
+            axis = {'>': 'child::', '+': 'following-sibling::*[1]/self::'}.get(comb, 'descendant::')
+            tag, conditions = '*', []
+        elif m.group('tag'):
+            tag = m.group('tag').lower()
+        elif m.group('cls'):
+            conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {m.group('cls')} ')")
+        elif m.group('id'):
+            conditions.append(f"@id={_xpath_literal(m.group('id'))}")
+        elif m.group('value') is not None:
+            conditions.append(f"@{m.group('attr')}={_xpath_literal(m.group('value'))}")
+        else:
+            conditions.append(f"@{m.group('attr')}")
+    steps.append(axis + _compound_xpath(tag, conditions))
+    return '/'.join(steps)
+
+
+def css_to_xpath(selector: str) -> str:
+    """XPath (relative to a context element) for a CSS selector in the supported subset"""
+    groups = [g for g in selector.split(',') if g.strip()]
+    if not groups:
+        raise ValueError("Empty selector")
+    return ' | '.join(_selector_xpath(g) for g in groups)
+
+
+@lru_cache(maxsize=256)
+def compiled(selector: str) -> etree.XPath:
+    """Compiled XPath for a CSS selector; translated once per process"""
+    return etree.XPath(css_to_xpath(selector))
+
+
+def parse_html(text: str):
+    """lxml root element of an HTML page; an empty <html> root when the body has no content"""
+    if not text or not text.strip():
+        return lxml_html.fromstring('<html/>')
+    try:
+        return lxml_html.fromstring(text)
+    except etree.ParserError:
+        # e.g. a page holding only comments: nothing to select from
+        return lxml_html.fromstring('<html/>')
+    except ValueError:
+        # Pages starting with an <?xml encoding=...?> declaration must be parsed from bytes
+        return lxml_html.fromstring(text.encode('utf-8'), parser=lxml_html.HTMLParser(encoding='utf-8'))
+
+
+def select(el, selector: str) -> list:
+    """All elements under `el` matching the selector, in document order"""
+    return compiled(selector)(el) if el is not None else []
+
+
+def select_one(el, selector: str):
+    """First element under `el` matching the selector, or None"""
+    found = select(el, selector)
+    return found[0] if found else None
+
+
+def select_first(el, selectors: Sequence[str]):
+    """Element for the first selector (in priority order) that matches anything, or None"""
+    for sel in selectors:
+        found = select_one(el, sel)
+        if found is not None:
+            return found
+    return None
+
+
+def text(el, sep: str = '') -> str:
+    """Visible text of an element, like BeautifulSoup's get_text(sep, strip=True); '' for None"""
+    if el is None:
+        return ''
+    strings = el.xpath('.//text()') if el.tag in ('script', 'style', 'template') else _TEXT(el)
+    return sep.join(s for s in (t.strip() for t in strings) if s)
+
+
+def first_text(el, selectors: Sequence[str], sep: str = '') -> Optional[str]:
+    """Text of the first selector whose element has any text, or None"""
+    for sel in selectors:
+        found = select_one(el, sel)
+        if found is not None:
+            value = text(found, sep)
+            if value:
+                return value
+    return None
+
+
+def attr(el, name: str) -> Optional[str]:
+    return el.get(name) if el is not None else None
@@ -0,0 +1,483 @@
+# Shared asyncio HTTP fetch engine for InternHunt
+"""
+One event loop, one pooled HTTP client per host, for every outbound request
+made by the job sources (Jooble, the Internshala API, the scrapers).
+
+Previously each call went through a bare `requests.get/post`: a fresh TCP+TLS
+handshake per request and strictly serial execution. Here:
+
+- a single asyncio loop runs in a daemon thread for the whole process;
+- each host gets its own `httpx.AsyncClient` with keep-alive, so repeat
+  requests to jooble.org or internshala.com reuse warm connections;
+- an `asyncio.Semaphore` per host caps in-flight requests to that host
+  (HTTP_PER_HOST_CONCURRENCY, default 4), independent of the other hosts;
+- every request shares one timeout policy (HTTP_TIMEOUT total per request,
+  HTTP_CONNECT_TIMEOUT for the connect phase).
+- a token bucket per host (HTTP_RATE_PER_SEC refill, HTTP_RATE_BURST
+  capacity, per-host overrides in HTTP_HOST_RATE_LIMITS) replaces the fixed
+  `time.sleep(1)` the scrapers used to do after every page: a request waits,
+  on the loop rather than a thread, only when its host's budget is spent.
+  Buckets are process-wide, so every session shares each host's budget.
+- GETs sent with `conditional=True` are revalidated: the ETag/Last-Modified
+  and body bytes of the last 200 for each URL (at most
+  HTTP_CONDITIONAL_CACHE_SIZE URLs, default 64, and HTTP_CONDITIONAL_CACHE_MB
+  of bodies, default 8) are kept, the next request carries If-None-Match /
+  If-Modified-Since, and an unchanged page comes back as status 304 with the
+  stored body, so callers can reuse whatever they derived from it.
+- with HTTP_CASSETTE_MODE=record|replay, clients use the cassette.py transport:
+  responses are recorded to disk, or replayed from it with injected latency
+  and failures, for offline benchmarks.
+
+Synchronous callers (Streamlit script threads, worker threads) use `get`,
+`post` and `fetch_many`; the latter runs all requests concurrently and
+returns when the slowest one finishes. Coroutines can await `afetch`
+directly via `engine.run(...)`. Transport errors are raised as FetchError
+(FetchTimeout for timeouts), so callers don't depend on the HTTP library.
+
+Per-host counters, including rate-limit tokens and wait time, are available
+from `engine.stats()` and in Prometheus format from `render_prometheus()`
+(served with the scoring metrics on METRICS_PORT).
+"""
+import asyncio
+import json
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class FetchError(Exception):
+    """A request could not be completed (connection, protocol or TLS failure)"""
+
+
+class FetchTimeout(FetchError):
+    """A request did not complete within its timeout"""
+
+
+class FetchResponse:
+    """Fully-read response, safe to use from any thread"""
+
+    __slots__ = ('url', 'status_code', 'headers', 'content', 'text', 'elapsed')
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], content: bytes, text: str,
+                 elapsed: float):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.text = text
+        self.elapsed = elapsed
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def __repr__(self) -> str:
+        return f"<FetchResponse [{self.status_code}] {self.url}>"
+
+
+def parse_rate_limits(spec: str) -> Dict[str, tuple]:
+    """Parse "github.com=0.5/2,internshala.com=2/5" into {host: (per_sec, burst)}; bad entries are ignored"""
+    limits: Dict[str, tuple] = {}
+    for part in (spec or '').split(','):
+        host, _, value = part.partition('=')
+        rate, _, burst = value.partition('/')
+        try:
+            limits[host.strip().lower()] = (float(rate), float(burst) if burst else Config.HTTP_RATE_BURST)
+        except ValueError:
+            continue
+    return limits
+
+
+class TokenBucket:
+    """Request budget for one host: `rate` tokens per second, at most `burst` saved up.
+    Used on the engine loop only. Tokens may go negative: each request reserves a slot
+    in arrival order and is told how long to wait for it.
+    """
+
+    __slots__ = ('rate', 'burst', 'tokens', 'updated', 'waits', 'wait_seconds', 'max_wait')
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = max(rate, 1e-6)
+        self.burst = max(burst, 1.0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait = 0.0
+
+    def available(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        return min(self.burst, self.tokens + (now - self.updated) * self.rate)
+
+    def reserve(self) -> float:
+        """Take one token; returns the seconds to wait before using it (0 when within budget)"""
+        now = time.monotonic()
+        self.tokens = self.available(now) - 1.0
+        self.updated = now
+        if self.tokens >= 0:
+            return 0.0
+        delay = -self.tokens / self.rate
+        self.waits += 1
+        self.wait_seconds += delay
+        self.max_wait = max(self.max_wait, delay)
+        return delay
+
+    def refund(self) -> None:
+        # A request cancelled while waiting gives its slot back
+        self.tokens += 1.0
+
+
+class _HostStats:
+    __slots__ = ('requests', 'errors', 'timeouts', 'in_flight', 'seconds', 'not_modified', 'bytes_saved')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.in_flight = 0
+        self.seconds = 0.0
+        self.not_modified = 0
+        self.bytes_saved = 0
+
+
+class FetchEngine:
+    """Event-loop thread plus per-host pooled clients and concurrency limits"""
+
+    def __init__(self, per_host_limit: Optional[int] = None, timeout: Optional[float] = None,
+                 connect_timeout: Optional[float] = None):
+        self.per_host_limit = per_host_limit or Config.HTTP_PER_HOST_CONCURRENCY
+        self.timeout = timeout or Config.HTTP_TIMEOUT
+        self.connect_timeout = connect_timeout or Config.HTTP_CONNECT_TIMEOUT
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        # Created and used on the loop thread only
+        self._clients: Dict[str, Any] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, _HostStats] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        # url -> (etag, last-modified, body bytes, encoding); text is decoded again on a 304
+        self._validated: "OrderedDict[str, Tuple[Optional[str], Optional[str], bytes, Optional[str]]]" = OrderedDict()
+        self.conditional_cache_size = Config.HTTP_CONDITIONAL_CACHE_SIZE
+        self.conditional_cache_bytes = Config.HTTP_CONDITIONAL_CACHE_MB * 2 ** 20
+        self.rate_limits = parse_rate_limits(Config.HTTP_HOST_RATE_LIMITS)
+
+    # ---- loop management ----
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def serve():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=serve, name="http-fetch-loop", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                self._clients, self._semaphores = {}, {}
+            return self._loop
+
+    def run(self, coro, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the engine loop and wait for its result (FetchTimeout after `timeout` s)"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise FetchTimeout(f"gave up after {timeout}s")
+
+    def close(self) -> None:
+        """Close every pooled connection and stop the loop thread"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        async def _close_all():
+            for client in list(self._clients.values()):
+                await client.aclose()
+            self._clients.clear()
+
+        asyncio.run_coroutine_threadsafe(_close_all(), loop).result(10)
+        loop.call_soon_threadsafe(loop.stop)
+
+    # ---- requests ----
+
+    def _client_for(self, host: str):
+        client = self._clients.get(host)
+        if client is None:
+            import httpx
+            limits = httpx.Limits(max_connections=self.per_host_limit,
+                                  max_keepalive_connections=self.per_host_limit, keepalive_expiry=60)
+            transport = None
+            if Config.HTTP_CASSETTE_MODE or 'cassette' in sys.modules:
+                import cassette
+                transport = cassette.transport(limits)
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                limits=limits,
+                follow_redirects=True,
+                transport=transport,
+            )
+            self._clients[host] = client
+            self._semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+            self._stats.setdefault(host, _HostStats())
+        return client
+
+    def _bucket_for(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bare = host.split(':')[0]
+            rate, burst = Config.HTTP_RATE_PER_SEC, Config.HTTP_RATE_BURST
+            for pattern, limit in self.rate_limits.items():
+                if bare == pattern or bare.endswith('.' + pattern):
+                    rate, burst = limit
+                    break
+            bucket = self._buckets[host] = TokenBucket(rate, burst)
+        return bucket
+
+    async def _throttle(self, host: str) -> None:
+        bucket = self._bucket_for(host)
+        delay = bucket.reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                bucket.refund()
+                raise
+
+    def _conditional_headers(self, url: str, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        entry = self._validated.get(url)
+        if entry is None:
+            return headers
+        self._validated.move_to_end(url)
+        etag, last_modified = entry[0], entry[1]
+        headers = dict(headers or {})
+        if etag:
+            headers.setdefault('If-None-Match', etag)
+        if last_modified:
+            headers.setdefault('If-Modified-Since', last_modified)
+        return headers
+
+    def _revalidated(self, url: str, resp, elapsed: float, stats: _HostStats) -> Optional[FetchResponse]:
+        """Response for a conditional GET; None for a 304 whose stored body has since been evicted"""
+        headers = dict(resp.headers)
+        etag_now, modified_now = resp.headers.get('etag'), resp.headers.get('last-modified')
+        if resp.status_code == 304 and url in self._validated:
+            etag, last_modified, content, encoding = self._validated[url]
+            stats.not_modified += 1
+            stats.bytes_saved += len(content)
+            # A 304 may carry fresher validators
+            self._validated[url] = (etag_now or etag, modified_now or last_modified, content, encoding)
+            text = content.decode(encoding or 'utf-8', errors='replace')
+            return FetchResponse(str(resp.url), 304, headers, content, text, elapsed)
+        if resp.status_code == 304:
+            return None
+        if resp.status_code == 200 and (etag_now or modified_now):
+            self._validated[url] = (etag_now, modified_now, resp.content, resp.encoding)
+            self._validated.move_to_end(url)
+            stored = sum(len(entry[2]) for entry in self._validated.values())
+            while self._validated and (len(self._validated) > self.conditional_cache_size or
+                                       stored > self.conditional_cache_bytes):
+                stored -= len(self._validated.popitem(last=False)[1][2])
+        elif resp.status_code == 200:
+            self._validated.pop(url, None)
+        return FetchResponse(str(resp.url), resp.status_code, headers, resp.content, resp.text, elapsed)
+
+    async def afetch(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                     params: Optional[Dict[str, Any]] = None, data: Union[str, bytes, None] = None,
+                     json_body: Any = None, timeout: Optional[float] = None,
+                     conditional: bool = False) -> FetchResponse:
+        """Send one request through the host's pooled client (call on the engine loop).
+        With `conditional` (GET only), an unchanged page is returned as status 304 with the stored body.
+        """
+        import httpx
+        host = urlsplit(url).netloc.lower()
+        client = self._client_for(host)
+        stats = self._stats[host]
+        conditional = conditional and method.upper() == 'GET' and not params and self.conditional_cache_size > 0
+        plain_headers = headers
+        if conditional:
+            headers = self._conditional_headers(url, headers)
+        kwargs: Dict[str, Any] = {'headers': headers, 'params': params, 'content': data, 'json': json_body}
+        if timeout is not None:
+            kwargs['timeout'] = httpx.Timeout(timeout, connect=min(timeout, self.connect_timeout))
+        await self._throttle(host)
+        async with self._semaphores[host]:
+            stats.requests += 1
+            stats.in_flight += 1
+            started = time.perf_counter()
+            try:
+                resp = await client.request(method, url, **kwargs)
+                if conditional:
+                    result = self._revalidated(url, resp, time.perf_counter() - started, stats)
+                    if result is None:
+                        # The stored body was evicted while this request waited: fetch the page in full
+                        stats.requests += 1
+                        resp = await client.request(method, url, **dict(kwargs, headers=plain_headers))
+                        result = self._revalidated(url, resp, time.perf_counter() - started, stats)
+                    if result is None:
+                        stats.errors += 1
+                        raise FetchError(f"{method} {url} returned 304 without a stored body")
+                    return result
+                return FetchResponse(str(resp.url), resp.status_code, dict(resp.headers), resp.content,
+                                     resp.text, time.perf_counter() - started)
+            except httpx.TimeoutException as e:
+                stats.timeouts += 1
+                raise FetchTimeout(f"{method} {url} timed out: {e!r}") from e
+            except httpx.HTTPError as e:
+                stats.errors += 1
+                raise FetchError(f"{method} {url} failed: {e!r}") from e
+            finally:
+                stats.in_flight -= 1
+                stats.seconds += time.perf_counter() - started
+
+    def _afetch_request(self, request: Dict[str, Any]):
+        return self.afetch(request.get('method', 'GET'), request['url'],
+                           **{k: v for k, v in request.items() if k not in ('method', 'url')})
+
+    def fetch(self, method: str, url: str, **kwargs) -> FetchResponse:
+        return self.run(self.afetch(method, url, **kwargs))
+
+    def fetch_many(self, requests: Sequence[Dict[str, Any]],
+                   timeout: Optional[float] = None) -> List[Union[FetchResponse, Exception]]:
+        """Send all requests concurrently; each item is a response or the exception it raised.
+        `requests` are afetch keyword dicts (method defaults to GET). With `timeout`, requests still
+        running at the deadline are cancelled and reported as FetchTimeout.
+        """
+        async def _all():
+            tasks = [asyncio.ensure_future(self._afetch_request(r)) for r in requests]
+            if not tasks:
+                return []
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+            for t in pending:
+                t.cancel()
+            results: List[Union[FetchResponse, Exception]] = []
+            for t in tasks:
+                if t in pending:
+                    results.append(FetchTimeout(f"deadline of {timeout}s reached"))
+                elif t.exception() is not None:
+                    results.append(t.exception())
+                else:
+                    results.append(t.result())
+            return results
+
+        return self.run(_all())
+
+    def fetch_until(self, requests: Sequence[Dict[str, Any]],
+                    on_result: Callable[[int, Union[FetchResponse, Exception]], bool],
+                    concurrency: int, timeout: Optional[float] = None) -> List[Union[FetchResponse, Exception, None]]:
+        """Send requests in order with at most `concurrency` in flight, stopping early.
+        `on_result(index, response_or_exception)` runs on the engine loop as each request finishes;
+        returning True cancels everything still running and launches nothing more. With `timeout`,
+        the whole fan-out is abandoned at the deadline. Requests never completed are None.
+        """
+        async def _sweep():
+            loop = asyncio.get_running_loop()
+            deadline = None if timeout is None else loop.time() + timeout
+            results: List[Union[FetchResponse, Exception, None]] = [None] * len(requests)
+            queue = iter(enumerate(requests))
+            running: Dict[asyncio.Future, int] = {}
+            stop = False
+
+            def launch():
+                while len(running) < max(1, concurrency):
+                    nxt = next(queue, None)
+                    if nxt is None:
+                        return
+                    running[asyncio.ensure_future(self._afetch_request(nxt[1]))] = nxt[0]
+
+            launch()
+            while running and not stop:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    break
+                done, _ = await asyncio.wait(running, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    i = running.pop(t)
+                    results[i] = t.exception() or t.result()
+                    stop = bool(on_result(i, results[i])) or stop
+                if not stop:
+                    launch()
+            for t in running:
+                t.cancel()
+            return results
+
+        return self.run(_sweep())
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host request counters and rate-limit state"""
+        out = {}
+        for host, s in list(self._stats.items()):
+            row = {'requests': s.requests, 'errors': s.errors, 'timeouts': s.timeouts,
+                   'in_flight': s.in_flight, 'seconds': round(s.seconds, 4),
+                   'not_modified': s.not_modified, 'bytes_saved': s.bytes_saved}
+            bucket = self._buckets.get(host)
+            if bucket is not None:
+                row.update(rate_per_sec=bucket.rate, rate_burst=bucket.burst,
+                           rate_tokens=round(bucket.available(), 3), rate_waits=bucket.waits,
+                           rate_wait_seconds=round(bucket.wait_seconds, 4), rate_max_wait=round(bucket.max_wait, 4))
+            out[host] = row
+        return out
+
+
+engine = FetchEngine()
+
+
+def get(url: str, **kwargs) -> FetchResponse:
+    """GET through the shared engine (blocking)"""
+    return engine.fetch('GET', url, **kwargs)
+
+
+def post(url: str, **kwargs) -> FetchResponse:
+    """POST through the shared engine (blocking)"""
+    return engine.fetch('POST', url, **kwargs)
+
+
+def fetch_many(requests: Sequence[Dict[str, Any]], timeout: Optional[float] = None) -> List[Union[FetchResponse, Exception]]:
+    """Concurrent requests through the shared engine (blocking until all finish or `timeout`)"""
+    return engine.fetch_many(requests, timeout)
+
+
+def render_prometheus() -> str:
+    """Per-host fetch and rate-limit metrics in Prometheus text exposition format"""
+    snap = engine.stats()
+    metrics = [
+        ('internhunt_http_requests_total', 'counter', 'Requests sent per host', 'requests'),
+        ('internhunt_http_errors_total', 'counter', 'Requests that failed (excluding timeouts) per host', 'errors'),
+        ('internhunt_http_timeouts_total', 'counter', 'Requests that timed out per host', 'timeouts'),
+        ('internhunt_http_in_flight', 'gauge', 'Requests currently in flight per host', 'in_flight'),
+        ('internhunt_http_request_seconds_sum', 'counter', 'Wall time spent in requests per host', 'seconds'),
+        ('internhunt_http_not_modified_total', 'counter', 'Conditional GETs answered 304 Not Modified per host', 'not_modified'),
+        ('internhunt_http_bytes_saved_total', 'counter', 'Body bytes not downloaded thanks to 304 responses per host', 'bytes_saved'),
+        ('internhunt_http_rate_tokens', 'gauge', 'Rate-limit tokens currently available per host', 'rate_tokens'),
+        ('internhunt_http_rate_waits_total', 'counter', 'Requests delayed by the rate limiter per host', 'rate_waits'),
+        ('internhunt_http_rate_wait_seconds_total', 'counter', 'Total rate-limit delay per host', 'rate_wait_seconds'),
+        ('internhunt_http_rate_wait_seconds_max', 'gauge', 'Longest rate-limit delay per host', 'rate_max_wait'),
+    ]
+    lines: List[str] = []
+    for metric, kind, help_text, key in metrics:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for host in sorted(snap):
+            if key in snap[host]:
+                lines.append(f'{metric}{{host="{host}"}} {snap[host][key]}')
+    return "\n".join(lines) + "\n"
+
+
+if Config.METRICS_PORT:
+    from profiling import ScoringProfiler
+    ScoringProfiler.register_collector(render_prometheus)
+    ScoringProfiler.start_metrics_server(Config.METRICS_PORT)
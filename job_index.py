@@ -0,0 +1,183 @@
+# Persistent local job index for InternHunt
+"""
+A SQLite store of every job listing fetched from Jooble, the Internshala API
+and the scrapers, so repeated searches are served locally instead of
+re-hitting the sites.
+
+- `jobs`: one row per (normalized URL, source) with the listing as JSON (for
+  scraped sites, the card fields parsed by scraper_engine) and
+  first_seen / last_seen timestamps. `source` is the fetcher that produced it
+  (jooble, internshala_api, internshala, internshala_keywords, github,
+  remoteok; internshala_detail holds summaries taken from detail pages); rows
+  are upserted, so a listing seen again only moves last_seen.
+- `queries`: one row per search key (a whole fetcher call or one result page) with the ordered
+  listing keys of its last successful fetch and when that fetch happened.
+
+This module is the disk tier of the search cache (query_cache.py), which
+decides when a stored answer is fresh, stale (served and refreshed in the
+background) or too old.
+
+Configure the location with JOB_INDEX_PATH (default
+.model_cache/job_index.sqlite3).
+
+CLI:
+    python job_index.py stats                 # rows per source, oldest/newest query
+    python job_index.py prune [--days 30]     # drop listings not seen for N days
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+_db_lock = threading.Lock()
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a listing URL: lowercase scheme/host, no fragment or trailing slash"""
+    parts = urlsplit((url or '').strip())
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8', 'ignore')).hexdigest()
+
+
+def listing_key(job: Dict[str, Any]) -> str:
+    """Stable key of a listing: its normalized URL, or a hash of its content when it has none"""
+    url = job.get('url') or job.get('link') or ''
+    if url and url != '#':
+        return normalize_url(url)
+    return 'sha256:' + _sha256(json.dumps(job, sort_keys=True, default=str))
+
+
+def _normalize_arg(value: Any) -> Any:
+    if isinstance(value, str):
+        return ' '.join(value.lower().split())
+    if isinstance(value, (list, tuple)):
+        return [_normalize_arg(v) for v in value if v]
+    return value
+
+
+def query_key(source: str, args: Sequence[Any], kwargs: Dict[str, Any]) -> str:
+    """Key of one search: source plus case/whitespace-normalized arguments"""
+    payload = [source, [_normalize_arg(a) for a in args], {k: _normalize_arg(v) for k, v in sorted(kwargs.items())}]
+    return json.dumps(payload, default=str, separators=(',', ':'))
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS jobs ("
+        " url_key TEXT NOT NULL, source TEXT NOT NULL, data TEXT NOT NULL,"
+        " first_seen REAL NOT NULL, last_seen REAL NOT NULL, PRIMARY KEY (url_key, source))"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS queries ("
+        " query_key TEXT PRIMARY KEY, source TEXT NOT NULL, url_keys TEXT NOT NULL, fetched_at REAL NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen)")
+    return conn
+
+
+def upsert_jobs(source: str, jobs: Sequence[Dict[str, Any]], path: Optional[str] = None,
+                now: Optional[float] = None) -> List[str]:
+    """Insert or refresh listings; returns their keys in input order"""
+    path = path or Config.JOB_INDEX_PATH
+    now = time.time() if now is None else now
+    keys = [listing_key(j) for j in jobs]
+    with _db_lock, closing(_connect(path)) as conn, conn:
+        conn.executemany(
+            "INSERT INTO jobs (url_key, source, data, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (url_key, source) DO UPDATE SET data = excluded.data, last_seen = excluded.last_seen",
+            [(k, source, json.dumps(j, default=str), now, now) for k, j in zip(keys, jobs)],
+        )
+    return keys
+
+
+def record_query(key: str, source: str, jobs: Sequence[Dict[str, Any]], path: Optional[str] = None) -> None:
+    """Upsert a fetch result and remember it as the latest answer to `key`"""
+    path = path or Config.JOB_INDEX_PATH
+    now = time.time()
+    keys = upsert_jobs(source, jobs, path, now)
+    with _db_lock, closing(_connect(path)) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO queries (query_key, source, url_keys, fetched_at) VALUES (?, ?, ?, ?)",
+            (key, source, json.dumps(keys), now),
+        )
+
+
+def lookup_query(key: str, path: Optional[str] = None) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+    """(listings, age in seconds) of the last successful fetch for `key`, or None"""
+    path = path or Config.JOB_INDEX_PATH
+    if not os.path.exists(path):
+        return None
+    with _db_lock, closing(_connect(path)) as conn:
+        row = conn.execute("SELECT source, url_keys, fetched_at FROM queries WHERE query_key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        source, url_keys, fetched_at = row
+        keys = json.loads(url_keys)
+        found: Dict[str, Dict[str, Any]] = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            rows = conn.execute(
+                f"SELECT url_key, data FROM jobs WHERE source = ? AND url_key IN ({','.join('?' * len(chunk))})",
+                [source] + chunk,
+            ).fetchall()
+            found.update((k, json.loads(data)) for k, data in rows)
+    return [found[k] for k in keys if k in found], time.time() - fetched_at
+
+
+def stats(path: Optional[str] = None) -> Dict[str, Any]:
+    """Listing and query counts per source"""
+    path = path or Config.JOB_INDEX_PATH
+    if not os.path.exists(path):
+        return {'path': path, 'sources': {}}
+    with _db_lock, closing(_connect(path)) as conn:
+        jobs = conn.execute("SELECT source, COUNT(*), MIN(first_seen), MAX(last_seen) FROM jobs GROUP BY source").fetchall()
+        queries = dict(conn.execute("SELECT source, COUNT(*) FROM queries GROUP BY source").fetchall())
+    return {'path': path, 'sources': {
+        src: {'listings': n, 'queries': queries.get(src, 0), 'first_seen': first, 'last_seen': last}
+        for src, n, first, last in jobs
+    }}
+
+
+def prune(max_age_days: float = 30, path: Optional[str] = None) -> int:
+    """Delete listings not seen for `max_age_days` and queries fetched before then; returns listings removed"""
+    path = path or Config.JOB_INDEX_PATH
+    if not os.path.exists(path):
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    with _db_lock, closing(_connect(path)) as conn, conn:
+        removed = conn.execute("DELETE FROM jobs WHERE last_seen < ?", (cutoff,)).rowcount
+        conn.execute("DELETE FROM queries WHERE fetched_at < ?", (cutoff,))
+    return removed
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) >= 2 else ''
+    if cmd == 'stats':
+        info = stats()
+        print(info['path'])
+        for src, s in sorted(info['sources'].items()):
+            print(f"{src:<22} {s['listings']:>6} listings {s['queries']:>5} queries  "
+                  f"last seen {time.strftime('%Y-%m-%d %H:%M', time.localtime(s['last_seen']))}")
+    elif cmd == 'prune':
+        days = float(sys.argv[3]) if len(sys.argv) >= 4 and sys.argv[2] == '--days' else 30
+        print(f"removed {prune(days)} listings")
+    else:
+        print("Usage: python job_index.py stats | prune [--days 30]")
@@ -0,0 +1,254 @@
+# Category keyword matching for job listings in InternHunt
+"""
+Relevance filter that ranks fetched jobs against the predicted resume category.
+
+Each category's core and related keywords are compiled once into a single
+pattern (per "layer", see `CategoryKeywordIndex`), so a job is scanned in one
+pass that reports which keywords hit in the title and which hit anywhere in
+the job text. Scoring and ranking are the same as the original per-keyword
+regex scan in App.py:
+
+    title: +5 per core keyword, +2 per related keyword
+    body (title + description + company + tags): +3 per core, +1 per related
+    kept if any core keyword hits, the title scores >= 3, or the total is >= 4
+
+Benchmark: python benchmarks/bench_category_filter.py
+"""
+import re
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+CORE_TITLE_WEIGHT = 5
+RELATED_TITLE_WEIGHT = 2
+CORE_BODY_WEIGHT = 3
+RELATED_BODY_WEIGHT = 1
+
+CATEGORY_KEYWORDS: Dict[str, Dict[str, List[str]]] = {
+    # --- Core Developer Roles ---
+    'Java Developer': {
+        'core': ['java', 'spring', 'jvm', 'kotlin'],
+        'related': ['backend', 'software', 'developer', 'engineer']
+    },
+    'Python Developer': {
+        'core': ['python', 'django', 'flask'],
+        'related': ['backend', 'software', 'developer', 'ai', 'ml']
+    },
+    'Web Designing': {
+        'core': ['web', 'frontend', 'ui', 'ux', 'html', 'css'],
+        'related': ['react', 'angular', 'vue', 'javascript', 'designer']
+    },
+    'Full Stack Developer': {
+        'core': ['full stack', 'mern', 'mean', 'frontend', 'backend'],
+        'related': ['react', 'node', 'express', 'django', 'api']
+    },
+    'Android Developer': {
+        'core': ['android', 'kotlin', 'java', 'mobile'],
+        'related': ['flutter', 'compose']
+    },
+    'iOS Developer': {
+        'core': ['ios', 'swift', 'swiftui', 'xcode'],
+        'related': ['mobile', 'app', 'developer']
+    },
+
+    # --- Data & AI ---
+    'Data Science': {
+        'core': ['data', 'scientist', 'analytics', 'analysis'],
+        'related': ['machine learning', 'ml', 'ai', 'insight', 'python', 'sql']
+    },
+    'Machine Learning Engineer': {
+        'core': ['machine learning', 'ml', 'ai', 'neural'],
+        'related': ['pytorch', 'tensorflow', 'deep learning']
+    },
+    'AI Engineer': {
+        'core': ['ai', 'artificial intelligence', 'ml', 'deep learning'],
+        'related': ['llm', 'nlp', 'vision', 'transformer']
+    },
+    'Data Engineer': {
+        'core': ['data engineer', 'pipeline', 'etl', 'big data'],
+        'related': ['airflow', 'spark', 'hadoop', 'aws glue', 'kafka']
+    },
+    'Business Analyst': {
+        'core': ['business analyst', 'data', 'requirements', 'insights'],
+        'related': ['excel', 'tableau', 'power bi']
+    },
+
+    # --- Cloud & DevOps ---
+    'DevOps Engineer': {
+        'core': ['devops', 'ci/cd', 'docker', 'kubernetes'],
+        'related': ['aws', 'azure', 'gcp', 'infrastructure', 'terraform']
+    },
+    'Cloud Engineer': {
+        'core': ['cloud', 'aws', 'azure', 'gcp', 'infrastructure'],
+        'related': ['devops', 'serverless', 'kubernetes', 'docker']
+    },
+    'Site Reliability Engineer': {
+        'core': ['sre', 'reliability', 'monitoring'],
+        'related': ['devops', 'cloud', 'automation']
+    },
+
+    # --- Cybersecurity ---
+    'Network Security Engineer': {
+        'core': ['network', 'security', 'cyber'],
+        'related': ['infosec', 'pentesting', 'firewall', 'ethical hacking']
+    },
+    'Cybersecurity Analyst': {
+        'core': ['cybersecurity', 'security analyst', 'threat', 'incident'],
+        'related': ['vulnerability', 'forensics', 'malware', 'siem']
+    },
+    'Ethical Hacker': {
+        'core': ['ethical hacker', 'pentest', 'penetration testing'],
+        'related': ['bug bounty', 'offensive security', 'owasp']
+    },
+
+    # --- Blockchain & Web3 ---
+    'Blockchain Developer': {
+        'core': ['blockchain', 'web3', 'solidity', 'crypto'],
+        'related': ['ethereum', 'smart contract', 'defi']
+    },
+    'Web3 Developer': {
+        'core': ['web3', 'blockchain', 'solidity'],
+        'related': ['dapp', 'nft', 'crypto']
+    },
+
+    # --- UI/UX & Creative ---
+    'UI/UX Designer': {
+        'core': ['ui', 'ux', 'figma', 'design'],
+        'related': ['prototype', 'wireframe', 'adobe', 'user research']
+    },
+
+    # --- Other Tech Roles ---
+    'Database': {
+        'core': ['database', 'dba', 'sql'],
+        'related': ['oracle', 'mongodb', 'mysql', 'postgresql']
+    },
+    'Testing': {
+        'core': ['testing', 'qa', 'quality', 'automation'],
+        'related': ['selenium', 'software', 'engineer']
+    },
+    'SAP Developer': {
+        'core': ['sap', 'erp'],
+        'related': ['developer', 'abap']
+    },
+    'Operations Manager': {
+        'core': ['operations', 'manager'],
+        'related': ['project', 'business', 'process']
+    },
+}
+
+def keyword_pattern(keyword: str) -> str:
+    """Regex for a keyword tolerant to plural, hyphen and spacing variations"""
+    return r'\b' + re.escape(keyword).replace(r'\-', r'[-\s]?') + r's?\b'
+
+
+class CategoryKeywordIndex:
+    """Compiled matcher for one category's core and related keywords.
+
+    Keywords are combined into one alternation inside a lookahead at word
+    boundaries, so a single `finditer` reports every keyword start (including
+    overlapping ones such as "big data" / "data engineer"). Two keywords that
+    can match at the same position (one a prefix of the other, e.g. "data" and
+    "data engineer") go into separate layers, since an alternation reports
+    only one of them per position.
+    """
+
+    def __init__(self, core: Sequence[str], related: Sequence[str]):
+        self.core = tuple(core)
+        self.related = tuple(related)
+        self.keywords = tuple(dict.fromkeys(k.lower() for k in self.core + self.related))
+        self._core_set = {k.lower() for k in self.core}
+        self._related_set = {k.lower() for k in self.related}
+        self.patterns = [self._compile(layer) for layer in self._layers(self.keywords)]
+
+    @staticmethod
+    def _layers(keywords: Sequence[str]) -> List[List[str]]:
+        layers: List[List[str]] = []
+        for kw in keywords:
+            for layer in layers:
+                if not any(kw.startswith(other) or other.startswith(kw) for other in layer):
+                    layer.append(kw)
+                    break
+            else:
+                layers.append([kw])
+        return layers
+
+    def _compile(self, layer: List[str]) -> "re.Pattern":
+        alternatives = '|'.join(
+            f"(?P<k{self.keywords.index(kw)}>{keyword_pattern(kw)})" for kw in layer
+        )
+        # Texts are lowercased before matching, so no IGNORECASE; the first-character
+        # class lets the engine skip word starts that cannot begin any keyword
+        first_chars = ''.join(sorted({re.escape(kw[0]) for kw in layer}))
+        return re.compile(r'\b(?=[' + first_chars + r'])(?=' + alternatives + ')')
+
+    def hits(self, text: str, title_len: int) -> Tuple[Set[str], Set[str]]:
+        """(keywords matched entirely within text[:title_len], keywords matched anywhere).
+        `text` must already be lowercased."""
+        in_title: Set[str] = set()
+        anywhere: Set[str] = set()
+        for pattern in self.patterns:
+            for m in pattern.finditer(text):
+                group = m.lastgroup
+                kw = self.keywords[int(group[1:])]
+                anywhere.add(kw)
+                if m.end(group) <= title_len:
+                    in_title.add(kw)
+        return in_title, anywhere
+
+    def score_job(self, job: Dict[str, Any]) -> Tuple[int, bool]:
+        """(total score, keep) for a job dict, same rules as the module docstring"""
+        title = (job.get('title', '') or '').lower().replace('-', ' ')
+        description = (job.get('description', '') or '').lower().replace('-', ' ')
+        company = (job.get('company', '') or '').lower()
+        tags = ' '.join(job.get('tags', [])).lower()
+        job_text = f"{title} {description} {company} {tags}"
+
+        in_title, anywhere = self.hits(job_text, len(title))
+        title_score = (CORE_TITLE_WEIGHT * len(in_title & self._core_set)
+                       + RELATED_TITLE_WEIGHT * len(in_title & self._related_set))
+        body_score = (CORE_BODY_WEIGHT * len(anywhere & self._core_set)
+                      + RELATED_BODY_WEIGHT * len(anywhere & self._related_set))
+        total_score = title_score + body_score
+        has_core = bool(anywhere & self._core_set)
+        return total_score, has_core or title_score >= 3 or total_score >= 4
+
+
+_INDEXES: Dict[str, CategoryKeywordIndex] = {}
+
+
+def get_category_index(category: str) -> Optional[CategoryKeywordIndex]:
+    """Compiled index for `category` (built once per process), or None if unknown"""
+    index = _INDEXES.get(category)
+    if index is None:
+        keyword_set = CATEGORY_KEYWORDS.get(category, {})
+        if not keyword_set.get('core') and not keyword_set.get('related'):
+            return None
+        index = _INDEXES[category] = CategoryKeywordIndex(keyword_set.get('core', []), keyword_set.get('related', []))
+    return index
+
+
+def filter_jobs_by_category(jobs, predicted_category):
+    """
+    Filter and rank jobs based on how relevant they are to the predicted career category.
+    Uses weighted keyword matching (core vs related), fuzzy matching, and adaptive fallback.
+    """
+    if not predicted_category or not jobs:
+        return jobs
+
+    index = get_category_index(predicted_category)
+    if index is None:
+        return jobs  # no filtering if unknown category
+
+    scored_jobs = []
+    for job in jobs:
+        total_score, keep = index.score_job(job)
+        if keep:
+            scored_jobs.append((job, total_score))
+
+    # Stable sort: equal scores keep their fetch order
+    scored_jobs.sort(key=lambda x: x[1], reverse=True)
+    filtered_jobs = [job for job, score in scored_jobs]
+
+    # If filtering removes too many jobs, fallback to original list
+    if len(filtered_jobs) < max(3, len(jobs) * 0.2):
+        return jobs
+
+    return filtered_jobs if filtered_jobs else jobs
@@ -0,0 +1,176 @@
+# BM25 relevance ranking for job listings in InternHunt
+"""
+Ranks a fetched batch of jobs against the resume (skills + predicted category).
+
+A small inverted index is built over the batch in one pass over the text
+(title, description, tags, company), then jobs are scored with BM25F:
+per-field term frequencies are length-normalized, weighted by field and
+summed before BM25 saturation, so a skill in the title counts more than the
+same skill deep in the description, and common words in this batch (low IDF)
+count little.
+
+Field weights are tunable per call or globally with
+JOB_RANK_FIELD_WEIGHTS="title=3,tags=2,description=1,company=0.5".
+
+Benchmark: python benchmarks/bench_job_ranker.py
+"""
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config import Config
+from job_matching import CATEGORY_KEYWORDS
+
+FIELDS = ('title', 'description', 'tags', 'company')
+DEFAULT_FIELD_WEIGHTS: Dict[str, float] = {'title': 3.0, 'description': 1.0, 'tags': 2.0, 'company': 0.5}
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+# Query term weights by origin
+SKILL_WEIGHT = 1.0
+CATEGORY_CORE_WEIGHT = 1.0
+CATEGORY_RELATED_WEIGHT = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+
+def _normalize(token: str) -> str:
+    # Light plural folding so "developers" matches "developer"; short tokens (aws, sas),
+    # skill spellings (node.js) and -ss/-is/-us words (analysis) are left alone
+    if len(token) > 4 and token.isalpha() and token.endswith('s') and not token.endswith(('ss', 'is', 'us')):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens; keeps c++, c#, node.js and similar skill spellings intact"""
+    return [_normalize(t) for t in _TOKEN_RE.findall((text or '').lower().replace('-', ' '))]
+
+
+def parse_field_weights(spec: str) -> Dict[str, float]:
+    """Parse "title=3,tags=2" into a weights dict (unknown fields and bad values are ignored)"""
+    weights: Dict[str, float] = {}
+    for part in (spec or '').split(','):
+        name, _, value = part.partition('=')
+        name = name.strip().lower()
+        if name in FIELDS:
+            try:
+                weights[name] = float(value)
+            except ValueError:
+                continue
+    return weights
+
+
+def configured_field_weights() -> Dict[str, float]:
+    weights = dict(DEFAULT_FIELD_WEIGHTS)
+    weights.update(parse_field_weights(Config.JOB_RANK_FIELD_WEIGHTS))
+    return weights
+
+
+def field_text(job: Dict[str, Any], field: str) -> str:
+    """Text of one ranked field of a job dict"""
+    if field == 'tags':
+        tags = job.get('tags') or []
+        return ' '.join(tags) if isinstance(tags, (list, tuple)) else str(tags)
+    if field == 'description':
+        # Jooble results carry the text as `snippet`
+        return job.get('description') or job.get('snippet') or ''
+    return job.get(field) or ''
+
+
+class BM25JobIndex:
+    """Inverted index over one batch of jobs, scored with BM25F"""
+
+    def __init__(self, jobs: Sequence[Dict[str, Any]], field_weights: Optional[Dict[str, float]] = None,
+                 k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        self.jobs = list(jobs)
+        self.field_weights = {f: w for f, w in (field_weights or configured_field_weights()).items()
+                              if f in FIELDS and w > 0}
+        self.k1 = k1
+        self.b = b
+
+        # One pass over the text: per-field term counts and lengths
+        postings: Dict[str, List[Tuple[int, str, int]]] = {}
+        lengths: Dict[str, List[int]] = {f: [] for f in self.field_weights}
+        for doc_id, job in enumerate(self.jobs):
+            for field in self.field_weights:
+                tokens = tokenize(field_text(job, field))
+                lengths[field].append(len(tokens))
+                for term, tf in Counter(tokens).items():
+                    postings.setdefault(term, []).append((doc_id, field, tf))
+
+        avg = {f: (sum(ls) / len(ls) if ls and sum(ls) else 1.0) for f, ls in lengths.items()}
+        n_docs = len(self.jobs)
+        # term -> {doc_id: length-normalized, field-weighted tf}; idf per term
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._idf: Dict[str, float] = {}
+        for term, entries in postings.items():
+            weighted: Dict[int, float] = {}
+            for doc_id, field, tf in entries:
+                norm = 1.0 - self.b + self.b * lengths[field][doc_id] / avg[field]
+                weighted[doc_id] = weighted.get(doc_id, 0.0) + self.field_weights[field] * tf / norm
+            self._postings[term] = weighted
+            df = len(weighted)
+            self._idf[term] = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def scores(self, query: Dict[str, float]) -> List[float]:
+        """BM25F score of every job (index order) for weighted query terms"""
+        out = [0.0] * len(self.jobs)
+        for term, q_weight in query.items():
+            docs = self._postings.get(term)
+            if not docs:
+                continue
+            idf = self._idf[term] * q_weight
+            for doc_id, tf in docs.items():
+                out[doc_id] += idf * tf * (self.k1 + 1.0) / (tf + self.k1)
+        return out
+
+    def rank(self, query: Dict[str, float]) -> List[Tuple[Dict[str, Any], float]]:
+        """(job, score) pairs, best first; ties keep fetch order"""
+        scored = list(zip(self.jobs, self.scores(query)))
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return scored
+
+
+def build_query(skills: Iterable[str] = (), predicted_category: Optional[str] = None,
+                extra_text: str = '') -> Dict[str, float]:
+    """Weighted query terms from resume skills, the predicted category's keywords and free text"""
+    query: Dict[str, float] = {}
+
+    def add(text: str, weight: float) -> None:
+        for term in tokenize(text):
+            query[term] = max(query.get(term, 0.0), weight)
+
+    for skill in skills or ():
+        if isinstance(skill, str):
+            add(skill, SKILL_WEIGHT)
+    add(extra_text, SKILL_WEIGHT)
+    keyword_set = CATEGORY_KEYWORDS.get(predicted_category or '', {})
+    for kw in keyword_set.get('core', []):
+        add(kw, CATEGORY_CORE_WEIGHT)
+    for kw in keyword_set.get('related', []):
+        add(kw, CATEGORY_RELATED_WEIGHT)
+    return query
+
+
+def rank_jobs(jobs: Sequence[Dict[str, Any]], skills: Iterable[str] = (), predicted_category: Optional[str] = None,
+              extra_text: str = '', field_weights: Optional[Dict[str, float]] = None,
+              drop_unmatched: bool = False) -> List[Dict[str, Any]]:
+    """Jobs ordered by BM25F relevance to the resume.
+    With `drop_unmatched`, jobs matching no query term are removed, unless that would remove all of them.
+    """
+    if not jobs:
+        return list(jobs or [])
+    query = build_query(skills, predicted_category, extra_text)
+    if not query:
+        return list(jobs)
+    ranked = BM25JobIndex(jobs, field_weights).rank(query)
+    if drop_unmatched:
+        matched = [job for job, score in ranked if score > 0]
+        if matched:
+            return matched
+    return [job for job, _ in ranked]
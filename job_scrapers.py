@@ -6,7 +6,8 @@ Sources implemented:
 - GitHub repositories (signals like topics: internship/hiring)
 - RemoteOK (jobs/internships)
 
-Each scraper returns a list of normalized job dicts:
+Each scraper returns a list of normalized job dicts (served from and recorded
+in the local job index, see job_index.py):
 {
   'title': str,
   'company': str,
@@ -17,251 +18,377 @@ Each scraper returns a list of normalized job dicts:
   'url': str,
   'source': str,
 }
+
+Each site is declared as a SiteAdapter (result page URL, card selector, field
+selectors, skill-match fields, job builder) and run by scraper_engine, which
+fetches a search's pages concurrently through http_fetch (pooled, per-host
+rate limits, no fixed sleep between pages), caches parsed pages and keeps
+per-site metrics. Adding a site means adding an adapter here.
 """
 from __future__ import annotations
 
-import time
+import json
 import re
-from typing import List, Dict, Optional
-import requests
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+from urllib.parse import quote, quote_plus
 from bs4 import BeautifulSoup
 
+import http_fetch
+from config import Config
+from job_index import normalize_url
+from query_cache import QueryCache
+from job_sources import SourceStatus, run_sources
+from scraper_engine import Field, SiteAdapter, scrape
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0 Safari/537.36"
 }
 
 
-def _match_any(text: str, keywords: List[str]) -> bool:
-    if not keywords:
-        return True
-    t = (text or "").lower()
-    return any(kw.lower() in t for kw in keywords)
+# ---------------- Internshala ----------------
 
+def _duration(details: Optional[List[str]]) -> Optional[str]:
+    # Heuristic: the first detail item that reads like a duration
+    for t in details or []:
+        if any(x in t.lower() for x in ["month", "week", "day"]):
+            return t
+    return None
+
+
+INTERNSHALA_FIELDS = {
+    "title": Field("a.job-title", "h3 a", default="Internship"),
+    "company": Field("a.link_display_like_text", "div.company_name", default=""),
+    "location": Field("a.location_link", "span#location_names", default=""),
+    "stipend": Field("span.stipend", "div.stipend"),
+    "duration": Field("div.other_detail_item, span.other_detail_item", sep=" ", many=True, transform=_duration),
+    # Short summary/snippet on the card, in order of preference
+    "description": Field(
+        "div.job-snippet", "div#job-snippet", "div.job-description", "div.desc", "div.internship_about",
+        "div.text-ellipsis", "div.collapse", "div.job-snippet-container", sep=" ", skip_empty=True,
+    ),
+    "href": Field("a.view_detail_button", "a.job-title", attr="href"),
+}
+INTERNSHALA_CARD = "div.container-fluid.individual_internship"
+
+
+def _internshala_listing_url(params: Dict[str, Any], page: int) -> str:
+    location = params.get("location")
+    return f"https://internshala.com/internships?page={page}" + (f"&location={quote(location)}" if location else "")
+
+
+def _internshala_keywords_url(params: Dict[str, Any], page: int) -> str:
+    q = quote_plus((params.get("keywords") or "").strip())
+    loc = quote_plus((params.get("location") or "India").strip())
+    base = f"https://internshala.com/internships/keywords-{q}/in-{loc}"
+    return base if page == 1 else f"{base}?page={page}"
+
+
+INTERNSHALA = SiteAdapter(
+    name="internshala",
+    url=_internshala_listing_url,
+    card=INTERNSHALA_CARD,
+    fields=INTERNSHALA_FIELDS,
+    required=("href",),
+    match=("title", "company", "location", "description"),
+    headers=HEADERS,
+    build=lambda card, params: {
+        "title": card["title"],
+        "company": card["company"],
+        "location": card["location"],
+        "tags": ["internship"],
+        "salary": card.get("stipend"),
+        "duration": card.get("duration"),
+        "description": card.get("description"),
+        "posted_at": None,
+        "url": card["url"],
+        "source": "internshala",
+    },
+)
+
+INTERNSHALA_KEYWORDS = SiteAdapter(
+    name="internshala_keywords",
+    url=_internshala_keywords_url,
+    card=INTERNSHALA_CARD,
+    fields=INTERNSHALA_FIELDS,
+    required=("href",),
+    headers=HEADERS,
+    build=lambda card, params: {
+        "title": card["title"],
+        "company": card["company"],
+        "location": card["location"] or params.get("location"),
+        "stipend": card.get("stipend"),
+        "duration": card.get("duration"),
+        "description": card.get("description"),
+        "url": card["url"],
+        "source": "internshala",
+    },
+)
 
-# ---------------- Internshala ----------------
 
 def scrape_internshala(skills: List[str], location: str = "", max_pages: int = 1) -> List[Dict]:
     """Scrape Internshala internship listings (generic listing).
     Note: Public pages are paginated; we keep it light with max_pages.
+    Parsed pages are cached per (location, page); the skills filter runs on top.
     """
-    jobs: List[Dict] = []
-    base = "https://internshala.com/internships"
-    params_common = []
-    if location:
-        params_common.append(f"location={requests.utils.quote(location)}")
-    query = "&".join(params_common) if params_common else ""
-
-    for page in range(1, max_pages + 1):
-        url = f"{base}?page={page}{('&' + query) if query else ''}"
-        try:
-            r = requests.get(url, headers=HEADERS, timeout=10)
-            if r.status_code != 200:
-                continue
-            soup = BeautifulSoup(r.text, "lxml")
-            cards = soup.select("div.container-fluid.individual_internship")
-            for card in cards:
-                title = (card.select_one("a.job-title") or card.select_one("h3\n a") or card.select_one("h3 a")).get_text(strip=True) if card else "Internship"
-                company = (card.select_one("a.link_display_like_text") or card.select_one("div.company_name")).get_text(strip=True) if card else ""
-                loc_el = card.select_one("a.location_link") or card.select_one("span#location_names")
-                location_text = loc_el.get_text(strip=True) if loc_el else ""
-                stipend = (card.select_one("span.stipend") or card.select_one("div.stipend")).get_text(strip=True) if card else None
-                # Heuristic for duration
-                dur = None
-                for d in card.select("div.other_detail_item, span.other_detail_item"):
-                    t = d.get_text(" ", strip=True)
-                    if any(x in t.lower() for x in ["month", "week", "day"]):
-                        dur = t
-                        break
-                # Try to capture a short summary/snippet from the card
-                desc = None
-                for sel in [
-                    "div.job-snippet", "div#job-snippet", "div.job-description", "div.desc", "div.internship_about",
-                    "div.text-ellipsis", "div.collapse", "div.job-snippet-container"
-                ]:
-                    el = card.select_one(sel)
-                    if el:
-                        txt = el.get_text(" ", strip=True)
-                        if txt:
-                            desc = txt
-                            break
-                link_el = card.select_one("a.view_detail_button") or card.select_one("a.job-title")
-                link = "https://internshala.com" + link_el.get("href") if link_el and link_el.get("href") else url
-
-                text_blob = " ".join([title or "", company or "", location_text or "", (desc or "")]).lower()
-                if not _match_any(text_blob, skills):
-                    continue
-
-                jobs.append({
-                    "title": title,
-                    "company": company,
-                    "location": location_text,
-                    "tags": ["internship"],
-                    "salary": stipend,
-                    "duration": dur,
-                    "description": desc,
-                    "posted_at": None,
-                    "url": link,
-                    "source": "internshala",
-                })
-            time.sleep(1)
-        except Exception:
-            continue
-    return jobs
+    return scrape(INTERNSHALA, {"location": location}, skills, max_pages)
 
-from urllib.parse import quote_plus
 
 def scrape_internshala_by_keywords(query: str, location: str = "India", max_pages: int = 1) -> List[Dict]:
     """Scrape Internshala using keywords/location URL pattern.
     URL: https://internshala.com/internships/keywords-{query}/in-{location}
+    Parsed pages are cached per (keywords, location, page).
     """
-    jobs: List[Dict] = []
-    q = quote_plus((query or "").strip())
-    loc = quote_plus((location or "India").strip())
-    base = f"https://internshala.com/internships/keywords-{q}/in-{loc}"
+    return scrape(INTERNSHALA_KEYWORDS, {"keywords": query, "location": location or "India"}, (), max_pages)
+
+
+# ---------------- Internshala detail pages ----------------
+
+INTERNSHALA_DETAIL_PREFIX = "https://internshala.com/"
+DETAIL_HEADERS = dict(HEADERS, Accept="text/html,application/xhtml+xml")
+SNIPPET_CHARS = 200
+
+_ROLE_HEADINGS = ["about the internship", "role overview", "responsibilities", "what you will do"]
+_ROLE_BULLETS = ('section#about ul, div#internship_about ul, div.internship_about ul, div.job-description ul, '
+                 'div#job-description ul, div#job-detail ul')
+_DETAIL_CONTAINERS = [
+    'section#about', 'div#about_company', 'div#internship_about', 'div.internship_about',
+    'div#job-detail', 'div#job-description', 'div.job-description', 'div#jd', 'section#jd'
+]
+
+# Extracted summaries per detail URL; a listing's text rarely changes, so they are kept for days
+snippet_cache = QueryCache(ttl=Config.INTERNSHALA_DETAIL_TTL, max_stale=Config.INTERNSHALA_DETAIL_TTL)
+
+
+def _clean(txt: str) -> str:
+    return re.sub(r"\s+", " ", (txt or "").strip())
+
+
+def _looks_generic(t: str) -> bool:
+    low = t.lower()
+    return (
+        "explore more internships" in low or
+        "top locations" in low or
+        "top categories" in low or
+        low.startswith("find ") or
+        (len(low) < 40)
+    )
+
+
+def _bullets_to_line(uls) -> str:
+    bullets = []
+    for ul in uls:
+        for li in ul.select('li'):
+            s = _clean(li.get_text(" ", strip=True))
+            if s and len(s) > 8:
+                bullets.append(s)
+            if len(bullets) >= 2:
+                break
+        if len(bullets) >= 2:
+            break
+    return " • ".join(bullets)
+
+
+def _role_snippet(soup: BeautifulSoup) -> str:
+    # Prefer bullets near headings like "About the internship", "Role Overview", "Responsibilities"
+    for h in soup.select('h1, h2, h3, h4, strong, b'):
+        text = h.get_text(" ", strip=True).lower()
+        if any(p in text for p in _ROLE_HEADINGS):
+            # look in next siblings for ul/ol
+            sib = h.find_next_sibling()
+            uls = []
+            while sib and len(uls) == 0 and sib.name not in ('h1', 'h2', 'h3', 'h4'):
+                if sib.name in ('ul', 'ol'):
+                    uls.append(sib)
+                    break
+                uls.extend(sib.select('ul,ol'))
+                sib = sib.find_next_sibling()
+            if uls:
+                line = _bullets_to_line(uls)
+                if line and not _looks_generic(line):
+                    return line
+    # Fallback: any bullets under known containers
+    return _bullets_to_line(soup.select(_ROLE_BULLETS))
 
-    for page in range(1, max_pages + 1):
-        url = base if page == 1 else f"{base}?page={page}"
+
+def _json_ld_snippet(soup: BeautifulSoup) -> str:
+    for s in soup.select('script[type="application/ld+json"]'):
         try:
-            r = requests.get(url, headers=HEADERS, timeout=10)
-            if r.status_code != 200:
-                continue
-            soup = BeautifulSoup(r.text, "lxml")
-            cards = soup.select("div.container-fluid.individual_internship")
-            for card in cards:
-                title = (card.select_one("a.job-title") or card.select_one("h3 a")).get_text(strip=True) if card else "Internship"
-                company = (card.select_one("a.link_display_like_text") or card.select_one("div.company_name")).get_text(strip=True) if card else ""
-                loc_el = card.select_one("a.location_link") or card.select_one("span#location_names")
-                location_text = loc_el.get_text(strip=True) if loc_el else location
-                stipend = (card.select_one("span.stipend") or card.select_one("div.stipend")).get_text(strip=True) if card else None
-                duration = None
-                for d in card.select("div.other_detail_item, span.other_detail_item"):
-                    t = d.get_text(" ", strip=True)
-                    if any(x in t.lower() for x in ["month", "week", "day"]):
-                        duration = t
-                        break
-                # Try to capture a short summary/snippet from the card
-                desc = None
-                for sel in [
-                    "div.job-snippet", "div#job-snippet", "div.job-description", "div.desc", "div.internship_about",
-                    "div.text-ellipsis", "div.collapse", "div.job-snippet-container"
-                ]:
-                    el = card.select_one(sel)
-                    if el:
-                        txt = el.get_text(" ", strip=True)
-                        if txt:
-                            desc = txt
-                            break
-                link_el = card.select_one("a.view_detail_button") or card.select_one("a.job-title")
-                href = link_el.get("href") if link_el else None
-                link = "https://internshala.com" + href if href and href.startswith('/') else (href or url)
-                jobs.append({
-                    "title": title,
-                    "company": company,
-                    "location": location_text,
-                    "stipend": stipend,
-                    "duration": duration,
-                    "description": desc,
-                    "url": link,
-                    "source": "internshala",
-                })
-            time.sleep(1)
-        except Exception:
+            data = json.loads(s.get_text(strip=True))
+        except ValueError:
             continue
-    return jobs
+        for d in (data if isinstance(data, list) else [data]):
+            if isinstance(d, dict) and d.get('@type') in ("JobPosting", "Internship") and d.get('description'):
+                cand = _clean(BeautifulSoup(d['description'], 'lxml').get_text(" ", strip=True))
+                if cand and not _looks_generic(cand):
+                    return cand
+    return ""
+
+
+def extract_internshala_snippet(html: str) -> str:
+    """Short role summary from an Internshala detail page ('' when the page has none).
+    Tries, in order: role bullets, meta description, og:description, JSON-LD, known containers.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    text = _role_snippet(soup)
+    if not text or _looks_generic(text):
+        text = ""
+    for sel in ('meta[name="description"]', 'meta[property="og:description"]'):
+        if text:
+            break
+        md = soup.select_one(sel)
+        if md and md.get('content'):
+            cand = _clean(md['content'])
+            if cand and not _looks_generic(cand):
+                text = cand
+    if not text:
+        text = _json_ld_snippet(soup)
+    if not text:
+        for sel in _DETAIL_CONTAINERS:
+            el = soup.select_one(sel)
+            if el:
+                cand = _clean(el.get_text(" ", strip=True))
+                if cand and not _looks_generic(cand):
+                    text = cand
+                    break
+    return (text[:SNIPPET_CHARS] + '...') if len(text) > SNIPPET_CHARS else text
+
+
+def _snippet_key(url: str) -> str:
+    return json.dumps(["internshala_detail", normalize_url(url)], separators=(',', ':'))
+
+
+def _fetch_snippet(url: str) -> List[Dict]:
+    r = http_fetch.get(url, headers=DETAIL_HEADERS)
+    if r.status_code != 200:
+        raise http_fetch.FetchError(f"HTTP {r.status_code} from {url}")
+    # Stored even when empty, so a page without a summary is not re-fetched on every rerun
+    return [{"url": url, "description": extract_internshala_snippet(r.text)}]
+
+
+def iter_internshala_snippets(urls: Iterable[str], max_fetch: int = 6,
+                              deadline: Optional[float] = None) -> Iterator[Tuple[str, str]]:
+    """Yield (url, snippet) for Internshala detail pages: cached ones first, then up to `max_fetch`
+    uncached pages fetched concurrently, in the order they arrive. Pages still loading after
+    `deadline` seconds (default SCRAPER_DEADLINE) are skipped here but still cached when done.
+    """
+    deadline = Config.SCRAPER_DEADLINE if deadline is None else deadline
+    missing: List[str] = []
+    for url in dict.fromkeys(u for u in urls if u and u.startswith(INTERNSHALA_DETAIL_PREFIX)):
+        hit = snippet_cache.get(_snippet_key(url), "internshala_detail", lambda url=url: _fetch_snippet(url))
+        if hit is not None:
+            yield url, hit[0].get("description") or ""
+        elif len(missing) < max_fetch:
+            missing.append(url)
+    if not missing:
+        return
+
+    ex = ThreadPoolExecutor(max_workers=Config.INTERNSHALA_DETAIL_CONCURRENCY, thread_name_prefix="internshala-detail")
+    futures = {
+        ex.submit(snippet_cache.get_or_fetch, _snippet_key(url), "internshala_detail",
+                  lambda url=url: _fetch_snippet(url)): url
+        for url in missing
+    }
+    try:
+        for fut in as_completed(futures, timeout=deadline):
+            try:
+                value = fut.result()
+            except Exception:
+                continue  # Optional; the card keeps its short form
+            yield futures[fut], value[0].get("description") or ""
+    except FutureTimeout:
+        pass  # Late pages finish in the background and land in snippet_cache
+    finally:
+        ex.shutdown(wait=False)
 
 
 # ---------------- GitHub repositories ----------------
 
+# Search for repos with topics 'hiring' or 'internship'
+GITHUB = SiteAdapter(
+    name="github",
+    url=lambda params, page: f"https://github.com/search?p={page}&q=topic%3Ahiring+OR+topic%3Ainternship&type=repositories",
+    card="li.repo-list-item, div.search-title + div.mt-n1",
+    fields={
+        "href": Field("a.v-align-middle", "a.Link--primary", attr="href"),
+        "description": Field("p", default=""),
+        "text": Field(sep=" ", default=""),
+    },
+    required=("href",),
+    match=("href", "description", "text"),
+    headers=HEADERS,
+    build=lambda card, params: {
+        "title": f"Repository: {card['href'].strip('/')}",
+        "company": "GitHub Repo",
+        "location": "Remote",
+        "tags": ["github", "repo", "hiring"],
+        "salary": None,
+        "posted_at": None,
+        "url": card["url"],
+        "source": "github",
+    },
+)
+
+
 def scrape_github_repos(skills: List[str], max_pages: int = 1) -> List[Dict]:
     """Scrape GitHub search for repos with topics indicating hiring/internships.
     This is heuristic and best effort. We filter by keywords and topics.
     """
-    jobs: List[Dict] = []
-    for page in range(1, max_pages + 1):
-        # Search for repos with topics 'hiring' or 'internship'
-        url = f"https://github.com/search?p={page}&q=topic%3Ahiring+OR+topic%3Ainternship&type=repositories"
-        try:
-            r = requests.get(url, headers=HEADERS, timeout=10)
-            if r.status_code != 200:
-                continue
-            soup = BeautifulSoup(r.text, "lxml")
-            items = soup.select("li.repo-list-item, div.search-title + div.mt-n1")
-            for it in items:
-                a = it.select_one("a.v-align-middle") or it.select_one("a.Link--primary")
-                if not a or not a.get("href"):
-                    continue
-                full_name = a.get("href").strip("/")
-                repo_url = "https://github.com" + a.get("href")
-                desc_el = it.select_one("p")
-                desc = desc_el.get_text(strip=True) if desc_el else ""
-                meta = it.get_text(" ", strip=True).lower()
-                text_blob = f"{full_name} {desc} {meta}".lower()
-                if not _match_any(text_blob, skills):
-                    continue
-                jobs.append({
-                    "title": f"Repository: {full_name}",
-                    "company": "GitHub Repo",
-                    "location": "Remote",
-                    "tags": ["github", "repo", "hiring"],
-                    "salary": None,
-                    "posted_at": None,
-                    "url": repo_url,
-                    "source": "github",
-                })
-            time.sleep(1)
-        except Exception:
-            continue
-    return jobs
+    return scrape(GITHUB, {}, skills, max_pages)
 
 
 # ---------------- RemoteOK ----------------
 
+REMOTEOK = SiteAdapter(
+    name="remoteok",
+    url=lambda params, page: "https://remoteok.com/remote-dev-jobs",
+    card="tr.job",
+    fields={
+        "title": Field("td.position h2", "a.preventLink", default=""),
+        "company": Field("td.company h3", "span.companyLink", default=""),
+        "tags": Field("td.tags a", many=True, default=[]),
+        "location": Field("div.location", "div.location.tooltip", default=""),
+        "href": Field("a.preventLink", "a", attr="href"),
+    },
+    required=("href",),
+    match=("title", "company", "tags"),
+    max_pages=1,  # one long listing page
+    headers=HEADERS,
+    build=lambda card, params: {
+        "title": card["title"],
+        "company": card["company"],
+        "location": card["location"] or "Remote",
+        "tags": list(card.get("tags") or []),
+        "salary": None,
+        "posted_at": None,
+        "url": card["url"],
+        "source": "remoteok",
+    },
+)
+
+
 def scrape_remoteok(skills: List[str], location: str = "", max_pages: int = 1) -> List[Dict]:
     """Scrape RemoteOK listings (best effort; HTML may change)."""
-    jobs: List[Dict] = []
-    base = "https://remoteok.com/remote-dev-jobs"
-    try:
-        r = requests.get(base, headers=HEADERS, timeout=10)
-        if r.status_code != 200:
-            return jobs
-        soup = BeautifulSoup(r.text, "lxml")
-        rows = soup.select("tr.job")
-        for row in rows:
-            title = (row.select_one("td.position h2") or row.select_one("a.preventLink")).get_text(strip=True) if row else ""
-            company = (row.select_one("td.company h3") or row.select_one("span.companyLink")).get_text(strip=True) if row else ""
-            tags = [t.get_text(strip=True) for t in row.select("td.tags a")]
-            location_text = (row.select_one("div.location") or row.select_one("div.location.tooltip")).get_text(strip=True) if row else "Remote"
-            link_el = row.select_one("a.preventLink") or row.select_one("a")
-            link_href = link_el.get("href") if link_el else None
-            link = ("https://remoteok.com" + link_href) if link_href and link_href.startswith("/") else (link_href or base)
-            text_blob = " ".join([title or "", company or "", " ".join(tags)]).lower()
-            if not _match_any(text_blob, skills):
-                continue
-            jobs.append({
-                "title": title,
-                "company": company,
-                "location": location_text or "Remote",
-                "tags": tags,
-                "salary": None,
-                "posted_at": None,
-                "url": link,
-                "source": "remoteok",
-            })
-        time.sleep(1)
-    except Exception:
-        return jobs
-    return jobs
+    return scrape(REMOTEOK, {}, skills, max_pages)
 
 
-def scrape_all(skills: List[str], location: str = "") -> List[Dict]:
-    """Run all scrapers and return a combined list (deduplicated by URL)."""
+def scraper_sources(skills: List[str], location: str = "") -> Dict[str, Callable[[], List[Dict]]]:
+    """The scrapers as zero-argument callables for job_sources.run_sources"""
     skills = [s for s in (skills or []) if s]
-    collected = []
-    for fn in (scrape_internshala, scrape_github_repos, scrape_remoteok):
-        try:
-            collected.extend(fn(skills, location) if fn is not scrape_github_repos else fn(skills))
-        except Exception:
-            continue
+    return {
+        "internshala": lambda: scrape_internshala(skills, location),
+        "github": lambda: scrape_github_repos(skills),
+        "remoteok": lambda: scrape_remoteok(skills, location),
+    }
+
+
+def scrape_all_with_status(skills: List[str], location: str = "") -> Tuple[List[Dict], Dict[str, SourceStatus]]:
+    """Run all scrapers concurrently, each with its own deadline (see job_sources.py).
+    Returns the combined list (deduplicated by URL) from the sources that finished in time,
+    plus a SourceStatus per source.
+    """
+    results, statuses = run_sources(scraper_sources(skills, location))
+    collected = [j for items in results.values() for j in items]
     # Dedup by URL
     seen = set()
     unique = []
@@ -271,4 +398,9 @@ def scrape_all(skills: List[str], location: str = "") -> List[Dict]:
             continue
         seen.add(u)
         unique.append(j)
-    return unique
+    return unique, statuses
+
+
+def scrape_all(skills: List[str], location: str = "") -> List[Dict]:
+    """Run all scrapers and return a combined list (deduplicated by URL)."""
+    return scrape_all_with_status(skills, location)[0]
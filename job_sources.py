@@ -0,0 +1,147 @@
+# Concurrent job-source runner for InternHunt
+"""
+Runs several job sources (Jooble, the scrapers) at the same time, each with
+its own deadline, and reports what happened to each one.
+
+`run_sources({'internshala': fn, 'github': fn, ...})` starts every source in
+its own worker thread (their HTTP requests share the pooled clients and rate
+limits in http_fetch) and waits for each until its deadline: SCRAPER_DEADLINE
+seconds (default 8), with per-source overrides in SCRAPER_DEADLINES, e.g.
+"github=5,remoteok=6". Whatever finished in time is returned; a source that
+misses its deadline is reported as a timeout and left to finish in the
+background, where its results still land in the job index for the next search.
+
+Each source gets a SourceStatus: status (ok | timeout | http_error |
+parse_error | error), item count, latency and a short detail. Sources report
+problems they swallow themselves (a page returning 403, a card that fails to
+parse) with `note()` / `note_exception()` from inside the worker thread.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import Config
+from http_fetch import FetchError, FetchTimeout
+
+logger = logging.getLogger(__name__)
+
+STATUSES = ('ok', 'timeout', 'http_error', 'parse_error', 'error')
+
+_local = threading.local()
+
+
+class SourceStatus:
+    """Outcome of one source in one run"""
+
+    __slots__ = ('source', 'status', 'items', 'latency', 'detail')
+
+    def __init__(self, source: str, status: str = 'ok', items: int = 0, latency: float = 0.0, detail: str = ''):
+        self.source = source
+        self.status = status
+        self.items = items
+        self.latency = latency
+        self.detail = detail
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 'ok'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'source': self.source, 'status': self.status, 'items': self.items,
+                'latency': round(self.latency, 3), 'detail': self.detail}
+
+    def __repr__(self) -> str:
+        return f"<SourceStatus {self.source} {self.status} items={self.items} {self.latency:.2f}s>"
+
+
+def note(status: str, detail: str = '') -> None:
+    """Record a problem for the source running on this thread (no-op outside run_sources)"""
+    problems = getattr(_local, 'problems', None)
+    if problems is not None:
+        problems.append((status, detail))
+
+
+def classify_exception(e: BaseException) -> str:
+    if isinstance(e, FetchTimeout):
+        return 'timeout'
+    if isinstance(e, FetchError):
+        return 'http_error'
+    if isinstance(e, (ValueError, KeyError, AttributeError, TypeError, IndexError)):
+        return 'parse_error'
+    return 'error'
+
+
+def note_exception(e: BaseException) -> None:
+    """Record a swallowed exception, classified as timeout / http_error / parse_error / error"""
+    note(classify_exception(e), f"{type(e).__name__}: {e}")
+
+
+def parse_deadlines(spec: str) -> Dict[str, float]:
+    """Parse "github=5,remoteok=6" into {source: seconds}; bad entries are ignored"""
+    deadlines: Dict[str, float] = {}
+    for part in (spec or '').split(','):
+        name, _, value = part.partition('=')
+        try:
+            deadlines[name.strip().lower()] = float(value)
+        except ValueError:
+            continue
+    return deadlines
+
+
+def _call(fn: Callable[[], Any]) -> Tuple[List[Dict], List[tuple], float]:
+    _local.problems = problems = []
+    started = time.perf_counter()
+    try:
+        items = fn() or []
+    except Exception as e:
+        note_exception(e)
+        items = []
+    finally:
+        _local.problems = None
+    return list(items), problems, time.perf_counter() - started
+
+
+def run_sources(sources: Dict[str, Callable[[], Any]], deadlines: Optional[Dict[str, float]] = None,
+                default_deadline: Optional[float] = None) -> Tuple[Dict[str, List[Dict]], Dict[str, SourceStatus]]:
+    """Run every source concurrently; returns ({source: items}, {source: SourceStatus}).
+    A source that raised or missed its deadline contributes no items.
+    """
+    configured = parse_deadlines(Config.SCRAPER_DEADLINES)
+    configured.update(deadlines or {})
+    default_deadline = Config.SCRAPER_DEADLINE if default_deadline is None else default_deadline
+
+    results: Dict[str, List[Dict]] = {name: [] for name in sources}
+    statuses: Dict[str, SourceStatus] = {}
+    if not sources:
+        return results, statuses
+
+    ex = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="job-source")
+    started = time.monotonic()
+    futures = {name: ex.submit(_call, fn) for name, fn in sources.items()}
+    limit = {name: configured.get(name, default_deadline) for name in sources}
+    try:
+        for name in sorted(futures, key=limit.get):
+            remaining = started + limit[name] - time.monotonic()
+            try:
+                items, problems, latency = futures[name].result(timeout=max(0.0, remaining))
+            except FutureTimeout:
+                statuses[name] = SourceStatus(name, 'timeout', 0, time.monotonic() - started,
+                                              f"no result within {limit[name]:g}s")
+                continue
+            status = SourceStatus(name, 'ok', len(items), latency)
+            if problems:
+                # A partial result is still ok; the problem is kept as detail
+                status.detail = '; '.join(d or s for s, d in problems[:3])
+                if not items:
+                    status.status = problems[0][0]
+            results[name] = items
+            statuses[name] = status
+    finally:
+        # Late sources keep running in the background; nothing waits for them
+        ex.shutdown(wait=False)
+
+    logger.info("Job sources: " + ", ".join(
+        f"{s.source}={s.status}({s.items}, {s.latency:.2f}s)" for s in statuses.values()))
+    return results, statuses
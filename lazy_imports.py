@@ -0,0 +1,104 @@
+# Deferred imports for InternHunt
+"""
+Lightweight proxies that import a module (or build an object) on first use.
+
+Importing spaCy, NLTK, pandas, google-generativeai and the database drivers
+takes seconds, and most Streamlit reruns never touch them. App.py binds these
+names to proxies instead, so the cost is paid by the first request that
+actually needs the module rather than by every cold start:
+
+    nltk = LazyModule('nltk')                          # nltk.download(...) imports nltk
+    chat_gemini = LazyAttribute('chat_service', 'chat_gemini')
+    db_manager = LazyObject(lambda: DatabaseManager())
+
+Measure the effect with `python benchmarks/bench_startup.py`.
+"""
+import importlib
+import threading
+from typing import Any, Callable
+
+
+class LazyModule:
+    """Module proxy; the real module is imported on first attribute access"""
+
+    def __init__(self, name: str):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            # import_module holds the per-module import lock, so concurrent first uses are safe
+            module = importlib.import_module(self.__dict__['_name'])
+            self.__dict__['_module'] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__['_module'] is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.is_loaded else 'not loaded'
+        return f"<LazyModule {self.__dict__['_name']!r} ({state})>"
+
+
+class LazyAttribute:
+    """Proxy for `module.attr` (a function or class); the module is imported on first call"""
+
+    def __init__(self, module: str, attr: str):
+        self._module = LazyModule(module)
+        self._attr = attr
+
+    def resolve(self) -> Any:
+        return getattr(self._module, self._attr)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        return f"<LazyAttribute {self._module.__dict__['_name']}.{self._attr}>"
+
+
+class LazyObject:
+    """Proxy for an object built by `factory()` on first attribute access (built once, thread-safe)"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.__dict__['_factory'] = factory
+        self.__dict__['_instance'] = None
+        self.__dict__['_lock'] = threading.Lock()
+
+    def _load(self):
+        instance = self.__dict__['_instance']
+        if instance is None:
+            with self.__dict__['_lock']:
+                instance = self.__dict__['_instance']
+                if instance is None:
+                    instance = self.__dict__['_factory']()
+                    self.__dict__['_instance'] = instance
+        return instance
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__['_instance'] is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._load(), attr, value)
+
+    def __repr__(self) -> str:
+        state = repr(self.__dict__['_instance']) if self.is_loaded else 'not loaded'
+        return f"<LazyObject {state}>"
@@ -0,0 +1,296 @@
+# Process-wide ML model registry for InternHunt
+"""
+One place that owns loading, warm-up, versioning and memory accounting of
+the ML assets (spaCy pipeline, resume classifier, ResumeParser and the
+optional sentence-embedding model).
+
+Every entry point in the process (Streamlit sessions, CLIs, a future API)
+gets the same instance from `registry.get(name)`; each model is loaded once,
+on first use, under its own lock.
+
+Preloading before fork (e.g. a pre-forking server or multiprocessing pool):
+
+    from model_registry import registry
+    registry.preload_for_fork()   # load + warm every enabled model, then gc.freeze()
+    # ... fork workers; they share the model pages copy-on-write
+
+`registry.stats()` reports per model: version metadata, load/warm-up time
+and the resident memory added by loading it (RSS delta, which includes any
+libraries first imported by that load); `process_memory()`
+gives RSS/PSS and shared vs private pages for the whole process (Linux).
+
+CLI:
+    python model_registry.py stats [name ...]   # load, warm up and print stats
+"""
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TEXT = (
+    "Software engineering intern. Python, Django, SQL, Docker and AWS. "
+    "Built a REST API serving 10k requests per day at Example Corp (2023 - 2024)."
+)
+
+Loader = Callable[[], Tuple[Any, Dict[str, Any]]]
+
+
+def _rss_bytes() -> Optional[int]:
+    """Current resident set size of this process, or None if unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def process_memory() -> Dict[str, int]:
+    """RSS, PSS and shared/private resident bytes of this process (Linux; empty elsewhere).
+    After a fork, model pages still shared with the parent show up as `shared`.
+    """
+    fields = {'Rss': 'rss', 'Pss': 'pss', 'Shared_Clean': 'shared', 'Shared_Dirty': 'shared',
+              'Private_Clean': 'private', 'Private_Dirty': 'private'}
+    out: Dict[str, int] = {}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                key, _, rest = line.partition(':')
+                if key in fields:
+                    out[fields[key]] = out.get(fields[key], 0) + int(rest.split()[0]) * 1024
+    except (OSError, ValueError, IndexError):
+        rss = _rss_bytes()
+        if rss is not None:
+            out['rss'] = rss
+    return out
+
+
+class ModelEntry:
+    """A registered model and its bookkeeping"""
+
+    def __init__(self, name: str, loader: Loader, warmup: Optional[Callable[[Any], Any]] = None,
+                 enabled: Optional[Callable[[], bool]] = None, depends_on: Sequence[str] = ()):
+        self.name = name
+        self.loader = loader
+        self.warmup = warmup
+        self.enabled = enabled
+        self.depends_on = tuple(depends_on)
+        self.obj: Any = None
+        self.meta: Dict[str, Any] = {}
+        self.loaded = False
+        self.warm = False
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.rss_delta_bytes: Optional[int] = None
+        self.error: Optional[str] = None
+        self.lock = threading.RLock()
+
+    def is_enabled(self) -> bool:
+        return self.enabled is None or bool(self.enabled())
+
+
+class ModelRegistry:
+    """Load-once, thread-safe registry of named models"""
+
+    def __init__(self):
+        self._entries: Dict[str, ModelEntry] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, loader: Loader, warmup: Optional[Callable[[Any], Any]] = None,
+                 enabled: Optional[Callable[[], bool]] = None, depends_on: Sequence[str] = ()) -> None:
+        """Register `loader() -> (model, version_metadata)` under `name` (replaces an unloaded entry)"""
+        with self._lock:
+            current = self._entries.get(name)
+            if current is not None and current.loaded:
+                raise ValueError(f"Model '{name}' is already loaded")
+            self._entries[name] = ModelEntry(name, loader, warmup, enabled, depends_on)
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def _entry(self, name: str) -> ModelEntry:
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(f"Unknown model '{name}'; registered: {', '.join(self._entries)}") from None
+
+    def is_loaded(self, name: str) -> bool:
+        return self._entry(name).loaded
+
+    def is_enabled(self, name: str) -> bool:
+        return self._entry(name).is_enabled()
+
+    def get_with_meta(self, name: str) -> Tuple[Any, Dict[str, Any]]:
+        """Return (model, version metadata), loading it on first use. Loader errors propagate
+        and are retried on the next call."""
+        entry = self._entry(name)
+        if entry.loaded:
+            return entry.obj, entry.meta
+        for dep in entry.depends_on:
+            self.get(dep)  # load dependencies first so the RSS delta below is this model's own
+        with entry.lock:
+            if not entry.loaded:
+                rss_before = _rss_bytes()
+                start = time.perf_counter()
+                try:
+                    obj, meta = entry.loader()
+                except Exception as e:
+                    entry.error = f"{type(e).__name__}: {e}"
+                    raise
+                entry.load_seconds = time.perf_counter() - start
+                rss_after = _rss_bytes()
+                if rss_before is not None and rss_after is not None:
+                    entry.rss_delta_bytes = max(0, rss_after - rss_before)
+                entry.obj, entry.meta, entry.error = obj, dict(meta or {}), None
+                entry.loaded = True
+                logger.info(f"Loaded model '{name}' in {entry.load_seconds * 1000:.0f} ms "
+                            f"(+{(entry.rss_delta_bytes or 0) / 2**20:.1f} MiB RSS)")
+        return entry.obj, entry.meta
+
+    def get(self, name: str) -> Any:
+        return self.get_with_meta(name)[0]
+
+    def warm_up(self, name: str) -> Optional[float]:
+        """Load `name` and run its warm-up once; returns the warm-up seconds"""
+        entry = self._entry(name)
+        obj = self.get(name)
+        with entry.lock:
+            if not entry.warm:
+                start = time.perf_counter()
+                if entry.warmup is not None:
+                    entry.warmup(obj)
+                entry.warmup_seconds = time.perf_counter() - start
+                entry.warm = True
+        return entry.warmup_seconds
+
+    def preload(self, names: Optional[Sequence[str]] = None, warm: bool = True) -> Dict[str, Optional[str]]:
+        """Load (and warm) the given or all enabled models; returns {name: error or None}.
+        Failures are logged, not raised, so one missing optional model does not block the rest.
+        """
+        results: Dict[str, Optional[str]] = {}
+        for name in names or self.names():
+            entry = self._entry(name)
+            if names is None and not entry.is_enabled():
+                continue
+            try:
+                if warm:
+                    self.warm_up(name)
+                else:
+                    self.get(name)
+                results[name] = None
+            except Exception as e:
+                logger.warning(f"Could not preload model '{name}': {e}")
+                results[name] = f"{type(e).__name__}: {e}"
+        return results
+
+    def preload_for_fork(self, names: Optional[Sequence[str]] = None) -> Dict[str, Optional[str]]:
+        """Preload, then move every live object to the permanent GC generation so
+        forked workers' garbage collections do not write to (and un-share) model pages."""
+        results = self.preload(names)
+        gc.collect()
+        gc.freeze()
+        return results
+
+    def unload(self, name: str) -> None:
+        entry = self._entry(name)
+        with entry.lock:
+            entry.obj, entry.loaded, entry.warm = None, False, False
+            entry.rss_delta_bytes = entry.load_seconds = entry.warmup_seconds = None
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-model status: version metadata, timings and resident memory added by loading it"""
+        rows = []
+        for entry in self._entries.values():
+            rows.append({
+                'name': entry.name,
+                'enabled': entry.is_enabled(),
+                'loaded': entry.loaded,
+                'warm': entry.warm,
+                'version': dict(entry.meta),
+                'load_seconds': entry.load_seconds,
+                'warmup_seconds': entry.warmup_seconds,
+                'rss_delta_bytes': entry.rss_delta_bytes,
+                'error': entry.error,
+            })
+        return rows
+
+
+# -----------------------------
+# Default models
+# -----------------------------
+
+def _load_spacy_model() -> Tuple[Any, Dict[str, Any]]:
+    import spacy
+    try:
+        import en_core_web_sm
+        nlp = en_core_web_sm.load()
+    except ImportError:
+        nlp = spacy.load("en_core_web_sm")
+    meta = getattr(nlp, 'meta', {}) or {}
+    return nlp, {'name': f"{meta.get('lang', 'en')}_{meta.get('name', 'core_web_sm')}",
+                 'version': meta.get('version'), 'spacy_version': spacy.__version__}
+
+
+def _load_resume_classifier() -> Tuple[Any, Dict[str, Any]]:
+    from model_store import load_classifier, resolve_model_path
+    model, info = load_classifier(resolve_model_path(Config.CLASSIFIER_VARIANT))
+    info.setdefault('variant', Config.CLASSIFIER_VARIANT)
+    return model, info
+
+
+def _warm_resume_classifier(model: Any) -> None:
+    from resume_classifier import predict_top_k
+    predict_top_k(model, [WARMUP_TEXT])
+
+
+def _load_resume_parser() -> Tuple[Any, Dict[str, Any]]:
+    from resume_parser import ResumeParser
+    parser = ResumeParser()
+    return parser, {'skills': len(parser.valid_skills)}
+
+
+def _load_embedding_model() -> Tuple[Any, Dict[str, Any]]:
+    import semantic_classifier
+    return semantic_classifier.get_embedding_model(), {'name': Config.EMBEDDING_MODEL}
+
+
+def _semantic_enabled() -> bool:
+    if not Config.ENABLE_SEMANTIC_CLASSIFIER:
+        return False
+    import semantic_classifier
+    return semantic_classifier.is_available()
+
+
+registry = ModelRegistry()
+registry.register('spacy_model', _load_spacy_model, warmup=lambda nlp: nlp(WARMUP_TEXT))
+registry.register('resume_classifier', _load_resume_classifier, warmup=_warm_resume_classifier)
+registry.register('resume_parser', _load_resume_parser, warmup=lambda p: p.extract_skills(WARMUP_TEXT),
+                  depends_on=('spacy_model',))
+registry.register('embedding_model', _load_embedding_model, warmup=lambda m: m.encode([WARMUP_TEXT]),
+                  enabled=_semantic_enabled)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    if len(sys.argv) >= 2 and sys.argv[1] == 'stats':
+        errors = registry.preload(sys.argv[2:] or None)
+        for row in registry.stats():
+            if row['name'] not in errors:
+                continue
+            mib = (row['rss_delta_bytes'] or 0) / 2**20
+            load_ms = (row['load_seconds'] or 0) * 1000
+            warm_ms = (row['warmup_seconds'] or 0) * 1000
+            if errors[row['name']]:
+                print(f"{row['name']:<18} FAILED  {errors[row['name']]}")
+                continue
+            print(f"{row['name']:<18} ok  load={load_ms:8.1f} ms  warm={warm_ms:7.1f} ms  "
+                  f"rss=+{mib:6.1f} MiB  {row['version']}")
+        print("process: " + ", ".join(f"{k}={v / 2**20:.1f} MiB" for k, v in process_memory().items()))
+    else:
+        print("Usage: python model_registry.py stats [name ...]")
@@ -0,0 +1,184 @@
+# Classifier artifact storage for InternHunt
+"""
+Loading and saving of the resume classifier in a memory-mappable layout.
+
+`resume_classifier_v2.pkl` is a (possibly compressed) joblib pickle, so every
+process that loads it gets a private copy of the TF-IDF IDF vector and the
+coefficient matrix. Here we keep an uncompressed copy in `.model_cache/` and
+load it with `mmap_mode='r'`: the large numpy arrays are then mapped read-only
+from the OS page cache and shared by every Streamlit worker on the host.
+
+Versioned artifacts written by `train_classifier.py` live in `models/` as
+`<name>.joblib` (already uncompressed) with a `<name>.json` metadata sidecar;
+`resolve_model_path()` picks the newest one trained with a compatible
+scikit-learn and falls back to the bundled pickle.
+
+CLI:
+    python model_store.py convert [src.pkl]   # build the mmap copy ahead of time
+    python model_store.py list                # show versioned artifacts
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+
+from resume_classifier import prepare_for_inference
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LEGACY_MODEL_PATH = os.path.join(BASE_DIR, 'resume_classifier_v2.pkl')
+MMAP_CACHE_DIR = os.path.join(BASE_DIR, '.model_cache')
+MODEL_DIR = os.path.join(BASE_DIR, 'models')
+LEGACY_VARIANT = 'tfidf_logreg'
+
+
+def unwrap_artifact(data: Any) -> Tuple[Any, Dict[str, Any]]:
+    """Split a loaded artifact into (model, metadata); handles bare pickled models"""
+    if isinstance(data, dict) and 'model' in data:
+        meta = {k: v for k, v in data.items() if k != 'model'}
+        return data['model'], meta
+    return data, {}
+
+
+def save_artifact(model: Any, path: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+    """Write `{'model': model, **metadata}` uncompressed so arrays can be memory-mapped.
+    The file is written to a temp name and renamed, so concurrent readers never see a partial file.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    payload = dict(metadata or {})
+    payload['model'] = model
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        joblib.dump(payload, tmp_path, compress=0)
+        # mkstemp creates 0600; give the artifact normal permissions so other workers can map it
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+def write_metadata(artifact_path: str, metadata: Dict[str, Any]) -> str:
+    """Write the JSON sidecar for a versioned artifact (readable without unpickling)"""
+    sidecar = os.path.splitext(artifact_path)[0] + '.json'
+    with open(sidecar, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=2, sort_keys=True, default=str)
+    return sidecar
+
+
+def list_artifacts(model_dir: str = MODEL_DIR) -> List[Dict[str, Any]]:
+    """Metadata of every versioned artifact in `model_dir`, newest first"""
+    found = []
+    if not os.path.isdir(model_dir):
+        return found
+    for name in os.listdir(model_dir):
+        if not name.endswith('.json'):
+            continue
+        artifact = os.path.join(model_dir, name[:-5] + '.joblib')
+        if not os.path.exists(artifact):
+            continue
+        try:
+            with open(os.path.join(model_dir, name), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable model metadata {name}: {e}")
+            continue
+        meta['path'] = artifact
+        found.append(meta)
+    found.sort(key=lambda m: str(m.get('trained_at', '')), reverse=True)
+    return found
+
+
+def _minor_version(version: str) -> Tuple[str, ...]:
+    return tuple(str(version).split('.')[:2])
+
+
+def resolve_model_path(variant: Optional[str] = None, model_dir: str = MODEL_DIR) -> str:
+    """Newest versioned artifact trained on the running scikit-learn minor version
+    (optionally restricted to a model `variant`), else the bundled legacy pickle
+    (a `tfidf_logreg` model).
+    """
+    try:
+        import sklearn
+        running = _minor_version(sklearn.__version__)
+    except ImportError:
+        running = None
+    for meta in list_artifacts(model_dir):
+        if variant and meta.get('variant') != variant:
+            continue
+        if running is not None and _minor_version(meta.get('sklearn_version', '')) != running:
+            continue
+        return meta['path']
+    if variant and variant != LEGACY_VARIANT:
+        logger.warning(f"No compatible '{variant}' classifier in {model_dir}; using {os.path.basename(LEGACY_MODEL_PATH)}")
+    return LEGACY_MODEL_PATH
+
+
+def mmap_path_for(src_path: str) -> str:
+    """Location of the memory-mappable copy of `src_path`"""
+    name = os.path.splitext(os.path.basename(src_path))[0]
+    return os.path.join(MMAP_CACHE_DIR, f"{name}.joblib")
+
+
+def ensure_mmap_artifact(src_path: str = LEGACY_MODEL_PATH) -> str:
+    """Return a memory-mappable copy of `src_path`, (re)building it if missing or stale"""
+    dst = mmap_path_for(src_path)
+    if os.path.exists(dst) and os.path.getmtime(dst) >= os.path.getmtime(src_path):
+        return dst
+    data = joblib.load(src_path)
+    model, meta = unwrap_artifact(data)
+    save_artifact(prepare_for_inference(model), dst, meta)
+    logger.info(f"Wrote memory-mappable classifier copy to {dst}")
+    return dst
+
+
+def load_classifier(path: str = LEGACY_MODEL_PATH, mmap: bool = True) -> Tuple[Any, Dict[str, Any]]:
+    """Load a classifier artifact.
+    Returns (model, info) where info holds the artifact metadata plus
+    `path`, `mmap` and `load_seconds`. Raises FileNotFoundError if `path` is missing.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    start = time.perf_counter()
+    load_path, mmap_mode = path, None
+    if mmap:
+        try:
+            load_path = path if path.endswith('.joblib') else ensure_mmap_artifact(path)
+            mmap_mode = 'r'
+        except Exception as e:
+            # Read-only filesystem or similar: fall back to a private in-memory copy
+            logger.warning(f"Memory-mapped model unavailable ({e}); loading {path} directly")
+            load_path = path
+    model, meta = unwrap_artifact(joblib.load(load_path, mmap_mode=mmap_mode))
+    info = dict(meta)
+    info.update({
+        'path': load_path,
+        'mmap': mmap_mode is not None,
+        'load_seconds': time.perf_counter() - start,
+    })
+    logger.info(f"Loaded classifier from {load_path} in {info['load_seconds'] * 1000:.1f} ms (mmap={info['mmap']})")
+    return model, info
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    if len(sys.argv) >= 2 and sys.argv[1] == 'convert':
+        src = sys.argv[2] if len(sys.argv) > 2 else LEGACY_MODEL_PATH
+        print(ensure_mmap_artifact(src))
+    elif len(sys.argv) >= 2 and sys.argv[1] == 'list':
+        for meta in list_artifacts():
+            print(f"{os.path.basename(meta['path'])}  variant={meta.get('variant')}  "
+                  f"sklearn={meta.get('sklearn_version')}  accuracy={meta.get('accuracy')}")
+        print(f"selected: {resolve_model_path()}")
+    else:
+        print("Usage: python model_store.py convert [src.pkl] | list")
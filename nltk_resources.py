@@ -0,0 +1,112 @@
+# NLTK corpus provisioning for InternHunt
+"""
+Vendors the NLTK corpora the app needs into a local data directory
+(`Config.NLTK_DATA_DIR`, default `./nltk_data`) so requests never download them.
+
+Build step (run once per deploy, e.g. after `pip install -r requirements.txt`):
+    python nltk_resources.py            # download into NLTK_DATA_DIR
+    python nltk_resources.py --check    # exit 1 if anything is missing
+
+At runtime `ensure_nltk_data()` is called once per process: it checks the
+files on disk (without importing NLTK or touching the network) and points
+NLTK at the local directory. A missing corpus is an error: it is logged with
+the build command and fails the `nltk_data` readiness check (warmup.py). Only
+with `NLTK_ALLOW_DOWNLOAD=1` (off by default) is it downloaded, once, into
+that directory instead.
+"""
+import logging
+import os
+import sys
+import threading
+from typing import Dict, List, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# NLTK package id -> resource path inside an nltk_data directory
+REQUIRED_RESOURCES: Dict[str, str] = {
+    'stopwords': 'corpora/stopwords',
+    'punkt': 'tokenizers/punkt',
+    'wordnet': 'corpora/wordnet',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+}
+
+_lock = threading.Lock()
+_status: Optional[Dict[str, bool]] = None
+
+
+def _is_present(data_dir: str, resource: str) -> bool:
+    # The downloader unpacks most packages but some (e.g. wordnet) may stay zipped
+    path = os.path.join(data_dir, *resource.split('/'))
+    return os.path.isdir(path) or os.path.isfile(path + '.zip')
+
+
+def missing_resources(data_dir: Optional[str] = None) -> List[str]:
+    """Package ids from REQUIRED_RESOURCES that are not present in `data_dir`"""
+    data_dir = data_dir or Config.NLTK_DATA_DIR
+    return [pkg for pkg, resource in REQUIRED_RESOURCES.items() if not _is_present(data_dir, resource)]
+
+
+def missing_message(data_dir: str, missing: List[str]) -> str:
+    return (f"NLTK data missing from {data_dir}: {', '.join(missing)}. "
+            f"Run `python nltk_resources.py` at build time (or set NLTK_ALLOW_DOWNLOAD=1).")
+
+
+def _register_data_dir(data_dir: str) -> None:
+    """Make NLTK search `data_dir` first, whether or not it has been imported yet"""
+    paths = os.environ.get('NLTK_DATA', '').split(os.pathsep)
+    if data_dir not in paths:
+        os.environ['NLTK_DATA'] = os.pathsep.join([data_dir] + [p for p in paths if p])
+    nltk = sys.modules.get('nltk')
+    if nltk is not None and data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+
+
+def provision(data_dir: Optional[str] = None, packages: Optional[List[str]] = None) -> List[str]:
+    """Download `packages` (default: all required) into `data_dir`; returns the ids that failed"""
+    import nltk
+
+    data_dir = data_dir or Config.NLTK_DATA_DIR
+    os.makedirs(data_dir, exist_ok=True)
+    failed = []
+    for pkg in packages or list(REQUIRED_RESOURCES):
+        if not nltk.download(pkg, download_dir=data_dir, quiet=True, raise_on_error=False):
+            failed.append(pkg)
+    failed = [pkg for pkg in failed if pkg in missing_resources(data_dir)]
+    if failed:
+        logger.warning(f"Could not download NLTK data: {', '.join(failed)}")
+    return failed
+
+
+def ensure_nltk_data() -> Dict[str, bool]:
+    """Verify the vendored corpora once per process; returns {package: available}"""
+    global _status
+    if _status is not None:
+        return _status
+    with _lock:
+        if _status is None:
+            data_dir = Config.NLTK_DATA_DIR
+            _register_data_dir(data_dir)
+            missing = missing_resources(data_dir)
+            if missing and Config.NLTK_ALLOW_DOWNLOAD:
+                logger.warning(f"NLTK data missing from {data_dir} ({', '.join(missing)}); "
+                               f"downloading once. Run `python nltk_resources.py` at build time instead.")
+                provision(data_dir, missing)
+                missing = missing_resources(data_dir)
+            if missing:
+                logger.error(missing_message(data_dir, missing))
+            _status = {pkg: pkg not in missing for pkg in REQUIRED_RESOURCES}
+    return _status
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    target = Config.NLTK_DATA_DIR
+    if '--check' in sys.argv[1:]:
+        missing = missing_resources(target)
+        print(f"missing in {target}: {', '.join(missing)}" if missing else f"all NLTK data present in {target}")
+        sys.exit(1 if missing else 0)
+    failed = provision(target)
+    print(f"NLTK data in {target}" + (f"; failed: {', '.join(failed)}" if failed else ""))
+    sys.exit(1 if failed else 0)
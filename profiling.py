@@ -0,0 +1,279 @@
+# Opt-in scoring instrumentation for InternHunt
+"""
+Lightweight profiling hooks for the ATS scorer (`utils.AnalyticsUtils`).
+
+Disabled by default. Enable with `PROFILE_SCORING=1` (env) or
+`ScoringProfiler.enable()` at runtime. When disabled, each hook costs a single
+boolean check.
+
+Per stage we record: call count, inclusive wall time (calibrated for timer
+overhead), regex calls made through `scoring_re` (the scorer's stand-in for
+the `re` module; the stdlib module itself is left alone), and input text
+length.
+Results are available as:
+- a structured JSON log line per scoring run (logger `profiling`)
+- `ScoringProfiler.snapshot()` (dict)
+- `ScoringProfiler.render_prometheus()` (Prometheus text exposition format),
+  optionally served over HTTP when `METRICS_PORT` is set.
+"""
+import json
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+_REGEX_FUNCS = ('search', 'match', 'fullmatch', 'findall', 'finditer', 'sub', 'subn', 'split')
+
+
+class _StageStats:
+    __slots__ = ('calls', 'seconds', 'max_seconds', 'regex_calls', 'text_chars')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.regex_calls = 0
+        self.text_chars = 0
+
+
+class _Span:
+    __slots__ = ('name', 'text_chars', 'regex_calls', 'started')
+
+    def __init__(self, name: str, text_chars: int):
+        self.name = name
+        self.text_chars = text_chars
+        self.regex_calls = 0
+        self.started = 0.0
+
+
+class ScoringProfiler:
+    """Process-wide collector for scoring stage timings and counters"""
+
+    enabled: bool = False
+    _lock = threading.Lock()
+    _local = threading.local()
+    _stats: Dict[str, _StageStats] = {}
+    _timer_overhead: float = 0.0
+    _server = None
+    _collectors: List[Callable[[], str]] = []
+
+    @classmethod
+    def enable(cls) -> None:
+        """Turn profiling on (calibrates the timer)"""
+        cls._calibrate()
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """Turn profiling off; collected stats are kept until `reset()`"""
+        cls.enabled = False
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._stats = {}
+
+    @classmethod
+    def _calibrate(cls, rounds: int = 2000) -> None:
+        """Measure the fixed cost of an empty span so it can be subtracted from timings"""
+        perf = time.perf_counter
+        start = perf()
+        for _ in range(rounds):
+            perf()
+            perf()
+        # Each span pays roughly one extra perf_counter() call between its two reads
+        cls._timer_overhead = (perf() - start) / (2 * rounds)
+
+    @classmethod
+    @contextmanager
+    def _span(cls, name: str, text_chars: int):
+        stack: List[_Span] = getattr(cls._local, 'stack', None)
+        if stack is None:
+            stack = cls._local.stack = []
+            cls._local.run = {}
+        sp = _Span(name, text_chars)
+        stack.append(sp)
+        sp.started = time.perf_counter()
+        try:
+            yield sp
+        finally:
+            elapsed = max(0.0, time.perf_counter() - sp.started - cls._timer_overhead)
+            stack.pop()
+            cls._record(sp, elapsed)
+            run = cls._local.run
+            entry = run.setdefault(name, {'ms': 0.0, 'calls': 0, 'regex_calls': 0, 'text_chars': sp.text_chars})
+            entry['ms'] = round(entry['ms'] + elapsed * 1000.0, 3)
+            entry['calls'] += 1
+            entry['regex_calls'] += sp.regex_calls
+            if not stack:
+                cls._local.run = {}
+                logger.info(json.dumps({'event': 'resume_scoring_profile', 'root': name, 'stages': run}))
+
+    @classmethod
+    def _record(cls, sp: _Span, elapsed: float) -> None:
+        with cls._lock:
+            st = cls._stats.get(sp.name)
+            if st is None:
+                st = cls._stats[sp.name] = _StageStats()
+            st.calls += 1
+            st.seconds += elapsed
+            st.max_seconds = max(st.max_seconds, elapsed)
+            st.regex_calls += sp.regex_calls
+            st.text_chars += sp.text_chars
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, Any]]:
+        """Return aggregated per-stage stats"""
+        with cls._lock:
+            return {
+                name: {
+                    'calls': s.calls,
+                    'seconds_total': s.seconds,
+                    'seconds_max': s.max_seconds,
+                    'seconds_avg': s.seconds / s.calls if s.calls else 0.0,
+                    'regex_calls_total': s.regex_calls,
+                    'text_chars_total': s.text_chars,
+                }
+                for name, s in cls._stats.items()
+            }
+
+    @classmethod
+    def render_prometheus(cls) -> str:
+        """Render aggregated stats in Prometheus text exposition format"""
+        snap = cls.snapshot()
+        lines: List[str] = [
+            "# HELP internhunt_scoring_stage_seconds Inclusive wall time spent per scoring stage",
+            "# TYPE internhunt_scoring_stage_seconds summary",
+        ]
+        for stage in sorted(snap):
+            lines.append(f'internhunt_scoring_stage_seconds_sum{{stage="{stage}"}} {snap[stage]["seconds_total"]}')
+            lines.append(f'internhunt_scoring_stage_seconds_count{{stage="{stage}"}} {snap[stage]["calls"]}')
+        metrics = [
+            ('internhunt_scoring_stage_max_seconds', 'gauge', 'Slowest observed call per scoring stage', 'seconds_max'),
+            ('internhunt_scoring_stage_regex_calls_total', 'counter', 'Regex calls made inside each scoring stage', 'regex_calls_total'),
+            ('internhunt_scoring_stage_text_chars_total', 'counter', 'Characters of resume text processed per stage', 'text_chars_total'),
+        ]
+        for metric, kind, help_text, key in metrics:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for stage in sorted(snap):
+                lines.append(f'{metric}{{stage="{stage}"}} {snap[stage][key]}')
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def register_collector(cls, render: Callable[[], str]) -> None:
+        """Append another module's Prometheus text (e.g. http_fetch) to the /metrics output"""
+        if render not in cls._collectors:
+            cls._collectors.append(render)
+
+    @classmethod
+    def start_metrics_server(cls, port: int, host: str = "127.0.0.1") -> None:
+        """Serve `render_prometheus()` on http://host:port/metrics from a daemon thread"""
+        if cls._server is not None:
+            return
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') != '/metrics':
+                    self.send_error(404)
+                    return
+                body = "".join([cls.render_prometheus()] + [render() for render in cls._collectors]).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            cls._server = ThreadingHTTPServer((host, port), _Handler)
+        except OSError as e:
+            # Another worker already owns the port; its endpoint is good enough
+            logger.warning(f"Metrics server not started on {host}:{port}: {e}")
+            return
+        threading.Thread(target=cls._server.serve_forever, name="scoring-metrics", daemon=True).start()
+        logger.info(f"Scoring metrics available at http://{host}:{port}/metrics")
+
+
+def _text_chars(args: tuple) -> int:
+    for a in args:
+        if isinstance(a, str):
+            return len(a)
+        if isinstance(a, dict) and isinstance(a.get('raw_text'), str):
+            return len(a['raw_text'])
+    return 0
+
+
+def profiled(stage: str) -> Callable:
+    """Decorator timing a scoring stage; a plain pass-through while profiling is disabled"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ScoringProfiler.enabled:
+                return func(*args, **kwargs)
+            with ScoringProfiler._span(stage, _text_chars(args)):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _CountingRe:
+    """Stand-in for the `re` module used by the scorer (`from profiling import scoring_re as re`).
+    The matching functions count their calls in the active span; everything else is `re` itself.
+    """
+
+    def __init__(self):
+        local = ScoringProfiler._local
+
+        def counting(fn: Callable) -> Callable:
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                stack = getattr(local, 'stack', None)
+                if stack:
+                    for sp in stack:
+                        sp.regex_calls += 1
+                return fn(*args, **kwargs)
+            return wrapper
+
+        for name in _REGEX_FUNCS:
+            setattr(self, name, counting(getattr(re, name)))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(re, name)
+
+
+scoring_re = _CountingRe()
+
+
+class _NullSpan:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def profile_block(stage: str, text: Optional[str] = None):
+    """Context manager for timing an inline block (e.g. the penalties section)"""
+    if not ScoringProfiler.enabled:
+        return _NULL_SPAN
+    return ScoringProfiler._span(stage, len(text or ""))
+
+
+if Config.PROFILE_SCORING:
+    ScoringProfiler.enable()
+    if Config.METRICS_PORT:
+        ScoringProfiler.start_metrics_server(Config.METRICS_PORT)
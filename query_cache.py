@@ -0,0 +1,198 @@
+# Query-level search result cache for InternHunt
+"""
+Process-wide TTL + LRU cache of job search results with stale-while-revalidate.
+
+Streamlit reruns the whole script on every widget click, so the same Jooble
+and Internshala searches used to be re-sent many times a minute. Results are
+now cached per (source, normalized keywords, location, page):
+
+- fresh (younger than JOB_INDEX_TTL, default 1800 s): returned as is;
+- stale (up to QUERY_CACHE_MAX_STALE, default 24 h): returned immediately and
+  refreshed once in a background thread, so the next search sees new data;
+- missing or older: fetched synchronously.
+
+The memory tier holds QUERY_CACHE_SIZE entries (default 256) and is shared by
+every session in the process. With QUERY_CACHE_DISK=1 (default) the job index
+(job_index.py) is the disk tier: results survive restarts and are shared
+between worker processes, and every listing is recorded there with its
+first/last-seen times. Empty or failed fetches are never cached.
+
+Jooble and the Internshala page scrapers cache per page through
+`search_cache`; other fetchers are wrapped whole with `@indexed(source)`.
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import job_index
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_text(text: str) -> str:
+    return ' '.join((text or '').lower().split())
+
+
+def normalize_keywords(keywords: Union[str, Iterable[str], None]) -> List[str]:
+    """Comma-separated string or list -> lowercased, space-collapsed, de-duplicated keywords (order kept)"""
+    if keywords is None:
+        return []
+    parts = keywords.split(',') if isinstance(keywords, str) else [p for k in keywords if k for p in str(k).split(',')]
+    out: List[str] = []
+    for p in parts:
+        p = _normalize_text(p)
+        if p and p not in out:
+            out.append(p)
+    return out
+
+
+def search_key(source: str, keywords: Union[str, Iterable[str], None], location: str = '', page: int = 1) -> str:
+    """Cache key of one search page"""
+    return json.dumps([source, normalize_keywords(keywords), _normalize_text(location), int(page)],
+                      separators=(',', ':'))
+
+
+def _copy(value: Any) -> Any:
+    # Callers may annotate listings (e.g. fill in descriptions); keep the cached dicts pristine
+    if isinstance(value, list):
+        return [dict(v) if isinstance(v, dict) else v for v in value]
+    return value
+
+
+class QueryCache:
+    """TTL + LRU cache with stale-while-revalidate and an optional job-index disk tier"""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None,
+                 max_stale: Optional[float] = None, disk: Optional[bool] = None):
+        self.max_entries = max_entries or Config.QUERY_CACHE_SIZE
+        self.ttl = Config.JOB_INDEX_TTL if ttl is None else ttl
+        self.max_stale = Config.QUERY_CACHE_MAX_STALE if max_stale is None else max_stale
+        self.disk = Config.QUERY_CACHE_DISK if disk is None else disk
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._refreshing: set = set()
+        self._stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'disk_hits': 0, 'refreshes': 0, 'refresh_errors': 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _remember(self, key: str, value: Any, stored_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, stored_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def lookup(self, key: str) -> Optional[Tuple[Any, float]]:
+        """(value, age in seconds) from memory, then disk; None when not cached"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        memory = (entry[0], time.time() - entry[1]) if entry is not None else None
+        # A stale memory entry may have been refreshed on disk by another worker process
+        if not self.disk or (memory is not None and memory[1] <= self.ttl):
+            return memory
+        try:
+            found = job_index.lookup_query(key)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Job index unavailable ({e}); using the memory cache only")
+            return memory
+        if found is None or not found[0] or (memory is not None and found[1] >= memory[1]):
+            return memory
+        value, age = found
+        self._count('disk_hits')
+        self._remember(key, value, time.time() - age)
+        return value, age
+
+    def put(self, key: str, source: str, value: Any) -> None:
+        """Cache a non-empty result (and record its listings in the job index).
+        A copy is stored, so the caller may keep annotating the value it fetched."""
+        if not value:
+            return
+        self._remember(key, _copy(value), time.time())
+        if self.disk:
+            try:
+                job_index.record_query(key, source, value)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not record {source} results in the job index: {e}")
+
+    def get(self, key: str, source: str, fetch: Callable[[], Any]) -> Optional[Any]:
+        """Cached value for `key` or None. A stale value is returned and `fetch` re-run in the background."""
+        if self.ttl <= 0:
+            return None
+        hit = self.lookup(key)
+        if hit is None:
+            self._count('misses')
+            return None
+        value, age = hit
+        if age <= self.ttl:
+            self._count('hits')
+            return _copy(value)
+        if age <= self.max_stale:
+            self._count('stale_hits')
+            self.refresh_in_background(key, source, fetch)
+            return _copy(value)
+        self._count('misses')
+        return None
+
+    def get_or_fetch(self, key: str, source: str, fetch: Callable[[], Any]) -> Any:
+        """Cached value (fresh or stale-while-revalidate) or the result of `fetch()`, which is then cached"""
+        value = self.get(key, source, fetch)
+        if value is not None:
+            return value
+        value = fetch()
+        self.put(key, source, value)
+        return _copy(value)
+
+    def _refresh(self, key: str, source: str, fetch: Callable[[], Any]) -> None:
+        try:
+            self.put(key, source, fetch())
+            self._count('refreshes')
+        except Exception as e:
+            self._count('refresh_errors')
+            logger.warning(f"Background refresh of {source} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def refresh_in_background(self, key: str, source: str, fetch: Callable[[], Any]) -> bool:
+        """Re-fetch one key in a daemon thread; False if a refresh for it is already running"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+        threading.Thread(target=self._refresh, args=(key, source, fetch),
+                         name=f"query-refresh-{source}", daemon=True).start()
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), refreshing=len(self._refreshing))
+
+
+search_cache = QueryCache()
+
+
+def indexed(source: str) -> Callable:
+    """Decorator for a fetcher returning a list of listings: cache the whole call by its normalized arguments"""
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = job_index.query_key(source, args, kwargs)
+            return search_cache.get_or_fetch(key, source, lambda: fn(*args, **kwargs))
+
+        wrapper.live = fn
+        return wrapper
+    return decorator
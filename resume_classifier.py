@@ -0,0 +1,61 @@
+# Resume category prediction helpers for InternHunt
+"""
+Prediction on top of a fitted text-classification pipeline
+(e.g. TF-IDF + LogisticRegression loaded via model_store).
+
+The pipeline is run once per batch: the probability matrix gives both the
+argmax category and the top-k list, so the TF-IDF transform is not repeated
+as it would be with separate predict() and predict_proba() calls.
+"""
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+Prediction = Tuple[Any, List[Dict[str, Any]]]
+
+
+def prepare_for_inference(model: Any) -> Any:
+    """Store the final estimator's coefficient matrix in Fortran order.
+    Prediction computes X @ coef_.T; with a Fortran-ordered coef_ that transpose is
+    contiguous, so scipy does not copy the (n_classes x n_features) matrix on every call.
+    """
+    steps = getattr(model, 'steps', None)
+    clf = steps[-1][1] if steps else model
+    if hasattr(clf, 'coef_'):
+        clf.coef_ = np.asfortranarray(clf.coef_)
+    return model
+
+
+def _score_matrix(model: Any, texts: Sequence[str]) -> np.ndarray:
+    """Class probabilities for `texts` (rows) in `model.classes_` order"""
+    if hasattr(model, 'predict_proba'):
+        return np.asarray(model.predict_proba(list(texts)))
+    # Margin-only classifiers: softmax over decision scores keeps the ranking
+    scores = np.asarray(model.decision_function(list(texts)), dtype=float)
+    if scores.ndim == 1:
+        scores = np.column_stack([-scores, scores])
+    scores = scores - scores.max(axis=1, keepdims=True)
+    exp = np.exp(scores)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def predict_top_k(model: Any, texts: Sequence[str], k: int = 3) -> List[Prediction]:
+    """Return `(category, [{'category', 'probability'}, ...])` for each text, best first"""
+    if not texts:
+        return []
+    proba = _score_matrix(model, texts)
+    classes = model.classes_
+    k = max(1, min(k, proba.shape[1]))
+    # argpartition finds the top-k per row in O(n_classes); only those k are sorted
+    top = np.argpartition(-proba, k - 1, axis=1)[:, :k]
+    rows = np.arange(proba.shape[0])[:, None]
+    order = np.argsort(-proba[rows, top], axis=1, kind='stable')
+    top = top[rows, order]
+    results: List[Prediction] = []
+    for i in range(proba.shape[0]):
+        top_k = [
+            {"category": classes[idx], "probability": float(proba[i, idx])}
+            for idx in top[i]
+        ]
+        results.append((top_k[0]["category"], top_k))
+    return results
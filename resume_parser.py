@@ -1,36 +1,29 @@
 # Resume parsing module for InternHunt
 import io
 import re
-import spacy
 import streamlit as st
 from pypdf import PdfReader
 from spacy.matcher import PhraseMatcher
 from fuzzywuzzy import process, fuzz
 from typing import List, Dict, Any, Optional
 from config import Config
+from model_registry import registry
 
-@st.cache_resource(show_spinner=False)
 def load_spacy_model():
-    """Load spaCy model with caching"""
+    """Load spaCy model (shared process-wide via model_registry)"""
     try:
-        # Try direct import first (more reliable)
-        import en_core_web_sm
-        return en_core_web_sm.load()
-    except ImportError:
-        # Fall back to spacy.load
-        try:
-            return spacy.load("en_core_web_sm")
-        except OSError as e:
-            st.error("""
-            Error loading spaCy model 'en_core_web_sm'. 
-            Please install it by running: 
-            ```
-            python -m spacy download en_core_web_sm
-            ```
-            and add 'en-core-web-sm @ https://github.com/explosion/spacy-models/releases/download/en_core_web_sm-3.7.1/en_core_web_sm-3.7.1.tar.gz' to your requirements.txt
-            """)
-            st.error(f"Full error: {str(e)}")
-            raise
+        return registry.get('spacy_model')
+    except (ImportError, OSError) as e:
+        st.error("""
+        Error loading spaCy model 'en_core_web_sm'. 
+        Please install it by running: 
+        ```
+        python -m spacy download en_core_web_sm
+        ```
+        and add 'en-core-web-sm @ https://github.com/explosion/spacy-models/releases/download/en_core_web_sm-3.7.1/en_core_web_sm-3.7.1.tar.gz' to your requirements.txt
+        """)
+        st.error(f"Full error: {str(e)}")
+        raise
 
 class ResumeParser:
     """Enhanced resume parser using spaCy and rule-based extraction"""
@@ -0,0 +1,248 @@
+# Declarative site scraping engine for InternHunt
+"""
+One engine for every scraped job site. Each site is a SiteAdapter that only
+declares what is specific to it:
+
+- `url(params, page)`: the URL of one result page for the search params
+  (`keywords`, `location`);
+- `card`: CSS selector of one listing on a page;
+- `fields`: {name: Field(selectors...)} read from each card through
+  html_cards (lxml + compiled XPath). A field named `href` is also resolved
+  against the page URL into the card's `url`;
+- `match`: card fields searched for the user's skills (empty = no filter);
+- `build(card, params)`: the normalized job dict (see job_scrapers.py);
+- `max_pages`: cap for sites that are not paginated.
+
+Every adapter gets the same plumbing: pages go through the pooled http_fetch
+client (per-host rate limits included), the pages of one search are fetched
+concurrently, parsed cards are cached per page in query_cache (memory + job
+index, stale-while-revalidate), expired pages are revalidated with conditional
+GETs (a 304 reuses the cached cards without downloading or parsing the page
+again), and per-site counters are kept in `stats()` and `render_prometheus()`
+(served on METRICS_PORT with the other metrics).
+Failed pages are reported to job_sources with note(), so a scraper running
+under run_sources gets an accurate status.
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urljoin
+
+import html_cards
+import http_fetch
+from config import Config
+from job_sources import note, note_exception
+from query_cache import search_cache, search_key
+
+logger = logging.getLogger(__name__)
+
+_stats: Dict[str, Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+_COUNTERS = ('pages_fetched', 'page_cache_hits', 'not_modified', 'fetch_errors', 'parse_errors', 'cards',
+             'parse_seconds')
+
+
+def matches(text: str, keywords: Sequence[str]) -> bool:
+    """True when any keyword occurs in the text (case-insensitive); always True without keywords"""
+    if not keywords:
+        return True
+    t = (text or "").lower()
+    return any(kw.lower() in t for kw in keywords)
+
+
+class Field:
+    """How to read one value from a card.
+    Selectors are tried in priority order; the first element found is used (with `skip_empty`,
+    the first one with text). No selectors reads the card itself; `many` returns the values of
+    every element matching the first selector; `attr` reads an attribute instead of text.
+    Missing or empty values become `default`; `transform` runs on the value before that check.
+    """
+
+    __slots__ = ('selectors', 'attr', 'sep', 'many', 'skip_empty', 'default', 'transform')
+
+    def __init__(self, *selectors: str, attr: Optional[str] = None, sep: str = '', many: bool = False,
+                 skip_empty: bool = False, default: Any = None, transform: Optional[Callable[[Any], Any]] = None):
+        self.selectors = selectors
+        self.attr = attr
+        self.sep = sep
+        self.many = many
+        self.skip_empty = skip_empty
+        self.default = default
+        self.transform = transform
+
+    def _value(self, el) -> Optional[str]:
+        return html_cards.attr(el, self.attr) if self.attr else html_cards.text(el, self.sep)
+
+    def extract(self, card) -> Any:
+        if not self.selectors:
+            value = self._value(card)
+        elif self.many:
+            value = [self._value(el) for el in html_cards.select(card, self.selectors[0])]
+        elif self.skip_empty and not self.attr:
+            value = html_cards.first_text(card, self.selectors, self.sep)
+        else:
+            el = html_cards.select_first(card, self.selectors)
+            value = self._value(el) if el is not None else None
+        if self.transform is not None:
+            value = self.transform(value)
+        return value if value not in (None, '', []) else self.default
+
+
+class SiteAdapter:
+    """Declarative description of one scraped listing site (see the module docstring)"""
+
+    __slots__ = ('name', 'url', 'card', 'fields', 'build', 'match', 'required', 'max_pages', 'headers')
+
+    def __init__(self, name: str, url: Callable[[Dict[str, Any], int], str], card: str, fields: Dict[str, Field],
+                 build: Callable[[Dict[str, Any], Dict[str, Any]], Dict], match: Sequence[str] = (),
+                 required: Sequence[str] = (), max_pages: Optional[int] = None,
+                 headers: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.url = url
+        self.card = card
+        self.fields = fields
+        self.build = build
+        self.match = tuple(match)
+        self.required = tuple(required)
+        self.max_pages = max_pages
+        self.headers = headers
+
+    def __repr__(self) -> str:
+        return f"<SiteAdapter {self.name}>"
+
+
+def _count(site: str, **increments: float) -> None:
+    with _stats_lock:
+        row = _stats.setdefault(site, dict.fromkeys(_COUNTERS, 0))
+        for key, value in increments.items():
+            row[key] += value
+
+
+def extract(adapter: SiteAdapter, page_html: str, page_url: str = '') -> List[Dict[str, Any]]:
+    """Field dicts of every card on a page (cards missing a required field are dropped)"""
+    cards: List[Dict[str, Any]] = []
+    for el in html_cards.select(html_cards.parse_html(page_html), adapter.card):
+        card = {name: field.extract(el) for name, field in adapter.fields.items()}
+        if any(not card.get(name) for name in adapter.required):
+            continue
+        if card.get('href'):
+            card['url'] = urljoin(page_url, card['href'])
+        cards.append(card)
+    return cards
+
+
+def _parse(adapter: SiteAdapter, url: str, key: str, r: http_fetch.FetchResponse) -> List[Dict[str, Any]]:
+    if r.status_code == 304:
+        # Unchanged since the last fetch: reuse its parsed cards, whatever their age
+        hit = search_cache.lookup(key)
+        if hit is not None:
+            _count(adapter.name, not_modified=1)
+            return hit[0]
+        # Cards evicted; parse the body http_fetch kept for this URL
+    elif r.status_code != 200:
+        note('http_error', f"HTTP {r.status_code} from {url}")
+        _count(adapter.name, fetch_errors=1)
+        return []
+    started = time.perf_counter()
+    try:
+        cards = extract(adapter, r.text, url)
+    except Exception:
+        _count(adapter.name, parse_errors=1)
+        raise
+    _count(adapter.name, pages_fetched=1, cards=len(cards), parse_seconds=time.perf_counter() - started)
+    return cards
+
+
+def fetch_page(adapter: SiteAdapter, url: str, key: str) -> List[Dict[str, Any]]:
+    """Fetch (conditionally) and parse one page (blocking)"""
+    return _parse(adapter, url, key, http_fetch.get(url, headers=adapter.headers, conditional=True))
+
+
+def fetch_pages(adapter: SiteAdapter, params: Dict[str, Any], pages: Iterable[int]) -> List[List[Dict[str, Any]]]:
+    """Parsed cards of each page, in page order. Cached pages are served from search_cache;
+    the others are fetched concurrently. A failed page contributes no cards.
+    """
+    pages = list(pages)
+    urls = {p: adapter.url(params, p) for p in pages}
+    keys = {p: search_key(adapter.name, params.get('keywords', ''), params.get('location', ''), p) for p in pages}
+    found: Dict[int, List[Dict[str, Any]]] = {}
+    for p in pages:
+        cached = search_cache.get(keys[p], adapter.name, lambda url=urls[p], key=keys[p]: fetch_page(adapter, url, key))
+        if cached is not None:
+            found[p] = cached
+            _count(adapter.name, page_cache_hits=1)
+
+    missing = [p for p in pages if p not in found]
+    if missing:
+        responses = http_fetch.fetch_many([{'url': urls[p], 'headers': adapter.headers, 'conditional': True}
+                                           for p in missing])
+        for p, r in zip(missing, responses):
+            found[p] = []
+            if isinstance(r, Exception):
+                note_exception(r)
+                _count(adapter.name, fetch_errors=1)
+                continue
+            try:
+                found[p] = _parse(adapter, urls[p], keys[p], r)
+            except Exception as e:
+                note_exception(e)
+                continue
+            search_cache.put(keys[p], adapter.name, found[p])
+    return [found[p] for p in pages]
+
+
+def _match_text(card: Dict[str, Any], names: Sequence[str]) -> str:
+    parts = []
+    for name in names:
+        value = card.get(name)
+        parts.append(' '.join(value) if isinstance(value, list) else str(value or ''))
+    return ' '.join(parts)
+
+
+def scrape(adapter: SiteAdapter, params: Optional[Dict[str, Any]] = None, skills: Sequence[str] = (),
+           max_pages: int = 1) -> List[Dict]:
+    """Jobs from result pages 1..max_pages of a site, filtered by `skills` on the adapter's match fields"""
+    params = params or {}
+    if adapter.max_pages is not None:
+        max_pages = min(max_pages, adapter.max_pages)
+    jobs: List[Dict] = []
+    for cards in fetch_pages(adapter, params, range(1, max(1, max_pages) + 1)):
+        for card in cards:
+            if adapter.match and not matches(_match_text(card, adapter.match), skills):
+                continue
+            jobs.append(adapter.build(card, params))
+    return jobs
+
+
+def stats() -> Dict[str, Dict[str, float]]:
+    """Per-site page, cache and parse counters"""
+    with _stats_lock:
+        return {site: {k: (round(v, 4) if k == 'parse_seconds' else v) for k, v in row.items()}
+                for site, row in _stats.items()}
+
+
+def render_prometheus() -> str:
+    """Per-site scraper metrics in Prometheus text exposition format"""
+    snap = stats()
+    metrics = [
+        ('internhunt_scraper_pages_fetched_total', 'counter', 'Result pages fetched and parsed per site', 'pages_fetched'),
+        ('internhunt_scraper_page_cache_hits_total', 'counter', 'Result pages served from the search cache per site', 'page_cache_hits'),
+        ('internhunt_scraper_not_modified_total', 'counter', 'Result pages revalidated with a 304 (cards reused) per site', 'not_modified'),
+        ('internhunt_scraper_fetch_errors_total', 'counter', 'Result pages that failed to load per site', 'fetch_errors'),
+        ('internhunt_scraper_parse_errors_total', 'counter', 'Result pages that failed to parse per site', 'parse_errors'),
+        ('internhunt_scraper_cards_total', 'counter', 'Listing cards parsed per site', 'cards'),
+        ('internhunt_scraper_parse_seconds_total', 'counter', 'Time spent parsing result pages per site', 'parse_seconds'),
+    ]
+    lines: List[str] = []
+    for metric, kind, help_text, key in metrics:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for site in sorted(snap):
+            lines.append(f'{metric}{{site="{site}"}} {snap[site][key]}')
+    return "\n".join(lines) + "\n"
+
+
+if Config.METRICS_PORT:
+    from profiling import ScoringProfiler
+    ScoringProfiler.register_collector(render_prometheus)
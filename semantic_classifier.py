@@ -0,0 +1,172 @@
+# Semantic resume category prediction for InternHunt
+"""
+Optional category predictor based on sentence embeddings.
+
+The resume is embedded once with a small sentence-transformers model (loaded
+lazily, on CPU) and compared by cosine similarity against per-category
+centroid vectors precomputed from UpdatedResumeDataSet.csv. The centroids are
+a small float32 matrix (n_categories x dim) stored in
+`models/category_centroids.npz`.
+
+Resume embeddings are cached by text hash so later stages (job matching) can
+reuse them without re-encoding.
+
+Build the centroids once (requires sentence-transformers / torch):
+    python semantic_classifier.py build
+"""
+import hashlib
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import Config
+from model_store import BASE_DIR, MODEL_DIR
+
+logger = logging.getLogger(__name__)
+
+CSV_PATH = os.path.join(BASE_DIR, 'UpdatedResumeDataSet.csv')
+CENTROIDS_PATH = os.path.join(MODEL_DIR, 'category_centroids.npz')
+MAX_CHARS = 5000          # the encoder truncates to its max sequence length anyway
+SOFTMAX_TEMPERATURE = 0.05
+EMBEDDING_CACHE_SIZE = 256
+
+_model = None
+_model_lock = threading.Lock()
+_centroids: Optional[Tuple[np.ndarray, np.ndarray]] = None
+# Set when the centroids do not fit the configured encoder; the predictor then stays off
+_disabled_reason: Optional[str] = None
+_embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def encoder_available() -> bool:
+    """True if sentence-transformers is installed (needed for any embedding)"""
+    try:
+        import sentence_transformers  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def is_available() -> bool:
+    """True if sentence-transformers is installed and the centroids have been built for EMBEDDING_MODEL"""
+    return _disabled_reason is None and os.path.exists(CENTROIDS_PATH) and encoder_available()
+
+
+def _disable(reason: str) -> None:
+    global _disabled_reason
+    if _disabled_reason is None:
+        logger.warning(f"Semantic classifier disabled: {reason} (rebuild with `python semantic_classifier.py build`)")
+    _disabled_reason = reason
+
+
+def get_embedding_model():
+    """Load the sentence-transformers encoder on first use (CPU only)"""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from sentence_transformers import SentenceTransformer
+                _model = SentenceTransformer(Config.EMBEDDING_MODEL, device='cpu')
+                logger.info(f"Loaded embedding model {Config.EMBEDDING_MODEL}")
+    return _model
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256((text or '').encode('utf-8', 'ignore')).hexdigest()
+
+
+def embed_texts(texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """L2-normalized float32 embeddings, one row per text"""
+    model = get_embedding_model()
+    vecs = model.encode([(t or '')[:MAX_CHARS] for t in texts], batch_size=batch_size,
+                        normalize_embeddings=True, convert_to_numpy=True, show_progress_bar=False)
+    return np.asarray(vecs, dtype=np.float32)
+
+
+def get_resume_embedding(text: str) -> np.ndarray:
+    """Embedding of a resume, cached by text hash (LRU, process-wide)"""
+    key = _text_key(text)
+    with _cache_lock:
+        vec = _embedding_cache.get(key)
+        if vec is not None:
+            _embedding_cache.move_to_end(key)
+            return vec
+    vec = embed_texts([text])[0]
+    with _cache_lock:
+        _embedding_cache[key] = vec
+        while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+    return vec
+
+
+def load_centroids(path: str = CENTROIDS_PATH) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (categories, centroids); raises FileNotFoundError if not built and
+    ValueError (disabling the predictor) if they were built with another EMBEDDING_MODEL
+    """
+    global _centroids
+    if _centroids is None:
+        with np.load(path, allow_pickle=False) as data:
+            model = str(data['model']) if 'model' in data.files else None
+            if model is not None and model != Config.EMBEDDING_MODEL:
+                reason = f"centroids were built with {model}, EMBEDDING_MODEL is {Config.EMBEDDING_MODEL}"
+                _disable(reason)
+                raise ValueError(reason)
+            _centroids = (data['categories'], data['centroids'].astype(np.float32, copy=False))
+    return _centroids
+
+
+def predict_semantic_top_k(resume_text: str, k: int = 3) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """Return (category, top-k list) with the same shape as predict_resume_category.
+    `probability` is a softmax over cosine similarities; `similarity` is the raw cosine.
+    """
+    if not (resume_text or '').strip() or _disabled_reason is not None:
+        return None, []
+    try:
+        categories, centroids = load_centroids()
+    except ValueError:
+        return None, []
+    vec = get_resume_embedding(resume_text)
+    if vec.shape[0] != centroids.shape[1]:
+        _disable(f"centroids are {centroids.shape[1]}-d, {Config.EMBEDDING_MODEL} embeddings are {vec.shape[0]}-d")
+        return None, []
+    sims = centroids @ vec
+    logits = (sims - sims.max()) / SOFTMAX_TEMPERATURE
+    probs = np.exp(logits)
+    probs /= probs.sum()
+    top = np.argsort(-sims)[:k]
+    top_k = [
+        {"category": str(categories[i]), "probability": float(probs[i]), "similarity": float(sims[i])}
+        for i in top
+    ]
+    return top_k[0]["category"], top_k
+
+
+def build_centroids(csv_path: str = CSV_PATH, out_path: str = CENTROIDS_PATH, batch_size: int = 32) -> str:
+    """Embed every resume in the dataset and store the normalized mean vector per category"""
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, usecols=['Category', 'Resume']).dropna()
+    embeddings = embed_texts(df['Resume'].astype(str).tolist(), batch_size=batch_size)
+    labels = df['Category'].astype(str).to_numpy()
+    categories = np.array(sorted(set(labels)))
+    centroids = np.vstack([embeddings[labels == c].mean(axis=0) for c in categories])
+    centroids /= np.linalg.norm(centroids, axis=1, keepdims=True)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    np.savez(out_path, categories=categories, centroids=centroids.astype(np.float32),
+             model=np.array(Config.EMBEDDING_MODEL))
+    logger.info(f"Wrote {len(categories)} category centroids ({centroids.shape[1]}-d) to {out_path}")
+    return out_path
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    if len(sys.argv) >= 2 and sys.argv[1] == 'build':
+        print(build_centroids())
+    else:
+        print("Usage: python semantic_classifier.py build")
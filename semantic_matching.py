@@ -0,0 +1,176 @@
+# Embedding-based job matching for InternHunt
+"""
+Ranks job listings by semantic similarity to the resume, so "ML intern"
+matches a resume that says "machine learning" even with no shared keyword.
+
+- The resume is embedded once (semantic_classifier.get_resume_embedding,
+  LRU-cached by text hash).
+- Each job is embedded once and cached on disk, keyed by a hash of its
+  normalized URL (or of its text when it has no URL). The job text hash is
+  stored alongside, so an edited listing is re-embedded.
+- A batch is scored with one matrix-vector product (rows are L2-normalized,
+  so the product is the cosine similarity) and blended with the BM25
+  keyword score from job_ranker:
+
+      score = (1 - w) * bm25 / max(bm25) + w * max(cosine, 0)
+
+  with w = SEMANTIC_MATCH_WEIGHT (default 0.5).
+
+Enable with ENABLE_SEMANTIC_JOB_MATCHING=1 (requires sentence-transformers).
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+import semantic_classifier
+from config import Config
+from job_index import normalize_url
+from job_ranker import BM25JobIndex, build_query, field_text
+from model_store import MMAP_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = os.path.join(MMAP_CACHE_DIR, 'job_embeddings.sqlite3')
+MEMORY_CACHE_SIZE = 2048
+JOB_TEXT_CHARS = 2000
+
+_memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_memory_lock = threading.Lock()
+_db_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return Config.ENABLE_SEMANTIC_JOB_MATCHING and semantic_classifier.encoder_available()
+
+
+def job_text(job: Dict[str, Any]) -> str:
+    """Text embedded for a job: title, tags, company and description"""
+    fields = [field_text(job, f) for f in ('title', 'tags', 'company', 'description')]
+    return ' . '.join(f for f in fields if f)[:JOB_TEXT_CHARS]
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8', 'ignore')).hexdigest()
+
+
+def job_key(job: Dict[str, Any]) -> str:
+    url = job.get('url') or job.get('link') or ''
+    if url and url != '#':
+        return 'url:' + _sha256(normalize_url(url))
+    return 'text:' + _sha256(job_text(job))
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS job_embeddings ("
+        " key TEXT NOT NULL, model TEXT NOT NULL, text_hash TEXT NOT NULL,"
+        " vector BLOB NOT NULL, created_at REAL NOT NULL, PRIMARY KEY (key, model))"
+    )
+    return conn
+
+
+def _load_cached(keys: Sequence[str], text_hashes: Sequence[str], path: str) -> Dict[str, np.ndarray]:
+    found: Dict[str, np.ndarray] = {}
+    with _memory_lock:
+        for key, th in zip(keys, text_hashes):
+            vec = _memory.get(key + th)
+            if vec is not None:
+                _memory.move_to_end(key + th)
+                found[key] = vec
+    missing = [(k, th) for k, th in zip(keys, text_hashes) if k not in found]
+    if not missing or not os.path.exists(path):
+        return found
+    wanted = dict(missing)
+    try:
+        with _db_lock, closing(_connect(path)) as conn:
+            for i in range(0, len(missing), 500):
+                chunk = [k for k, _ in missing[i:i + 500]]
+                rows = conn.execute(
+                    f"SELECT key, text_hash, vector FROM job_embeddings WHERE model = ? AND key IN ({','.join('?' * len(chunk))})",
+                    [Config.EMBEDDING_MODEL] + chunk,
+                ).fetchall()
+                for key, th, blob in rows:
+                    if wanted.get(key) == th:
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+    except sqlite3.Error as e:
+        logger.warning(f"Job embedding cache unavailable ({e}); re-embedding")
+    _remember([(k, wanted[k], found[k]) for k in wanted if k in found])
+    return found
+
+
+def _remember(entries: List[tuple]) -> None:
+    with _memory_lock:
+        for key, th, vec in entries:
+            _memory[key + th] = vec
+        while len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+
+
+def _store(entries: List[tuple], path: str) -> None:
+    _remember(entries)
+    try:
+        now = time.time()
+        with _db_lock, closing(_connect(path)) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO job_embeddings (key, model, text_hash, vector, created_at) VALUES (?, ?, ?, ?, ?)",
+                [(key, Config.EMBEDDING_MODEL, th, vec.astype(np.float32).tobytes(), now) for key, th, vec in entries],
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"Could not persist job embeddings: {e}")
+
+
+def embed_jobs(jobs: Sequence[Dict[str, Any]], path: str = CACHE_PATH) -> np.ndarray:
+    """(n_jobs x dim) float32 matrix of L2-normalized job embeddings; only cache misses are encoded"""
+    if not jobs:
+        return np.zeros((0, 0), dtype=np.float32)
+    texts = [job_text(j) for j in jobs]
+    keys = [job_key(j) for j in jobs]
+    text_hashes = [_sha256(t) for t in texts]
+    cached = _load_cached(keys, text_hashes, path)
+
+    todo = {}
+    for i, key in enumerate(keys):
+        if key not in cached and key not in todo:
+            todo[key] = i
+    if todo:
+        vecs = semantic_classifier.embed_texts([texts[i] for i in todo.values()])
+        new_entries = []
+        for (key, i), vec in zip(todo.items(), vecs):
+            cached[key] = vec
+            new_entries.append((key, text_hashes[i], vec))
+        _store(new_entries, path)
+        logger.info(f"Embedded {len(todo)} of {len(jobs)} jobs ({len(jobs) - len(todo)} cached)")
+    return np.vstack([cached[k] for k in keys]).astype(np.float32, copy=False)
+
+
+def semantic_scores(resume_text: str, jobs: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """Cosine similarity of each job to the resume (one matrix-vector product)"""
+    if not jobs:
+        return np.zeros(0, dtype=np.float32)
+    return embed_jobs(jobs) @ semantic_classifier.get_resume_embedding(resume_text)
+
+
+def rank_jobs_semantic(jobs: Sequence[Dict[str, Any]], resume_text: str, skills: Iterable[str] = (),
+                       predicted_category: Optional[str] = None, weight: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Jobs ordered by a blend of BM25 keyword score and embedding similarity to the resume"""
+    if not jobs:
+        return list(jobs or [])
+    weight = Config.SEMANTIC_MATCH_WEIGHT if weight is None else weight
+    query = build_query(skills, predicted_category)
+    keyword = np.asarray(BM25JobIndex(jobs).scores(query) if query else [0.0] * len(jobs), dtype=np.float32)
+    if keyword.max() > 0:
+        keyword /= keyword.max()
+    semantic = np.clip(semantic_scores(resume_text, jobs), 0.0, 1.0)
+    blended = (1.0 - weight) * keyword + weight * semantic
+    order = np.argsort(-blended, kind='stable')
+    return [jobs[i] for i in order]
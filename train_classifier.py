@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Reproducible training entry point for the resume classifier.
+
+Scripted replacement for ResumeClassification_Model.ipynb: same cleaning,
+class filtering and TF-IDF + LogisticRegression pipeline, plus timing and a
+versioned artifact that the app can pick up automatically.
+
+Usage:
+    python train_classifier.py [--csv UpdatedResumeDataSet.csv] [--n-jobs -1] [--cv 5]
+
+Variants:
+  tfidf_logreg  TF-IDF (5000 terms) + LogisticRegression, fitted in memory (default)
+  hashing_sgd   stateless HashingVectorizer + SGDClassifier(modified_huber), trained
+                out-of-core with partial_fit over CSV chunks; no vocabulary to
+                pickle or look up, memory bounded by --chunksize/--buffer-size
+
+Writes models/resume_classifier-<variant>-<timestamp>.joblib (uncompressed,
+memory-mappable) and a .json sidecar with: sklearn version, training time,
+inference latency, hold-out accuracy, CV accuracy and dataset fingerprint.
+`model_store.resolve_model_path()` then selects the newest artifact trained
+on a compatible scikit-learn version.
+"""
+import argparse
+import datetime
+import hashlib
+import logging
+import os
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import cross_val_score, train_test_split
+from sklearn.pipeline import Pipeline
+
+from model_store import BASE_DIR, MODEL_DIR, save_artifact, write_metadata
+from resume_classifier import predict_top_k, prepare_for_inference
+
+logger = logging.getLogger(__name__)
+
+CSV_PATH = os.path.join(BASE_DIR, 'UpdatedResumeDataSet.csv')
+TEXT_COL = 'Resume'
+LABEL_COL = 'Category'
+MIN_SAMPLES_PER_CLASS = 4
+RANDOM_STATE = 42
+HASHING_FEATURES = 2 ** 16
+
+_HTML_RE = re.compile(r"<[^>]+>")
+_URL_RE = re.compile(r"http\S+|www\.\S+")
+_WS_RE = re.compile(r"\s+")
+
+
+def clean(t) -> str:
+    """Strip HTML tags, URLs and extra whitespace (keeps case and punctuation)"""
+    t = _HTML_RE.sub(" ", str(t))
+    t = _URL_RE.sub(" ", t)
+    return _WS_RE.sub(" ", t).strip()
+
+
+def iter_dataset(csv_path: str, chunksize: int = 200):
+    """Yield cleaned (text, label) pairs, reading the CSV in chunks"""
+    for chunk in pd.read_csv(csv_path, usecols=[TEXT_COL, LABEL_COL], chunksize=chunksize):
+        chunk = chunk.dropna()
+        for text, label in zip(chunk[TEXT_COL], chunk[LABEL_COL]):
+            yield clean(text), str(label)
+
+
+def load_dataset(csv_path: str, chunksize: int = 200, min_samples: int = MIN_SAMPLES_PER_CLASS) -> Tuple[List[str], List[str]]:
+    """Stream the CSV into memory and drop classes with fewer than `min_samples` rows"""
+    texts: List[str] = []
+    labels: List[str] = []
+    for text, label in iter_dataset(csv_path, chunksize):
+        texts.append(text)
+        labels.append(label)
+    counts = pd.Series(labels).value_counts()
+    keep = set(counts[counts >= min_samples].index)
+    dropped = set(counts.index) - keep
+    if dropped:
+        logger.info(f"Dropping classes with < {min_samples} samples: {sorted(dropped)}")
+    pairs = [(t, y) for t, y in zip(texts, labels) if y in keep]
+    return [t for t, _ in pairs], [y for _, y in pairs]
+
+
+def dataset_fingerprint(csv_path: str) -> str:
+    h = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def build_tfidf_pipeline(n_jobs: Optional[int] = None) -> Pipeline:
+    """TF-IDF + LogisticRegression, as configured in the notebook"""
+    return Pipeline([
+        ('tfidf', TfidfVectorizer(
+            max_features=5000,
+            ngram_range=(1, 2),
+            min_df=2,
+            max_df=0.95,
+            stop_words='english',
+            lowercase=True,
+        )),
+        ('classifier', LogisticRegression(
+            max_iter=1000,
+            class_weight='balanced',
+            random_state=RANDOM_STATE,
+            C=1.0,
+            n_jobs=n_jobs,
+        )),
+    ])
+
+
+def build_hashing_pipeline(n_jobs: Optional[int] = None, n_features: int = HASHING_FEATURES) -> Pipeline:
+    """Stateless hashing features + linear classifier that supports partial_fit"""
+    return Pipeline([
+        ('hashing', HashingVectorizer(
+            n_features=n_features,
+            ngram_range=(1, 2),
+            stop_words='english',
+            lowercase=True,
+            alternate_sign=False,
+            norm='l2',
+        )),
+        ('classifier', SGDClassifier(
+            loss='modified_huber',  # supports predict_proba; more accurate than log_loss here
+            alpha=1e-5,
+            random_state=RANDOM_STATE,
+            n_jobs=n_jobs,
+        )),
+    ])
+
+
+VARIANTS = {
+    'tfidf_logreg': build_tfidf_pipeline,
+    'hashing_sgd': build_hashing_pipeline,
+}
+
+
+def measure_latency(model, texts: List[str], rounds: int = 50) -> Dict[str, float]:
+    """Median single-resume latency and per-resume cost of one batch, in milliseconds"""
+    sample = texts[:rounds] or ['']
+    single = []
+    for t in sample:
+        start = time.perf_counter()
+        predict_top_k(model, [t])
+        single.append((time.perf_counter() - start) * 1000.0)
+    start = time.perf_counter()
+    predict_top_k(model, sample)
+    batch_ms = (time.perf_counter() - start) * 1000.0 / len(sample)
+    return {
+        'inference_ms_p50': float(np.median(single)),
+        'inference_ms_p95': float(np.percentile(single, 95)),
+        'inference_ms_batched': batch_ms,
+    }
+
+
+def _is_holdout(row_index: int, test_size: float) -> bool:
+    """Deterministic streaming split: every k-th row (k = 1/test_size) is held out"""
+    step = max(2, int(round(1.0 / test_size))) if test_size else 0
+    return bool(step) and row_index % step == 0
+
+
+def fit_streaming(csv_path: str, test_size: float = 0.2, chunksize: int = 200, buffer_size: int = 1000,
+                  epochs: int = 15, n_jobs: Optional[int] = None, min_samples: int = MIN_SAMPLES_PER_CLASS):
+    """Train the hashing variant out-of-core.
+    One labels-only pass fixes the class list and balanced sample weights; each
+    epoch then re-reads the CSV in chunks, hashes them, and feeds shuffled
+    minibatches from a bounded buffer to partial_fit. Held-out rows (see
+    `_is_holdout`) are skipped; score them with `evaluate_streaming`.
+    """
+    label_counts = pd.Series(dtype=int)
+    for chunk in pd.read_csv(csv_path, usecols=[LABEL_COL], chunksize=chunksize * 10):
+        label_counts = label_counts.add(chunk[LABEL_COL].dropna().astype(str).value_counts(), fill_value=0)
+    label_counts = label_counts[label_counts >= min_samples]
+    classes = np.array(sorted(label_counts.index))
+    if len(classes) < 2:
+        raise ValueError(f"Not enough classes in {csv_path} after preprocessing")
+    class_weight = {c: float(label_counts.sum() / (len(classes) * label_counts[c])) for c in classes}
+
+    model = build_hashing_pipeline(n_jobs=n_jobs)
+    vectorizer = model.named_steps['hashing']
+    clf = model.named_steps['classifier']
+    rng = np.random.RandomState(RANDOM_STATE)
+
+    def _flush(buf_texts: List[str], buf_labels: List[str]) -> None:
+        order = rng.permutation(len(buf_texts))
+        X = vectorizer.transform([buf_texts[i] for i in order])
+        y = np.array([buf_labels[i] for i in order])
+        w = np.array([class_weight[label] for label in y])
+        for start in range(0, len(y), chunksize):
+            sl = slice(start, start + chunksize)
+            clf.partial_fit(X[sl], y[sl], classes=classes, sample_weight=w[sl])
+
+    for epoch in range(epochs):
+        buf_texts: List[str] = []
+        buf_labels: List[str] = []
+        for row_index, (text, label) in enumerate(iter_dataset(csv_path, chunksize)):
+            if label not in class_weight or _is_holdout(row_index, test_size):
+                continue
+            buf_texts.append(text)
+            buf_labels.append(label)
+            if len(buf_texts) >= buffer_size:
+                _flush(buf_texts, buf_labels)
+                buf_texts, buf_labels = [], []
+        if buf_texts:
+            _flush(buf_texts, buf_labels)
+    return prepare_for_inference(model)
+
+
+def evaluate_streaming(model, csv_path: str, test_size: float = 0.2, chunksize: int = 200,
+                       sample_size: int = 50) -> Tuple[float, int, List[str]]:
+    """Score the hold-out rows of `fit_streaming` chunk by chunk, without keeping them in memory.
+    Returns (accuracy, n_test, first `sample_size` held-out texts for measure_latency).
+    """
+    known = set(model.classes_)
+    correct = total = 0
+    sample: List[str] = []
+    texts: List[str] = []
+    labels: List[str] = []
+
+    def _score() -> int:
+        return int(np.sum(model.predict(texts) == np.array(labels)))
+
+    for row_index, (text, label) in enumerate(iter_dataset(csv_path, chunksize)):
+        if label not in known or not _is_holdout(row_index, test_size):
+            continue
+        texts.append(text)
+        labels.append(label)
+        if len(sample) < sample_size:
+            sample.append(text)
+        if len(texts) >= chunksize:
+            correct += _score()
+            total += len(texts)
+            texts, labels = [], []
+    if texts:
+        correct += _score()
+        total += len(texts)
+    return (correct / total if total else 0.0), total, sample
+
+
+def train(csv_path: str = CSV_PATH, variant: str = 'tfidf_logreg', out_dir: str = MODEL_DIR,
+          n_jobs: int = -1, cv: int = 5, test_size: float = 0.2, chunksize: int = 200,
+          buffer_size: int = 1000, epochs: int = 15) -> Tuple[str, Dict]:
+    """Fit, evaluate and save one model variant. Returns (artifact_path, metadata)"""
+    cv_scores = np.array([])
+    if variant == 'hashing_sgd':
+        start = time.perf_counter()
+        model = fit_streaming(csv_path, test_size, chunksize, buffer_size, epochs, n_jobs)
+        training_seconds = time.perf_counter() - start
+        n_train = None
+        accuracy, n_test, latency_texts = evaluate_streaming(model, csv_path, test_size, chunksize)
+    else:
+        texts, labels = load_dataset(csv_path, chunksize)
+        if len(texts) < 20:
+            raise ValueError(f"Not enough data in {csv_path} after preprocessing ({len(texts)} rows)")
+        logger.info(f"Loaded {len(texts)} resumes across {len(set(labels))} classes")
+
+        try:
+            X_train, X_test, y_train, y_test = train_test_split(
+                texts, labels, test_size=test_size, stratify=labels, random_state=RANDOM_STATE)
+        except ValueError as e:
+            logger.warning(f"Stratified split failed ({e}); using a plain split")
+            X_train, X_test, y_train, y_test = train_test_split(
+                texts, labels, test_size=test_size, random_state=RANDOM_STATE)
+
+        build = VARIANTS[variant]
+        if cv and cv > 1:
+            start = time.perf_counter()
+            cv_scores = cross_val_score(build(), X_train, y_train, cv=cv, scoring='accuracy', n_jobs=n_jobs)
+            logger.info(f"{cv}-fold CV accuracy {cv_scores.mean():.4f} ± {cv_scores.std() * 2:.4f} "
+                        f"({time.perf_counter() - start:.1f}s, n_jobs={n_jobs})")
+
+        model = build(n_jobs=n_jobs)
+        start = time.perf_counter()
+        model.fit(X_train, y_train)
+        training_seconds = time.perf_counter() - start
+        prepare_for_inference(model)
+        n_train = len(X_train)
+        accuracy = accuracy_score(y_test, model.predict(X_test))
+        n_test, latency_texts = len(X_test), list(X_test)
+
+    latency = measure_latency(model, latency_texts)
+    logger.info(f"[{variant}] hold-out accuracy {accuracy:.4f}, fit {training_seconds:.2f}s, "
+                f"p50 latency {latency['inference_ms_p50']:.2f} ms")
+
+    trained_at = datetime.datetime.now(datetime.timezone.utc)
+    version = trained_at.strftime('%Y%m%d-%H%M%S')
+    metadata = {
+        'version': version,
+        'variant': variant,
+        'trained_at': trained_at.isoformat(),
+        'sklearn_version': sklearn.__version__,
+        'training_seconds': round(training_seconds, 3),
+        'accuracy': round(float(accuracy), 4),
+        'cv_folds': int(cv or 0) if cv_scores.size else 0,
+        'cv_accuracy_mean': round(float(cv_scores.mean()), 4) if cv_scores.size else None,
+        'cv_accuracy_std': round(float(cv_scores.std()), 4) if cv_scores.size else None,
+        'n_train': n_train,
+        'n_test': n_test,
+        'classes': [str(c) for c in model.classes_],
+        'dataset': os.path.basename(csv_path),
+        'dataset_sha256': dataset_fingerprint(csv_path),
+        **{k: round(v, 3) for k, v in latency.items()},
+    }
+    path = os.path.join(out_dir, f"resume_classifier-{variant}-{version}.joblib")
+    save_artifact(model, path, metadata)
+    write_metadata(path, metadata)
+    logger.info(f"Saved {path}")
+    return path, metadata
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Train and version the resume classifier")
+    ap.add_argument('--csv', default=CSV_PATH)
+    ap.add_argument('--variant', default='tfidf_logreg', choices=sorted(VARIANTS))
+    ap.add_argument('--out-dir', default=MODEL_DIR)
+    ap.add_argument('--n-jobs', type=int, default=-1, help='parallel jobs for CV / fitting (-1 = all cores)')
+    ap.add_argument('--cv', type=int, default=5, help='cross-validation folds (0 to skip)')
+    ap.add_argument('--test-size', type=float, default=0.2)
+    ap.add_argument('--chunksize', type=int, default=200, help='CSV rows read per chunk')
+    ap.add_argument('--buffer-size', type=int, default=1000, help='hashing_sgd: rows shuffled per partial_fit round')
+    ap.add_argument('--epochs', type=int, default=15, help='hashing_sgd: passes over the CSV')
+    args = ap.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    path, meta = train(args.csv, args.variant, args.out_dir, args.n_jobs, args.cv, args.test_size,
+                       args.chunksize, args.buffer_size, args.epochs)
+    print(f"✅ {path}")
+    for key in ('sklearn_version', 'training_seconds', 'accuracy', 'cv_accuracy_mean', 'inference_ms_p50'):
+        print(f"  {key}: {meta.get(key)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,13 @@
 # Utility functions for InternHunt application
 import base64
+import datetime
 import os
 import streamlit as st
-from typing import Optional, List, Dict, Any
-import pandas as pd
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from lazy_imports import LazyModule
+from profiling import profiled, profile_block
+
+pd = LazyModule('pandas')
 
 class FileUtils:
     """File handling utilities"""
@@ -47,7 +51,7 @@ class DataUtils:
     """Data processing utilities"""
     
     @staticmethod
-    def get_download_link(df: pd.DataFrame, filename: str, text: str) -> str:
+    def get_download_link(df: 'pd.DataFrame', filename: str, text: str) -> str:
         """Generate download link for dataframe"""
         csv = df.to_csv(index=False)
         b64 = base64.b64encode(csv.encode()).decode()
@@ -181,8 +185,15 @@ class AnalyticsUtils:
         'action_verbs': ['developed', 'implemented', 'designed', 'managed', 'led', 'created', 'optimized', 'improved', 'built', 'deployed', 'maintained']
     }
 
+    # Default clock for recency scoring; override (or pass `clock=`) in tests/batch jobs
+    clock: Callable[[], datetime.date] = datetime.date.today
+
+    RECENCY_STRONG = 'Recent experience highlighted'
+    RECENCY_SUGGESTION = 'Add more recent roles (last 3–5 years)'
+
     @staticmethod
-    def calculate_resume_score_breakdown(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    @profiled('score_breakdown')
+    def calculate_resume_score_breakdown(resume_data: Dict[str, Any], clock: Optional[Callable[[], datetime.date]] = None) -> Dict[str, Any]:
         """ATS-style scoring with weights:
         - Content Quality: 50%
         - Formatting: 15%
@@ -190,10 +201,16 @@ class AnalyticsUtils:
         - Experience Recency/Impact: 10%
         - Grammar/Readability: 5%
         Applies refined penalties and caps scanned/image-like PDFs.
+
+        The returned dict carries a `features` block with the raw, time-independent
+        inputs (latest year found, penalties, scanned cap) so that
+        `refresh_time_features` can re-derive recency after a year rollover
+        without re-analyzing the text.
         """
-        import re
+        from profiling import scoring_re as re
         import math
         
+        current_year = (clock or AnalyticsUtils.clock)().year
         raw_text = (resume_data.get('raw_text') or '').strip()
         if not raw_text:
             return {"total": 0, "components": {}, "scores": {}, "suggestions": ["Resume text could not be parsed"], "feedback": "Unable to analyze resume"}
@@ -238,8 +255,9 @@ class AnalyticsUtils:
         strong_areas.extend(kw_raw['strong_areas'])
         weak_areas.extend(kw_raw['weak_areas'])
         
-        # Experience impact/recency
-        exp_raw = AnalyticsUtils._analyze_experience_impact(raw_text)
+        # Experience impact/recency; remember where its recency items go for refresh_time_features
+        recency_at = [len(strong_areas), len(suggestions)]
+        exp_raw = AnalyticsUtils._analyze_experience_impact(raw_text, current_year)
         scores['experience_impact'] = min(10.0, exp_raw['total'])
         components.update({f"exp_{k}": v for k, v in exp_raw['components'].items()})
         suggestions.extend(exp_raw['suggestions'])
@@ -255,21 +273,22 @@ class AnalyticsUtils:
         weak_areas.extend(read_raw['weak_areas'])
         
         # Refined penalties
-        sections = AnalyticsUtils._detect_resume_sections(raw_text)
-        penalties = 0
-        # Student heuristic: if no experience but has education/projects, lessen penalty
-        is_student_like = (not sections.get('experience')) and (sections.get('education') or sections.get('projects')) and bool(re.search(r'\b(student|b\.?tech|bachelor|graduate|undergrad|university)\b', raw_text, re.I))
-        if not sections['experience']:
-            penalties += 10 if is_student_like else 25
-            weak_areas.append('Experience section missing')
-            suggestions.append('Add a Work Experience section with achievements and dates')
-        if not sections['skills']:
-            penalties += 15
-            weak_areas.append('Skills section missing')
-            suggestions.append('Add a dedicated Skills section with technologies and tools')
-        if not sections['summary']:
-            penalties += 5
-            suggestions.append('Add a short Summary/Objective tailored to the target role')
+        with profile_block('penalties', raw_text):
+            sections = AnalyticsUtils._detect_resume_sections(raw_text)
+            penalties = 0
+            # Student heuristic: if no experience but has education/projects, lessen penalty
+            is_student_like = (not sections.get('experience')) and (sections.get('education') or sections.get('projects')) and bool(re.search(r'\b(student|b\.?tech|bachelor|graduate|undergrad|university)\b', raw_text, re.I))
+            if not sections['experience']:
+                penalties += 10 if is_student_like else 25
+                weak_areas.append('Experience section missing')
+                suggestions.append('Add a Work Experience section with achievements and dates')
+            if not sections['skills']:
+                penalties += 15
+                weak_areas.append('Skills section missing')
+                suggestions.append('Add a dedicated Skills section with technologies and tools')
+            if not sections['summary']:
+                penalties += 5
+                suggestions.append('Add a short Summary/Objective tailored to the target role')
         
         total_score = max(0.0, sum(scores.values()) - penalties)
         if scanned_like:
@@ -288,13 +307,77 @@ class AnalyticsUtils:
             "suggestions": suggestions[:10],
             "feedback": feedback,
             "strong_areas": strong_areas[:5],
-            "weak_areas": weak_areas[:5]
+            "weak_areas": weak_areas[:5],
+            "features": {
+                "latest_year": exp_raw['latest_year'],
+                "quantified_impact": exp_raw['components']['quantified_impact'],
+                "time_independent_score": sum(v for k, v in scores.items() if k != 'experience_impact'),
+                "scored_year": current_year,
+                "penalties": penalties,
+                "scanned_like": scanned_like,
+                "strong_areas": [a for a in strong_areas if a != AnalyticsUtils.RECENCY_STRONG],
+                "suggestions": [x for x in suggestions if x != AnalyticsUtils.RECENCY_SUGGESTION],
+                "recency_at": recency_at,
+            }
         }
+
+    @staticmethod
+    def refresh_time_features(breakdown: Dict[str, Any], clock: Optional[Callable[[], datetime.date]] = None) -> Dict[str, Any]:
+        """Re-derive the time-dependent recency score of a cached breakdown.
+        Returns the breakdown unchanged if it was scored in the current year,
+        otherwise a copy with recency, experience impact, total and feedback updated.
+        Breakdowns without a `features` block (older caches) are returned as-is.
+        """
+        features = (breakdown or {}).get('features')
+        if not features:
+            return breakdown
+        current_year = (clock or AnalyticsUtils.clock)().year
+        if features.get('scored_year') == current_year:
+            return breakdown
+
+        recency, is_recent, is_stale = AnalyticsUtils._score_recency(features.get('latest_year'), current_year)
+        experience_impact = min(10.0, recency + features.get('quantified_impact', 0.0))
+        scores = dict(breakdown.get('scores', {}))
+        scores['experience_impact'] = round(experience_impact, 1)
+        total_score = max(0.0, features.get('time_independent_score', 0.0) + experience_impact - features.get('penalties', 0))
+        if features.get('scanned_like'):
+            total_score = min(total_score, 40.0)
+
+        components = dict(breakdown.get('components', {}))
+        components['exp_recency'] = round(recency, 1)
+        if 'recency_at' in features:
+            # Untruncated lists without the recency items, and where scoring inserts them
+            strong_areas = list(features['strong_areas'])
+            suggestions = list(features['suggestions'])
+            strong_at, suggestion_at = features['recency_at']
+        else:
+            # Older caches: only the truncated lists are available
+            strong_areas = [a for a in breakdown.get('strong_areas', []) if a != AnalyticsUtils.RECENCY_STRONG]
+            suggestions = [s for s in breakdown.get('suggestions', []) if s != AnalyticsUtils.RECENCY_SUGGESTION]
+            strong_at, suggestion_at = len(strong_areas), len(suggestions)
+        if is_recent:
+            strong_areas.insert(strong_at, AnalyticsUtils.RECENCY_STRONG)
+        if is_stale:
+            suggestions.insert(suggestion_at, AnalyticsUtils.RECENCY_SUGGESTION)
+        weak_areas = breakdown.get('weak_areas', [])
+
+        refreshed = dict(breakdown)
+        refreshed.update({
+            "total": int(min(round(total_score), 100)),
+            "components": components,
+            "scores": scores,
+            "suggestions": suggestions[:10],
+            "feedback": AnalyticsUtils._generate_ats_feedback(total_score, strong_areas, weak_areas, components),
+            "strong_areas": strong_areas[:5],
+            "features": dict(features, scored_year=current_year),
+        })
+        return refreshed
     
     @staticmethod
+    @profiled('content_quality')
     def _analyze_content_quality(resume_data: Dict[str, Any], raw_text: str) -> Dict[str, Any]:
         """Analyze content quality (60% of total score)"""
-        import re
+        from profiling import scoring_re as re
         
         components = {}
         suggestions = []
@@ -435,7 +518,8 @@ class AnalyticsUtils:
     @staticmethod
     def _role_alignment_score(resume_data: Dict[str, Any], skills: List[str], text_lower: str) -> (float, str):
         """Compute role alignment (0-8). If a target role is provided, score only against that role; otherwise choose best match."""
-        import re, math
+        import math
+        from profiling import scoring_re as re
         clusters = {
             'Software Engineer': ['python','java','c++','git','data structures','algorithms','oop','docker','kubernetes','microservices','aws'],
             'Data Analyst': ['sql','excel','tableau','power bi','pandas','numpy','data analysis','visualization','statistics','matplotlib','seaborn'],
@@ -469,9 +553,10 @@ class AnalyticsUtils:
         return min(8.0, best_pts), best_role
     
     @staticmethod
+    @profiled('formatting')
     def _analyze_formatting_quality(raw_text: str) -> Dict[str, Any]:
         """Analyze formatting quality (20% of total score)"""
-        import re
+        from profiling import scoring_re as re
         
         components = {}
         suggestions = []
@@ -550,32 +635,41 @@ class AnalyticsUtils:
         }
     
     @staticmethod
-    def _analyze_experience_impact(raw_text: str) -> Dict[str, Any]:
+    def _score_recency(latest_year: Optional[int], current_year: int) -> Tuple[float, bool, bool]:
+        """Recency points (max 6) for the latest year found, plus recent/stale flags."""
+        if latest_year is None:
+            return 0.0, False, False
+        diff = current_year - latest_year
+        if diff <= 1:
+            return 6.0, True, False
+        elif diff <= 3:
+            return 4.5, False, False
+        elif diff <= 5:
+            return 3.0, False, False
+        return 1.0, False, True
+
+    @staticmethod
+    @profiled('experience_impact')
+    def _analyze_experience_impact(raw_text: str, current_year: Optional[int] = None) -> Dict[str, Any]:
         """Analyze recency and quantified impact (max 10)."""
-        import re, math
+        import math
+        from profiling import scoring_re as re
         components = {}
         suggestions = []
         strong_areas = []
         weak_areas = []
         total = 0.0
+        if current_year is None:
+            current_year = AnalyticsUtils.clock().year
         # Recency (max 6)
         years = [int(y) for y in re.findall(r"\b(20\d{2})\b", raw_text)]
-        recency = 0.0
-        if years:
-            latest = max(years)
-            current_year = 2025
-            diff = current_year - latest
-            if diff <= 1:
-                recency = 6.0
-                strong_areas.append('Recent experience highlighted')
-            elif diff <= 3:
-                recency = 4.5
-            elif diff <= 5:
-                recency = 3.0
-            else:
-                recency = 1.0
-                suggestions.append('Add more recent roles (last 3–5 years)')
-        else:
+        latest = max(years) if years else None
+        recency, is_recent, is_stale = AnalyticsUtils._score_recency(latest, current_year)
+        if is_recent:
+            strong_areas.append(AnalyticsUtils.RECENCY_STRONG)
+        if is_stale:
+            suggestions.append(AnalyticsUtils.RECENCY_SUGGESTION)
+        if not years:
             suggestions.append('Provide dates for experience entries')
         components['recency'] = recency
         total += recency
@@ -595,13 +689,16 @@ class AnalyticsUtils:
             'components': components,
             'suggestions': suggestions,
             'strong_areas': strong_areas,
-            'weak_areas': weak_areas
+            'weak_areas': weak_areas,
+            'latest_year': latest
         }
     
     @staticmethod
+    @profiled('keyword_relevance')
     def _analyze_keyword_relevance(resume_data: Dict[str, Any], raw_text: str) -> Dict[str, Any]:
         """Analyze keyword relevance (20%) with role alignment and frequency weighting."""
-        import re, math
+        import math
+        from profiling import scoring_re as re
         components = {}
         suggestions = []
         strong_areas = []
@@ -699,9 +796,10 @@ class AnalyticsUtils:
         }
     
     @staticmethod
+    @profiled('section_detection')
     def _detect_resume_sections(raw_text: str) -> Dict[str, bool]:
         """Detect presence of key resume sections with broader coverage."""
-        import re
+        from profiling import scoring_re as re
         t = raw_text.lower()
         sections = {
             'summary': bool(re.search(r'\b(summary|professional summary|profile|objective|about me)\b', t)),
@@ -714,9 +812,10 @@ class AnalyticsUtils:
         return sections
     
     @staticmethod
+    @profiled('experience_quality')
     def _analyze_experience_quality(raw_text: str) -> float:
         """Analyze quality of experience descriptions (within content quality)."""
-        import re
+        from profiling import scoring_re as re
         # Quantified achievements (more weight)
         quantifiers = re.findall(r'\b\d+%|\$\d+[\d,]*|\b\d+[\d,]*\+?\b', raw_text)
         q_score = min(9.0, len(quantifiers) * 0.9)
@@ -727,6 +826,7 @@ class AnalyticsUtils:
         return min(15.0, q_score + a_score)
     
     @staticmethod
+    @profiled('readability')
     def _analyze_readability(raw_text: str) -> Dict[str, Any]:
         """Analyze grammar and readability (max 5). Use textstat or fallback heuristic; optionally grammar check."""
         components = {}
@@ -751,7 +851,8 @@ class AnalyticsUtils:
                 suggestions.append('Shorten sentences and simplify wording for clarity')
         except Exception:
             # Fallback based on average sentence length
-            import re, math
+            import math
+            from profiling import scoring_re as re
             sentences = [s for s in re.split(r'[.!?\n]+', raw_text) if s.strip()]
             words = sum(len(s.split()) for s in sentences) or 1
             asl = words / max(1, len(sentences))
@@ -807,7 +908,7 @@ class AnalyticsUtils:
         badges = []
 
         # Deduplicate improvement items (normalize and collapse near-duplicates)
-        import re
+        from profiling import scoring_re as re
         def _canon(text: str) -> str:
             s = text.lower()
             s = re.sub(r"work\s+experience", "experience", s)
@@ -0,0 +1,265 @@
+# Model and cache warm-up for InternHunt
+"""
+Primes every model and cache before the first user arrives.
+
+`run_warmup()` loads the registered models (spaCy, classifier, ResumeParser
+with its PhraseMatcher, optional embedding model), verifies the NLTK data,
+sets up the Gemini client, then pushes one synthetic resume through the same
+stages as an upload (parse -> classify -> ATS score -> chat context). Each
+component is timed; the process reports ready only when every required
+component succeeded.
+
+Nothing is warmed on import, so models stay lazy for CLIs, tests and
+benchmarks. Entry points:
+  - `HEALTH_PORT=<port>`: App.py serves GET /ready (200 once warm, 503 before,
+    JSON body) and GET /live for load balancer / orchestrator health checks.
+    The first /ready probe starts the warm-up in the background.
+  - `WARMUP_ON_START=1` (off by default): App.py starts it after the first page
+    render of the process, so it does not compete with that render
+  - `python warmup.py` runs it in the foreground and exits non-zero if not ready
+"""
+import json
+import logging
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+SYNTHETIC_RESUME = """Jane Doe
+jane.doe@example.com | +91 98765 43210 | linkedin.com/in/janedoe | github.com/janedoe
+
+Summary
+Computer science student looking for a software engineering internship.
+
+Skills
+Python, Java, SQL, Django, React, Docker, AWS, Git, Machine Learning, Pandas
+
+Experience
+Software Engineering Intern, Example Corp (Jun 2024 - Aug 2024)
+- Built a REST API in Django serving 10,000 requests per day
+- Reduced page load time by 35% by caching database queries
+
+Projects
+Resume Analyzer - Python, scikit-learn, Streamlit
+
+Education
+B.Tech in Computer Science, Example University, 2021 - 2025
+"""
+
+# (name, required) - optional components may fail without blocking readiness
+COMPONENTS: List[Tuple[str, bool]] = [
+    ('nltk_data', True),
+    ('spacy_model', True),
+    ('resume_classifier', True),
+    ('resume_parser', True),
+    ('embedding_model', False),
+    ('gemini_client', False),
+    ('pipeline.parse', True),
+    ('pipeline.classify', True),
+    ('pipeline.ats_score', True),
+    ('pipeline.chat_context', False),
+]
+
+_lock = threading.Lock()
+_report_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_report: Dict[str, Any] = {'status': 'cold', 'ready': False, 'components': {}}
+
+
+def _warm_nltk() -> None:
+    from nltk_resources import ensure_nltk_data, missing_message
+    missing = [pkg for pkg, ok in ensure_nltk_data().items() if not ok]
+    if missing:
+        raise RuntimeError(missing_message(Config.NLTK_DATA_DIR, missing))
+
+
+def _warm_model(name: str) -> Callable[[], Any]:
+    def warm():
+        from model_registry import registry
+        registry.warm_up(name)
+    return warm
+
+
+def _warm_embedding_model() -> Optional[str]:
+    from model_registry import registry
+    if not registry.is_enabled('embedding_model'):
+        return 'skipped (semantic classifier disabled)'
+    registry.warm_up('embedding_model')
+    return None
+
+
+def _warm_gemini() -> Optional[str]:
+    # Client setup only (SDK import + configure); no request is sent
+    import chat_service
+    try:
+        api_key, model = chat_service._get_gemini_config()
+    except ValueError:
+        api_key, model = None, None
+    if not api_key or api_key == "your_gemini_api_key_here":
+        return 'skipped (no API key)'
+    chat_service.genai.configure(api_key=api_key)
+    chat_service.genai.GenerativeModel(model)
+    return None
+
+
+def _pipeline_steps(state: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """The upload path on SYNTHETIC_RESUME, minus PDF extraction"""
+    # Minimal record so later stages still warm up if parsing fails
+    state['resume_data'] = {'raw_text': SYNTHETIC_RESUME, 'skills': [], 'total_experience': 0}
+
+    def parse():
+        from model_registry import registry
+        parser = registry.get('resume_parser')
+        contacts = parser.extract_contact_info(SYNTHETIC_RESUME)
+        state['resume_data'] = {
+            'name': parser.extract_name(SYNTHETIC_RESUME),
+            'email': contacts['emails'][0] if contacts['emails'] else None,
+            'skills': parser.extract_skills(SYNTHETIC_RESUME),
+            'linkedin': contacts['linkedin'],
+            'github': contacts['github'],
+            'raw_text': SYNTHETIC_RESUME,
+            'total_experience': 0,
+        }
+
+    def classify():
+        from model_registry import registry
+        from resume_classifier import predict_top_k
+        category, top_3 = predict_top_k(registry.get('resume_classifier'), [SYNTHETIC_RESUME], k=3)[0]
+        state['resume_data'].update(predicted_category=category, top_3_categories=top_3)
+        if Config.ENABLE_SEMANTIC_CLASSIFIER:
+            import semantic_classifier
+            if semantic_classifier.is_available():
+                semantic_classifier.predict_semantic_top_k(SYNTHETIC_RESUME)
+
+    def ats_score():
+        from utils import AnalyticsUtils
+        AnalyticsUtils.calculate_resume_score_breakdown(state['resume_data'])
+
+    def chat_context():
+        import chat_service
+        chat_service.build_resume_context(state['resume_data'])
+        chat_service.get_suggested_questions(state['resume_data'])
+
+    return {'pipeline.parse': parse, 'pipeline.classify': classify,
+            'pipeline.ats_score': ats_score, 'pipeline.chat_context': chat_context}
+
+
+def run_warmup() -> Dict[str, Any]:
+    """Warm every component in order; returns (and publishes) the readiness report"""
+    state: Dict[str, Any] = {}
+    steps: Dict[str, Callable[[], Any]] = {
+        'nltk_data': _warm_nltk,
+        'spacy_model': _warm_model('spacy_model'),
+        'resume_classifier': _warm_model('resume_classifier'),
+        'resume_parser': _warm_model('resume_parser'),
+        'embedding_model': _warm_embedding_model,
+        'gemini_client': _warm_gemini,
+    }
+    steps.update(_pipeline_steps(state))
+
+    with _report_lock:
+        _report.update(status='warming', ready=False, components={})
+    started = time.perf_counter()
+    for name, required in COMPONENTS:
+        t0 = time.perf_counter()
+        entry: Dict[str, Any] = {'required': required}
+        try:
+            note = steps[name]()
+            entry['ok'] = True
+            if note:
+                entry['note'] = note
+        except Exception as e:
+            entry.update(ok=False, error=f"{type(e).__name__}: {e}")
+            log = logger.error if required else logger.warning
+            log(f"Warm-up of {name} failed: {e}")
+        entry['seconds'] = round(time.perf_counter() - t0, 4)
+        with _report_lock:
+            _report['components'][name] = entry
+
+    with _report_lock:
+        ready = all(c['ok'] for c in _report['components'].values() if c['required'])
+        _report.update(status='ready' if ready else 'degraded', ready=ready,
+                       total_seconds=round(time.perf_counter() - started, 4))
+    logger.info(f"Warm-up {_report['status']} in {_report['total_seconds']:.2f}s: " + ", ".join(
+        f"{n}={c['seconds'] * 1000:.0f}ms{'' if c['ok'] else ' (failed)'}" for n, c in _report['components'].items()))
+    return readiness()
+
+
+def readiness() -> Dict[str, Any]:
+    """Snapshot of the warm-up state: status is cold | warming | ready | degraded"""
+    with _report_lock:
+        return json.loads(json.dumps(_report))
+
+
+def is_ready() -> bool:
+    return bool(_report['ready'])
+
+
+def start_background_warmup() -> bool:
+    """Start run_warmup() in a daemon thread once per process; False if already started"""
+    global _thread
+    with _lock:
+        if _thread is not None:
+            return False
+        _thread = threading.Thread(target=run_warmup, name="model-warmup", daemon=True)
+        _thread.start()
+    if Config.HEALTH_PORT:
+        start_health_server(Config.HEALTH_PORT)
+    return True
+
+
+_server = None
+
+
+def start_health_server(port: int, host: str = "127.0.0.1") -> None:
+    """Serve /ready (200 when warm, else 503) and /live from a daemon thread"""
+    global _server
+    if _server is not None:
+        return
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.rstrip('/')
+            if path == '/live':
+                code, payload = 200, {'status': 'alive'}
+            elif path == '/ready':
+                if _thread is None:
+                    start_background_warmup()
+                payload = readiness()
+                code = 200 if payload['ready'] else 503
+            else:
+                self.send_error(404)
+                return
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    try:
+        _server = ThreadingHTTPServer((host, port), _Handler)
+    except OSError as e:
+        logger.warning(f"Health server not started on {host}:{port}: {e}")
+        return
+    threading.Thread(target=_server.serve_forever, name="health-server", daemon=True).start()
+    logger.info(f"Readiness available at http://{host}:{port}/ready")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    report = run_warmup()
+    for name, c in report['components'].items():
+        status = 'ok' if c['ok'] else 'FAILED'
+        detail = c.get('error') or c.get('note') or ''
+        print(f"{name:<22} {status:<7} {c['seconds'] * 1000:9.1f} ms  {detail}")
+    print(f"{report['status']} in {report['total_seconds']:.2f}s")
+    sys.exit(0 if report['ready'] else 1)